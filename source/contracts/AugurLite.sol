@@ -5,6 +5,7 @@ import 'IAugurLite.sol';
 import 'IUniverse.sol';
 import 'IMarket.sol';
 import 'IMailbox.sol';
+import 'IShareLedger.sol';
 import 'IShareToken.sol';
 import 'libraries/token/ERC20.sol';
 import 'factories/UniverseFactory.sol';
@@ -32,6 +33,10 @@ contract AugurLite is Controlled, IAugurLite {
   event TimestampSet(uint256 newTimestamp);
 
   mapping(address => bool) private universes;
+  // Market of every share token created by a market of a known universe. Written once at market creation so forwarding a share token log is a single lookup
+  mapping(address => IMarket) private shareTokenMarkets;
+  // Market of every share ledger, for markets that keep all their outcomes' balances in one ShareLedger
+  mapping(address => IMarket) private shareLedgerMarkets;
 
   //
   // Universe
@@ -49,6 +54,34 @@ contract AugurLite is Controlled, IAugurLite {
     return universes[_universe];
   }
 
+  //
+  // Share Tokens
+  //
+
+  // Called by the universe when it creates the market, and by a deferred market once it creates its share tokens. Until then a deferred market has none to register
+  function registerShareTokens(IMarket _market) public returns (bool) {
+    IUniverse _universe = _market.getUniverse();
+    require(IUniverse(msg.sender) == _universe || IMarket(msg.sender) == _market, "Sender is not the universe or the market");
+    require(isKnownUniverse(_universe), "The universe is not known");
+    require(_universe.isContainerForMarket(_market), "Market does not belong to the universe");
+    if (_market.getShareToken(0) == address(0)) {
+      return true;
+    }
+    uint256 _numOutcomes = _market.getNumberOfOutcomes();
+    for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+      shareTokenMarkets[_market.getShareToken(_outcome)] = _market;
+    }
+    IShareLedger _shareLedger = _market.getShareLedger();
+    if (_shareLedger != address(0)) {
+      shareLedgerMarkets[_shareLedger] = _market;
+    }
+    return true;
+  }
+
+  function isKnownShareToken(IShareToken _shareToken) public view returns (bool) {
+    return shareTokenMarkets[_shareToken] != address(0);
+  }
+
   //
   // Transfer
   //
@@ -102,27 +135,44 @@ contract AugurLite is Controlled, IAugurLite {
     return true;
   }
 
+  // Registered share tokens run our ShareToken code, so the universe they pass is the one their market belongs to
   function logShareTokensTransferred(IUniverse _universe, address _from, address _to, uint256 _value) public returns (bool) {
-    require(isKnownUniverse(_universe), "The universe is not known");
-    IShareToken _shareToken = IShareToken(msg.sender);
-    require(_universe.isContainerForShareToken(_shareToken), "ShareToken does not belong to the universe");
-    emit TokensTransferred(_universe, msg.sender, _from, _to, _value, TokenType.ShareToken, _shareToken.getMarket());
+    IMarket _market = shareTokenMarkets[msg.sender];
+    require(_market != address(0), "Sender is not a known ShareToken");
+    emit TokensTransferred(_universe, msg.sender, _from, _to, _value, TokenType.ShareToken, _market);
     return true;
   }
 
   function logShareTokenBurned(IUniverse _universe, address _target, uint256 _amount) public returns (bool) {
-    require(isKnownUniverse(_universe), "The universe is not known");
-    IShareToken _shareToken = IShareToken(msg.sender);
-    require(_universe.isContainerForShareToken(_shareToken), "ShareToken does not belong to the universe");
-    emit TokensBurned(_universe, msg.sender, _target, _amount, TokenType.ShareToken, _shareToken.getMarket());
+    IMarket _market = shareTokenMarkets[msg.sender];
+    require(_market != address(0), "Sender is not a known ShareToken");
+    emit TokensBurned(_universe, msg.sender, _target, _amount, TokenType.ShareToken, _market);
     return true;
   }
 
   function logShareTokenMinted(IUniverse _universe, address _target, uint256 _amount) public returns (bool) {
-    require(isKnownUniverse(_universe), "The universe is not known");
-    IShareToken _shareToken = IShareToken(msg.sender);
-    require(_universe.isContainerForShareToken(_shareToken), "ShareToken does not belong to the universe");
-    emit TokensMinted(_universe, msg.sender, _target, _amount, TokenType.ShareToken, _shareToken.getMarket());
+    IMarket _market = shareTokenMarkets[msg.sender];
+    require(_market != address(0), "Sender is not a known ShareToken");
+    emit TokensMinted(_universe, msg.sender, _target, _amount, TokenType.ShareToken, _market);
+    return true;
+  }
+
+  // A ledger mints and burns every outcome at once. The events are the ones each outcome's share token would have sent
+  function logShareLedgerMinted(IUniverse _universe, IShareToken[] _shareTokens, address _target, uint256 _amount) public returns (bool) {
+    IMarket _market = shareLedgerMarkets[msg.sender];
+    require(_market != address(0), "Sender is not a known ShareLedger");
+    for (uint256 _outcome = 0; _outcome < _shareTokens.length; _outcome++) {
+      emit TokensMinted(_universe, _shareTokens[_outcome], _target, _amount, TokenType.ShareToken, _market);
+    }
+    return true;
+  }
+
+  function logShareLedgerBurned(IUniverse _universe, IShareToken[] _shareTokens, address _target, uint256 _amount) public returns (bool) {
+    IMarket _market = shareLedgerMarkets[msg.sender];
+    require(_market != address(0), "Sender is not a known ShareLedger");
+    for (uint256 _outcome = 0; _outcome < _shareTokens.length; _outcome++) {
+      emit TokensBurned(_universe, _shareTokens[_outcome], _target, _amount, TokenType.ShareToken, _market);
+    }
     return true;
   }
 
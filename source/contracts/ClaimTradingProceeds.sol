@@ -15,40 +15,125 @@ import 'libraries/math/SafeMathUint256.sol';
 contract ClaimTradingProceeds is ReentrancyGuard, MarketValidator {
   using SafeMathUint256 for uint256;
 
+  // Everything a batched claim needs to know about a market, read once per market rather than once per share holder
+  struct MarketClaim {
+    IMarket market;
+    IUniverse universe;
+    ERC20 denominationToken;
+    IShareToken[] shareTokens;
+    uint256[] payoutNumerators;
+    uint256 proceeds;
+    uint256 creatorFees;
+  }
+
   function claimTradingProceeds(IMarket _market, address _shareHolder) marketIsLegit(_market) onlyInGoodTimes nonReentrant external returns(bool) {
     // NOTE: this requirement does _not_ enforce market finalization. That requirement occurs later on in this function when calling getPayoutNumerator. When this requirement is removed we may want to consider explicitly requiring it here (or modifying this comment and keeping the gas savings)
-    require(controller.getTimestamp() > _market.getResolutionTime(), "Resolution time is not in the past");
+    require(time.getTimestamp() > _market.getResolutionTime(), "Resolution time is not in the past");
 
     ERC20 denominationToken = _market.getDenominationToken();
+    uint256 _totalProceeds = 0;
 
     for (uint256 _outcome = 0; _outcome < _market.getNumberOfOutcomes(); ++_outcome) {
       IShareToken _shareToken = _market.getShareToken(_outcome);
-      uint256 _numberOfShares = _shareToken.balanceOf(_shareHolder);
+      uint256 _numberOfShares = shareBalance(_shareToken, _shareHolder);
       uint256 _proceeds;
       uint256 _shareHolderShare;
       uint256 _creatorShare;
       (_proceeds, _shareHolderShare, _creatorShare) = divideUpWinnings(_market, _outcome, _numberOfShares);
+      _totalProceeds = _totalProceeds.add(_proceeds);
 
       // always destroy shares as it gives a minor gas refund and is good for the network
       if (_numberOfShares > 0) {
-        _shareToken.destroyShares(_shareHolder, _numberOfShares);
+        _market.destroyShares(_outcome, _shareHolder, _numberOfShares);
         logTradingProceedsClaimed(_market, _shareToken, _shareHolder, _numberOfShares, _shareHolderShare);
       }
       if (_shareHolderShare > 0) {
         require(denominationToken.transferFrom(_market, _shareHolder, _shareHolderShare), "Denomination token transfer failed");
       }
       if (_creatorShare > 0) {
-        require(denominationToken.transferFrom(_market, _market.getMarketCreatorMailbox(), _creatorShare), "Denomination token transfer failed");
+        require(denominationToken.transferFrom(_market, _market.getOrCreateMarketCreatorMailbox(), _creatorShare), "Denomination token transfer failed");
       }
     }
 
-    _market.assertBalances();
+    _market.recordProceedsClaimed(_totalProceeds);
 
     return true;
   }
 
+  // Settles the share holder at every index in the market at the same index. Consecutive pairs in the same market share one validation and read of the market, one balance check and one transfer of its creator fees to the mailbox
+  function batchClaimTradingProceeds(IMarket[] _markets, address[] _shareHolders) onlyInGoodTimes nonReentrant external returns(bool) {
+    require(_markets.length == _shareHolders.length, "Markets and share holders differ in length");
+    uint256 i = 0;
+    while (i < _markets.length) {
+      MarketClaim memory _marketClaim = loadMarketClaim(_markets[i]);
+      do {
+        claimShareHolderProceeds(_marketClaim, _shareHolders[i]);
+        i++;
+      } while (i < _markets.length && _markets[i] == _marketClaim.market);
+      settleMarketClaim(_marketClaim);
+    }
+    return true;
+  }
+
+  function loadMarketClaim(IMarket _market) private view returns (MarketClaim memory _marketClaim) {
+    _marketClaim.universe = requireMarketIsLegit(_market);
+    require(time.getTimestamp() > _market.getResolutionTime(), "Resolution time is not in the past");
+    uint256 _numOutcomes = _market.getNumberOfOutcomes();
+    _marketClaim.market = _market;
+    _marketClaim.denominationToken = _market.getDenominationToken();
+    _marketClaim.shareTokens = new IShareToken[](_numOutcomes);
+    _marketClaim.payoutNumerators = new uint256[](_numOutcomes);
+    for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+      _marketClaim.shareTokens[_outcome] = _market.getShareToken(_outcome);
+      // Also enforces that the market is resolved
+      _marketClaim.payoutNumerators[_outcome] = _market.getPayoutNumerator(_outcome);
+    }
+    return _marketClaim;
+  }
+
+  function settleMarketClaim(MarketClaim memory _marketClaim) private returns (bool) {
+    if (_marketClaim.creatorFees > 0) {
+      require(_marketClaim.denominationToken.transferFrom(_marketClaim.market, _marketClaim.market.getOrCreateMarketCreatorMailbox(), _marketClaim.creatorFees), "Denomination token transfer failed");
+    }
+    _marketClaim.market.recordProceedsClaimed(_marketClaim.proceeds);
+    return true;
+  }
+
+  function claimShareHolderProceeds(MarketClaim memory _marketClaim, address _shareHolder) private returns (bool) {
+    for (uint256 _outcome = 0; _outcome < _marketClaim.shareTokens.length; _outcome++) {
+      IShareToken _shareToken = _marketClaim.shareTokens[_outcome];
+      uint256 _numberOfShares = shareBalance(_shareToken, _shareHolder);
+      if (_numberOfShares == 0) {
+        continue;
+      }
+      uint256 _proceeds = _numberOfShares.mul(_marketClaim.payoutNumerators[_outcome]);
+      uint256 _creatorShare = _marketClaim.market.deriveMarketCreatorFeeAmount(_proceeds);
+      _marketClaim.market.destroyShares(_outcome, _shareHolder, _numberOfShares);
+      _marketClaim.proceeds = _marketClaim.proceeds.add(_proceeds);
+      payShareHolder(_marketClaim, _shareToken, _shareHolder, _numberOfShares, _proceeds.sub(_creatorShare));
+      _marketClaim.creatorFees = _marketClaim.creatorFees.add(_creatorShare);
+    }
+    return true;
+  }
+
+  function payShareHolder(MarketClaim memory _marketClaim, IShareToken _shareToken, address _shareHolder, uint256 _numberOfShares, uint256 _shareHolderShare) private returns (bool) {
+    augurLite.logTradingProceedsClaimed(_marketClaim.universe, _shareToken, _shareHolder, _marketClaim.market, _numberOfShares, _shareHolderShare, _marketClaim.denominationToken.balanceOf(_shareHolder).add(_shareHolderShare));
+    if (_shareHolderShare > 0) {
+      require(_marketClaim.denominationToken.transferFrom(_marketClaim.market, _shareHolder, _shareHolderShare), "Denomination token transfer failed");
+    }
+    return true;
+  }
+
+  // Deferred markets that never sold a complete set have no share tokens yet, and so nobody holds any shares
+  function shareBalance(IShareToken _shareToken, address _shareHolder) private view returns (uint256) {
+    if (_shareToken == address(0)) {
+      return 0;
+    }
+    return _shareToken.balanceOf(_shareHolder);
+  }
+
   function logTradingProceedsClaimed(IMarket _market, address _shareToken, address _sender, uint256 _numShares, uint256 _numPayoutTokens) private returns (bool) {
-    controller.getAugurLite().logTradingProceedsClaimed(_market.getUniverse(), _shareToken, _sender, _market, _numShares, _numPayoutTokens, _market.getDenominationToken().balanceOf(_sender).add(_numPayoutTokens));
+    augurLite.logTradingProceedsClaimed(_market.getUniverse(), _shareToken, _sender, _market, _numShares, _numPayoutTokens, _market.getDenominationToken().balanceOf(_sender).add(_numPayoutTokens));
     return true;
   }
 
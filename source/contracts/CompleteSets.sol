@@ -4,6 +4,7 @@ import 'ICompleteSets.sol';
 import 'IAugurLite.sol';
 import 'Controlled.sol';
 import 'IMarket.sol';
+import 'IUniverse.sol';
 import 'libraries/ReentrancyGuard.sol';
 import 'libraries/math/SafeMathUint256.sol';
 import 'libraries/MarketValidator.sol';
@@ -17,54 +18,113 @@ contract CompleteSets is Controlled, ReentrancyGuard, MarketValidator, IComplete
    * Buys `_amount` shares of every outcome in the specified market.
   **/
 
-  function publicBuyCompleteSets(IMarket _market, uint256 _amount) external marketIsLegit(_market) onlyInGoodTimes returns (bool) {
-    this.buyCompleteSets(msg.sender, _market, _amount);
-    controller.getAugurLite().logCompleteSetsPurchased(_market.getUniverse(), _market, msg.sender, _amount);
-    _market.assertBalances();
+  function publicBuyCompleteSets(IMarket _market, uint256 _amount) external onlyInGoodTimes nonReentrant returns (bool) {
+    IUniverse _universe = requireMarketIsLegit(_market);
+    buyCompleteSetsInternal(msg.sender, _market, _amount);
+    augurLite.logCompleteSetsPurchased(_universe, _market, msg.sender, _amount);
     return true;
   }
 
   function buyCompleteSets(address _sender, IMarket _market, uint256 _amount) external onlyWhitelistedCallers nonReentrant returns (bool) {
+    return buyCompleteSetsInternal(_sender, _market, _amount);
+  }
+
+  function publicSellCompleteSets(IMarket _market, uint256 _amount) external onlyInGoodTimes nonReentrant returns (bool) {
+    IUniverse _universe = requireMarketIsLegit(_market);
+    sellCompleteSetsInternal(msg.sender, _market, _amount);
+    augurLite.logCompleteSetsSold(_universe, _market, msg.sender, _amount);
+    return true;
+  }
+
+  function sellCompleteSets(address _sender, IMarket _market, uint256 _amount) external onlyWhitelistedCallers nonReentrant returns (bool) {
+    return sellCompleteSetsInternal(_sender, _market, _amount);
+  }
+
+  /**
+   * Buys complete sets in several markets. Markets of the same universe that follow each other in the list share one transfer of the denomination token from the sender
+  **/
+
+  function publicBatchBuyCompleteSets(IMarket[] _markets, uint256[] _amounts) external onlyInGoodTimes nonReentrant returns (bool) {
+    require(_markets.length == _amounts.length, "Markets and amounts differ in length");
+    IUniverse[] memory _universes = new IUniverse[](_markets.length);
+    uint256[] memory _costs = new uint256[](_markets.length);
+    IUniverse _universe;
+    for (uint256 i = 0; i < _markets.length; i++) {
+      _universe = requireMarketIsLegit(_markets[i], _universe);
+      _universes[i] = _universe;
+      _costs[i] = _amounts[i].mul(_markets[i].getNumTicks());
+      require(_costs[i] > 0, "Transfer amount needs to be greater than 0");
+    }
+    uint256 _end;
+    for (uint256 _start = 0; _start < _markets.length; _start = _end) {
+      _end = _start + 1;
+      while (_end < _markets.length && _universes[_end] == _universes[_start]) {
+        _end++;
+      }
+      buyCompleteSetsInUniverse(_universes[_start], _markets, _amounts, _costs, _start, _end);
+    }
+    return true;
+  }
+
+  /**
+   * Sells complete sets in several markets. Every market pays out of its own balance, so only the market checks are shared
+  **/
+
+  function publicBatchSellCompleteSets(IMarket[] _markets, uint256[] _amounts) external onlyInGoodTimes nonReentrant returns (bool) {
+    require(_markets.length == _amounts.length, "Markets and amounts differ in length");
+    IUniverse _universe;
+    for (uint256 i = 0; i < _markets.length; i++) {
+      _universe = requireMarketIsLegit(_markets[i], _universe);
+      sellCompleteSetsInternal(msg.sender, _markets[i], _amounts[i]);
+      augurLite.logCompleteSetsSold(_universe, _markets[i], msg.sender, _amounts[i]);
+    }
+    return true;
+  }
+
+  function buyCompleteSetsInternal(address _sender, IMarket _market, uint256 _amount) private returns (bool) {
     require(_sender != address(0), "Sender is the 0x0 address");
 
-    uint256 _numOutcomes = _market.getNumberOfOutcomes();
     ERC20 _denominationToken = _market.getDenominationToken();
-    IAugurLite _augurLite = controller.getAugurLite();
 
     uint256 _cost = _amount.mul(_market.getNumTicks());
-    require(_augurLite.trustedTransfer(_denominationToken, _sender, _market, _cost), "Augur trustedTransfer failed");
-    for (uint256 _outcome = 0; _outcome < _numOutcomes; ++_outcome) {
-      _market.getShareToken(_outcome).createShares(_sender, _amount);
-    }
+    require(augurLite.trustedTransfer(_denominationToken, _sender, _market, _cost), "Augur trustedTransfer failed");
+    _market.mintCompleteSets(_sender, _amount);
 
     return true;
   }
 
-  function publicSellCompleteSets(IMarket _market, uint256 _amount) external marketIsLegit(_market) onlyInGoodTimes returns (bool) {
-    this.sellCompleteSets(msg.sender, _market, _amount);
-    controller.getAugurLite().logCompleteSetsSold(_market.getUniverse(), _market, msg.sender, _amount);
-    _market.assertBalances();
+  // Pulls the cost of markets _start up to _end, which all belong to _universe, from the sender at once and funds each market from it
+  function buyCompleteSetsInUniverse(IUniverse _universe, IMarket[] memory _markets, uint256[] memory _amounts, uint256[] memory _costs, uint256 _start, uint256 _end) private returns (bool) {
+    uint256 _totalCost = 0;
+    for (uint256 i = _start; i < _end; i++) {
+      _totalCost = _totalCost.add(_costs[i]);
+    }
+    ERC20 _denominationToken = _universe.getDenominationToken();
+    require(augurLite.trustedTransfer(_denominationToken, msg.sender, this, _totalCost), "Augur trustedTransfer failed");
+    for (i = _start; i < _end; i++) {
+      require(_denominationToken.transfer(_markets[i], _costs[i]), "Denomination token transfer failed");
+      _markets[i].mintCompleteSets(msg.sender, _amounts[i]);
+      augurLite.logCompleteSetsPurchased(_universe, _markets[i], msg.sender, _amounts[i]);
+    }
     return true;
   }
 
-  function sellCompleteSets(address _sender, IMarket _market, uint256 _amount) external onlyWhitelistedCallers nonReentrant returns (bool) {
+  function sellCompleteSetsInternal(address _sender, IMarket _market, uint256 _amount) private returns (bool) {
     require(_sender != address(0), "Sender is the 0x0 address");
 
-    uint256 _numOutcomes = _market.getNumberOfOutcomes();
     ERC20 _denominationToken = _market.getDenominationToken();
     uint256 _payout = _amount.mul(_market.getNumTicks());
     uint256 _creatorFee = _market.deriveMarketCreatorFeeAmount(_payout);
     _payout = _payout.sub(_creatorFee);
 
     // Takes shares away from participant and decreases the amount issued in the market since we're exchanging complete sets
-    for (uint256 _outcome = 0; _outcome < _numOutcomes; ++_outcome) {
-      _market.getShareToken(_outcome).destroyShares(_sender, _amount);
-    }
+    _market.burnCompleteSets(_sender, _amount);
 
     if (_creatorFee != 0) {
-      require(_denominationToken.transferFrom(_market, _market.getMarketCreatorMailbox(), _creatorFee), "Denomination token transfer failed");
+      require(_denominationToken.transferFrom(_market, _market.getOrCreateMarketCreatorMailbox(), _creatorFee), "Denomination token transfer failed");
     }
     require(_denominationToken.transferFrom(_market, _sender, _payout), "Denomination token transfer failed");
+    _market.assertBalances();
 
     return true;
   }
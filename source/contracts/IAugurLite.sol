@@ -2,11 +2,14 @@ pragma solidity 0.4.26;
 
 import 'IMarket.sol';
 import 'IUniverse.sol';
+import 'IShareToken.sol';
 import 'libraries/token/ERC20.sol';
 
 
 contract IAugurLite {
   function isKnownUniverse(IUniverse _universe) public view returns (bool);
+  function registerShareTokens(IMarket _market) public returns (bool);
+  function isKnownShareToken(IShareToken _shareToken) public view returns (bool);
   function trustedTransfer(ERC20 _token, address _from, address _to, uint256 _amount) public returns (bool);
   function logMarketCreated(bytes32 _topic, string _description, string _extraInfo, IUniverse _universe, address _market, address _marketCreator, bytes32[] _outcomes, int256 _minPrice, int256 _maxPrice, IMarket.MarketType _marketType) public returns (bool);
   function logMarketCreated(bytes32 _topic, string _description, string _extraInfo, IUniverse _universe, address _market, address _marketCreator, int256 _minPrice, int256 _maxPrice, IMarket.MarketType _marketType) public returns (bool);
@@ -17,6 +20,8 @@ contract IAugurLite {
   function logShareTokensTransferred(IUniverse _universe, address _from, address _to, uint256 _value) public returns (bool);
   function logShareTokenBurned(IUniverse _universe, address _target, uint256 _amount) public returns (bool);
   function logShareTokenMinted(IUniverse _universe, address _target, uint256 _amount) public returns (bool);
+  function logShareLedgerMinted(IUniverse _universe, IShareToken[] _shareTokens, address _target, uint256 _amount) public returns (bool);
+  function logShareLedgerBurned(IUniverse _universe, IShareToken[] _shareTokens, address _target, uint256 _amount) public returns (bool);
   function logTimestampSet(uint256 _newTimestamp) public returns (bool);
   function logMarketTransferred(IUniverse _universe, address _from, address _to) public returns (bool);
   function logMarketMailboxTransferred(IUniverse _universe, IMarket _market, address _from, address _to) public returns (bool);
@@ -1,5 +1,6 @@
 pragma solidity 0.4.26;
 
+import 'IShareLedger.sol';
 import 'IShareToken.sol';
 import 'IUniverse.sol';
 import 'IMailbox.sol';
@@ -15,21 +16,31 @@ contract IMarket is ITyped, IOwnable {
     SCALAR
   }
 
-  function initialize(IUniverse _universe, uint256 _endTime, uint256 _feePerEthInAttoeth, ERC20 _denominationToken, address _oracle, address _creator, uint256 _numOutcomes, uint256 _numTicks) public returns (bool _success);
+  function initialize(IUniverse _universe, uint256 _endTime, uint256 _feePerEthInAttoeth, ERC20 _denominationToken, address _oracle, address _creator, uint256 _numOutcomes, uint256 _numTicks, bool _deferAssets, bool _useShareLedger) public returns (bool _success);
   function getUniverse() public view returns (IUniverse);
   function getNumberOfOutcomes() public view returns (uint256);
   function getNumTicks() public view returns (uint256);
   function getDenominationToken() public view returns (ERC20);
   function getShareToken(uint256 _outcome)  public view returns (IShareToken);
+  function getShareLedger() public view returns (IShareLedger);
   function getMarketCreatorSettlementFeeDivisor() public view returns (uint256);
   function getEndTime() public view returns (uint256);
   function getMarketCreatorMailbox() public view returns (IMailbox);
+  function getOrCreateMarketCreatorMailbox() public returns (IMailbox);
   function getPayoutNumerator(uint256 _outcome) public view returns (uint256);
   function getResolutionTime() public view returns (uint256);
   function getOracle() public view returns (address);
   function deriveMarketCreatorFeeAmount(uint256 _amount) public view returns (uint256);
   function isContainerForShareToken(IShareToken _shadyTarget) public view returns (bool);
   function isInvalid() public view returns (bool);
+  function resolve(uint256[] _payoutNumerators, bool _invalid) public returns (bool);
+  function resolveFor(address _sender, uint256[] _payoutNumerators, bool _invalid) public returns (bool);
   function isResolved() public view returns (bool);
+  function mintCompleteSets(address _owner, uint256 _amount) public returns (bool);
+  function burnCompleteSets(address _owner, uint256 _amount) public returns (bool);
+  function destroyShares(uint256 _outcome, address _owner, uint256 _amount) public returns (bool);
+  function recordProceedsClaimed(uint256 _proceeds) public returns (bool);
+  function getOpenInterest() public view returns (uint256);
+  function calculateOpenInterest() public view returns (uint256);
   function assertBalances() public view returns (bool);
 }
@@ -0,0 +1,19 @@
+pragma solidity 0.4.26;
+
+import 'IMarket.sol';
+import 'IShareToken.sol';
+import 'libraries/ITyped.sol';
+
+
+contract IShareLedger is ITyped {
+  function initialize(IMarket _market, uint256 _numOutcomes) external returns (bool);
+  function mintCompleteSets(address _owner, uint256 _amount) external returns (bool);
+  function burnCompleteSets(address _owner, uint256 _amount) external returns (bool);
+  function createShares(uint256 _outcome, address _owner, uint256 _amount) external returns (bool);
+  function destroyShares(uint256 _outcome, address _owner, uint256 _amount) external returns (bool);
+  function transfer(uint256 _outcome, address _from, address _to, uint256 _value) external returns (bool);
+  function balanceOf(uint256 _outcome, address _owner) public view returns (uint256);
+  function totalSupply(uint256 _outcome) public view returns (uint256);
+  function getMarket() external view returns (IMarket);
+  function getShareToken(uint256 _outcome) public view returns (IShareToken);
+}
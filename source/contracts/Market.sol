@@ -3,6 +3,7 @@ pragma solidity 0.4.26;
 import 'IMarket.sol';
 import 'IMailbox.sol';
 import 'IUniverse.sol';
+import 'IShareLedger.sol';
 import 'IShareToken.sol';
 import 'libraries/DelegationTarget.sol';
 import 'libraries/ITyped.sol';
@@ -12,6 +13,7 @@ import 'libraries/token/ERC20.sol';
 import 'libraries/math/SafeMathUint256.sol';
 import 'libraries/math/SafeMathInt256.sol';
 import 'factories/MailboxFactory.sol';
+import 'factories/ShareLedgerFactory.sol';
 import 'factories/ShareTokenFactory.sol';
 
 
@@ -25,24 +27,37 @@ contract Market is DelegationTarget, ITyped, Initializable, Ownable, IMarket {
   address private constant NULL_ADDRESS = address(0);
   uint256 private constant MIN_OUTCOMES = 2;
   uint256 private constant MAX_OUTCOMES = 8;
-
-  // Contract Refs
+  uint256 private constant MAX_UINT64 = 2 ** 64 - 1;
+  uint256 private constant MAX_UINT128 = 2 ** 128 - 1;
+
+  // Storage is packed so values that are read together share a slot:
+  //   universe, endTime, numOutcomes
+  //   denominationToken
+  //   numTicks, feeDivisor
+  //   oracle, resolutionTime, invalid (everything resolve writes apart from the payout numerators)
+  //   marketCreatorMailbox, useShareLedger
+  // The getters widen every value back to uint256, so the external interface is unchanged
   IUniverse private universe;
+  uint64 private endTime;
+  uint8 private numOutcomes;
   ERC20 private denominationToken;
-
-  // Attributes
-  uint256 private numTicks;
-  uint256 private feeDivisor;
-  uint256 private endTime;
-  uint256 private numOutcomes;
-  uint256 private resolutionTime;
+  uint128 private numTicks;
+  uint128 private feeDivisor;
   address private oracle;
+  uint64 private resolutionTime;
   bool private invalid;
   IMailbox private marketCreatorMailbox;
-  uint256[] private payoutNumerators;
+  // Only kept for deferred markets, which create their share tokens long after the market factory passed the option in
+  bool private useShareLedger;
+  // Two payout numerators per slot, so MAX_OUTCOMES / 2 slots: outcome 2 * i in the low and outcome 2 * i + 1 in the high 128 bits of slot i. They fit because they never exceed numTicks
+  uint256[4] private payoutNumerators;
   IShareToken[] private shareTokens;
+  // Denomination tokens the market must hold to pay out every outstanding share. Kept up to date by the whitelisted contracts that mint and burn shares so assertBalances doesn't have to add up every ShareToken's supply
+  uint256 private openInterest;
+  // Only set for markets created with useShareLedger. Every outcome's balances then live in this ledger and shareTokens holds its ERC20 adapters
+  IShareLedger private shareLedger;
 
-  function initialize(IUniverse _universe, uint256 _endTime, uint256 _feeDivisor, ERC20 _denominationToken, address _oracle, address _creator, uint256 _numOutcomes, uint256 _numTicks) public onlyInGoodTimes beforeInitialized returns (bool _success) {
+  function initialize(IUniverse _universe, uint256 _endTime, uint256 _feeDivisor, ERC20 _denominationToken, address _oracle, address _creator, uint256 _numOutcomes, uint256 _numTicks, bool _deferAssets, bool _useShareLedger) public onlyInGoodTimes beforeInitialized returns (bool _success) {
     endInitialization();
     require(MIN_OUTCOMES <= _numOutcomes && _numOutcomes <= MAX_OUTCOMES, "Invalid number of outcomes");
     require(_numTicks > 0, "numTicks needs to be greater than 0");
@@ -50,27 +65,46 @@ contract Market is DelegationTarget, ITyped, Initializable, Ownable, IMarket {
     require((_numTicks >= _numOutcomes), "numTicks needs to be greater than number of outcomes");
     require(_feeDivisor == 0 || _feeDivisor >= MIN_FEE_DIVISOR, "Invalid feeDivisor");
     require(_creator != NULL_ADDRESS, "Market creator cannot be the 0x0 address");
+    // Values are narrowed to fit the packed layout. Reject anything that would not survive the round trip rather than truncating it
+    require(_endTime <= MAX_UINT64, "endTime is too large");
+    require(_numTicks <= MAX_UINT128, "numTicks is too large");
+    require(_feeDivisor <= MAX_UINT128, "feeDivisor is too large");
     require(controller.getTimestamp() < _endTime, "Market expiration is in the past");
     require(IUniverse(_universe).getDenominationToken() == _denominationToken, "Market denominationToken does not match the universe denominationToken");
 
-    universe = _universe;
     owner = _creator;
-    endTime = _endTime;
-    numOutcomes = _numOutcomes;
-    numTicks = _numTicks;
-    feeDivisor = _feeDivisor;
+    universe = _universe;
+    endTime = uint64(_endTime);
+    numOutcomes = uint8(_numOutcomes);
     denominationToken = _denominationToken;
+    numTicks = uint128(_numTicks);
+    feeDivisor = uint128(_feeDivisor);
     oracle = _oracle;
-    marketCreatorMailbox = MailboxFactory(controller.lookup("MailboxFactory")).createMailbox(controller, owner, this);
-    for (uint256 _outcome = 0; _outcome < numOutcomes; _outcome++) {
-      shareTokens.push(createShareToken(_outcome));
+    // Both options come from the market factory. Deferred markets that never trade don't pay for a mailbox, share tokens or spender approvals. See getOrCreateMarketCreatorMailbox and mintCompleteSets
+    if (!_deferAssets) {
+      marketCreatorMailbox = MailboxFactory(controller.lookup("MailboxFactory")).createMailbox(controller, owner, this);
+      createShareTokens(_useShareLedger);
+      approveSpenders();
+    } else if (_useShareLedger) {
+      useShareLedger = true;
     }
-    approveSpenders();
     return true;
   }
 
-  function createShareToken(uint256 _outcome) private onlyInGoodTimes returns (IShareToken) {
-    return ShareTokenFactory(controller.lookup("ShareTokenFactory")).createShareToken(controller, this, _outcome);
+  function createShareTokens(bool _useShareLedger) private returns (bool) {
+    uint256 _numOutcomes = getNumberOfOutcomes();
+    if (_useShareLedger) {
+      shareLedger = ShareLedgerFactory(controller.lookup("ShareLedgerFactory")).createShareLedger(controller, this, _numOutcomes);
+      for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+        shareTokens.push(shareLedger.getShareToken(_outcome));
+      }
+    } else {
+      ShareTokenFactory _shareTokenFactory = ShareTokenFactory(controller.lookup("ShareTokenFactory"));
+      for (_outcome = 0; _outcome < _numOutcomes; _outcome++) {
+        shareTokens.push(_shareTokenFactory.createShareToken(controller, this, _outcome));
+      }
+    }
+    return true;
   }
 
   // This will need to be called manually for each open market if a spender contract is updated
@@ -81,28 +115,48 @@ contract Market is DelegationTarget, ITyped, Initializable, Ownable, IMarket {
   }
 
   function resolve(uint256[] _payoutNumerators, bool _invalid) public onlyInGoodTimes returns (bool) {
+    return resolveInternal(msg.sender, _payoutNumerators, _invalid);
+  }
+
+  // Lets MarketResolver resolve the market on behalf of the oracle that called it. No other caller is trusted to name the sender
+  function resolveFor(address _sender, uint256[] _payoutNumerators, bool _invalid) public onlyInGoodTimes onlyCaller("MarketResolver") returns (bool) {
+    return resolveInternal(_sender, _payoutNumerators, _invalid);
+  }
+
+  function resolveInternal(address _sender, uint256[] memory _payoutNumerators, bool _invalid) private returns (bool) {
     uint256 _timestamp = controller.getTimestamp();
     require(!isResolved(), "Market is already resolved");
     require(_timestamp > endTime, "Market is not expired");
-    require(msg.sender == getOracle(), "Sender is not the oracle");
+    require(_timestamp <= MAX_UINT64, "Timestamp is too large");
+    require(_sender == getOracle(), "Sender is not the oracle");
     require(verifyResolutionInformation(_payoutNumerators, _invalid), "Invalid payoutNumerators");
 
-    resolutionTime = _timestamp;
-    payoutNumerators = _payoutNumerators;
+    resolutionTime = uint64(_timestamp);
     invalid = _invalid;
+    for (uint256 i = 0; i < _payoutNumerators.length; i += 2) {
+      uint256 _packedNumerators = _payoutNumerators[i];
+      if (i + 1 < _payoutNumerators.length) {
+        _packedNumerators |= _payoutNumerators[i + 1] << 128;
+      }
+      payoutNumerators[i / 2] = _packedNumerators;
+    }
+    // Until now every outstanding complete set was worth numTicks. Invalid markets pay out a little less for each one when numTicks isn't a multiple of numOutcomes
+    if (_invalid) {
+      openInterest = openInterest.div(getNumTicks()).mul(getCompleteSetValue());
+    }
     controller.getAugurLite().logMarketResolved(universe);
     return true;
   }
 
   function getMarketCreatorSettlementFeeDivisor() public view returns (uint256) {
-    return feeDivisor;
+    return uint256(feeDivisor);
   }
 
   function deriveMarketCreatorFeeAmount(uint256 _amount) public view returns (uint256) {
     if (feeDivisor == 0) {
       return 0;
     }
-    return _amount / feeDivisor;
+    return _amount / uint256(feeDivisor);
   }
 
   function withdrawInEmergency() public onlyInBadTimes onlyOwner returns (bool) {
@@ -121,13 +175,22 @@ contract Market is DelegationTarget, ITyped, Initializable, Ownable, IMarket {
   }
 
   function getEndTime() public view returns (uint256) {
-    return endTime;
+    return uint256(endTime);
   }
 
+  // 0 for a deferred market until its first creator fee is paid
   function getMarketCreatorMailbox() public view returns (IMailbox) {
     return marketCreatorMailbox;
   }
 
+  // Creator fees are paid through here so a deferred market gets its mailbox on the first one. Anyone may call it: the mailbox always goes to the market's current owner
+  function getOrCreateMarketCreatorMailbox() public returns (IMailbox) {
+    if (marketCreatorMailbox == NULL_ADDRESS) {
+      marketCreatorMailbox = MailboxFactory(controller.lookup("MailboxFactory")).createMailbox(controller, owner, this);
+    }
+    return marketCreatorMailbox;
+  }
+
   function isInvalid() public view returns (bool) {
     require(isResolved(), "Market is not resolved");
     return invalid;
@@ -139,7 +202,8 @@ contract Market is DelegationTarget, ITyped, Initializable, Ownable, IMarket {
 
   function getPayoutNumerator(uint256 _outcome) public view returns (uint256) {
     require(isResolved(), "Market is not resolved");
-    return payoutNumerators[_outcome];
+    require(_outcome < numOutcomes, "Invalid outcome");
+    return (payoutNumerators[_outcome / 2] >> (128 * (_outcome % 2))) & MAX_UINT128;
   }
 
   function getUniverse() public view returns (IUniverse) {
@@ -147,25 +211,34 @@ contract Market is DelegationTarget, ITyped, Initializable, Ownable, IMarket {
   }
 
   function getResolutionTime() public view returns (uint256) {
-    return resolutionTime;
+    return uint256(resolutionTime);
   }
 
   function getNumberOfOutcomes() public view returns (uint256) {
-    return numOutcomes;
+    return uint256(numOutcomes);
   }
 
   function getNumTicks() public view returns (uint256) {
-    return numTicks;
+    return uint256(numTicks);
   }
 
   function getDenominationToken() public view returns (ERC20) {
     return denominationToken;
   }
 
+  // 0 for every outcome of a deferred market until its first complete sets are bought
   function getShareToken(uint256 _outcome) public view returns (IShareToken) {
+    if (shareTokens.length == 0) {
+      require(_outcome < numOutcomes, "Invalid outcome");
+      return IShareToken(NULL_ADDRESS);
+    }
     return shareTokens[_outcome];
   }
 
+  function getShareLedger() public view returns (IShareLedger) {
+    return shareLedger;
+  }
+
   function isContainerForShareToken(IShareToken _shadyShareToken) public view returns (bool) {
     return getShareToken(_shadyShareToken.getOutcome()) == _shadyShareToken;
   }
@@ -186,26 +259,93 @@ contract Market is DelegationTarget, ITyped, Initializable, Ownable, IMarket {
       _previousValue = _value;
     }
     if (_invalid) {
-      require(_previousValue == numTicks / numOutcomes, "Wrong value in payoutNumerators for invalid market");
+      require(_previousValue == getNumTicks() / getNumberOfOutcomes(), "Wrong value in payoutNumerators for invalid market");
     } else {
-      require(_sum == numTicks, "payoutNumerators array does not sum to numTicks");
+      require(_sum == getNumTicks(), "payoutNumerators array does not sum to numTicks");
     }
     return true;
   }
 
-  function assertBalances() public view returns (bool) {
-    // Escrowed funds for open orders
-    uint256 _expectedBalance = 0;
-    // Market Open Interest. If we're resolved we need actually calculate the value
+  // The caller is checked against the whitelist once here. Share tokens only accept mints and burns from their own market
+  function mintCompleteSets(address _owner, uint256 _amount) public onlyWhitelistedCallers returns (bool) {
+    if (shareTokens.length == 0) {
+      createDeferredShareTokens();
+    }
+    if (shareLedger != address(0)) {
+      shareLedger.mintCompleteSets(_owner, _amount);
+    } else {
+      uint256 _numOutcomes = getNumberOfOutcomes();
+      for (uint256 _outcome = 0; _outcome < _numOutcomes; ++_outcome) {
+        shareTokens[_outcome].createShares(_owner, _amount);
+      }
+    }
+    openInterest = openInterest.add(_amount.mul(getCompleteSetValue()));
+    return assertBalances();
+  }
+
+  // Balances are asserted by the caller once the payout has left the market
+  function burnCompleteSets(address _owner, uint256 _amount) public onlyWhitelistedCallers returns (bool) {
+    require(shareTokens.length > 0, "No shares have been created");
+    if (shareLedger != address(0)) {
+      shareLedger.burnCompleteSets(_owner, _amount);
+    } else {
+      uint256 _numOutcomes = getNumberOfOutcomes();
+      for (uint256 _outcome = 0; _outcome < _numOutcomes; ++_outcome) {
+        shareTokens[_outcome].destroyShares(_owner, _amount);
+      }
+    }
+    openInterest = openInterest.sub(_amount.mul(getCompleteSetValue()));
+    return true;
+  }
+
+  // Claims burn the shares of a single outcome. They pay out of the market's escrow, and recordProceedsClaimed takes the proceeds off open interest
+  function destroyShares(uint256 _outcome, address _owner, uint256 _amount) public onlyWhitelistedCallers returns (bool) {
+    return shareTokens[_outcome].destroyShares(_owner, _amount);
+  }
+
+  // The share tokens only become known to AugurLite, and so only able to log, once the market has registered them
+  function createDeferredShareTokens() private returns (bool) {
+    createShareTokens(useShareLedger);
+    approveSpenders();
+    controller.getAugurLite().registerShareTokens(this);
+    return true;
+  }
+
+  function recordProceedsClaimed(uint256 _proceeds) public onlyWhitelistedCallers returns (bool) {
+    openInterest = openInterest.sub(_proceeds);
+    return assertBalances();
+  }
+
+  function getOpenInterest() public view returns (uint256) {
+    return openInterest;
+  }
+
+  // The value of one share of every outcome, which is what buying or selling a complete set moves in or out of escrow
+  function getCompleteSetValue() public view returns (uint256) {
+    if (isResolved() && invalid) {
+      return getNumTicks().div(getNumberOfOutcomes()).mul(getNumberOfOutcomes());
+    }
+    return getNumTicks();
+  }
+
+  // Recomputes open interest from the supply of every ShareToken. Linear in the number of outcomes, so only meant for off-chain checks of the running total
+  function calculateOpenInterest() public view returns (uint256) {
+    uint256 _openInterest = 0;
+    if (shareTokens.length == 0) {
+      return _openInterest;
+    }
     if (isResolved()) {
       for (uint256 i = 0; i < numOutcomes; i++) {
-        _expectedBalance = _expectedBalance.add(shareTokens[i].totalSupply().mul(getPayoutNumerator(i)));
+        _openInterest = _openInterest.add(shareTokens[i].totalSupply().mul(getPayoutNumerator(i)));
       }
     } else {
-      _expectedBalance = _expectedBalance.add(shareTokens[0].totalSupply().mul(numTicks));
+      _openInterest = shareTokens[0].totalSupply().mul(getNumTicks());
     }
+    return _openInterest;
+  }
 
-    assert(denominationToken.balanceOf(this) >= _expectedBalance);
+  function assertBalances() public view returns (bool) {
+    assert(denominationToken.balanceOf(this) >= openInterest);
     return true;
   }
 }
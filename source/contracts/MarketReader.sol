@@ -0,0 +1,91 @@
+pragma solidity 0.4.26;
+
+import 'IMarket.sol';
+import 'IShareToken.sol';
+import 'libraries/math/SafeMathUint256.sol';
+
+
+/**
+ * @title MarketReader
+ * @dev Reads the parameters of a list of markets and a share holder's position in each of them in a single call
+ */
+contract MarketReader {
+  using SafeMathUint256 for uint256;
+
+  uint256 private constant MARKET_ADDRESSES = 5;
+  uint256 private constant MARKET_VALUES = 6;
+  uint256 private constant OUTCOME_VALUES = 5;
+
+  function getPosition(IMarket _market, address _shareHolder) public view returns (address[] _addresses, uint256[] _values) {
+    IMarket[] memory _markets = new IMarket[](1);
+    _markets[0] = _market;
+    return getPositions(_markets, _shareHolder);
+  }
+
+  // Both arrays repeat this layout for every market, in order:
+  //   _addresses: universe, denominationToken, oracle, owner, marketCreatorMailbox, then the share token of every outcome
+  //   _values: numberOfOutcomes, numTicks, feeDivisor, endTime, resolutionTime, invalid (1 or 0), then for every outcome: balance, payoutNumerator, proceeds, shareHolderShare, creatorShare
+  // The mailbox and share tokens of a deferred market are 0 until it creates them, and balances read as 0 meanwhile
+  // Proceeds are split the way ClaimTradingProceeds.divideUpWinnings splits them and stay 0 until the market is resolved
+  function getPositions(IMarket[] _markets, address _shareHolder) public view returns (address[] _addresses, uint256[] _values) {
+    uint256 _totalOutcomes = 0;
+    for (uint256 i = 0; i < _markets.length; i++) {
+      _totalOutcomes = _totalOutcomes.add(_markets[i].getNumberOfOutcomes());
+    }
+    _addresses = new address[](_markets.length.mul(MARKET_ADDRESSES).add(_totalOutcomes));
+    _values = new uint256[](_markets.length.mul(MARKET_VALUES).add(_totalOutcomes.mul(OUTCOME_VALUES)));
+    uint256 _addressOffset = 0;
+    uint256 _valueOffset = 0;
+    for (uint256 j = 0; j < _markets.length; j++) {
+      _addressOffset = writeMarketAddresses(_markets[j], _addresses, _addressOffset);
+      _valueOffset = writeMarketValues(_markets[j], _shareHolder, _values, _valueOffset);
+    }
+    return (_addresses, _values);
+  }
+
+  function writeMarketAddresses(IMarket _market, address[] memory _addresses, uint256 _offset) private view returns (uint256) {
+    _addresses[_offset] = _market.getUniverse();
+    _addresses[_offset + 1] = _market.getDenominationToken();
+    _addresses[_offset + 2] = _market.getOracle();
+    _addresses[_offset + 3] = _market.getOwner();
+    _addresses[_offset + 4] = _market.getMarketCreatorMailbox();
+    _offset += MARKET_ADDRESSES;
+    uint256 _numOutcomes = _market.getNumberOfOutcomes();
+    for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+      _addresses[_offset + _outcome] = _market.getShareToken(_outcome);
+    }
+    return _offset + _numOutcomes;
+  }
+
+  function writeMarketValues(IMarket _market, address _shareHolder, uint256[] memory _values, uint256 _offset) private view returns (uint256) {
+    uint256 _numOutcomes = _market.getNumberOfOutcomes();
+    bool _resolved = _market.isResolved();
+    _values[_offset] = _numOutcomes;
+    _values[_offset + 1] = _market.getNumTicks();
+    _values[_offset + 2] = _market.getMarketCreatorSettlementFeeDivisor();
+    _values[_offset + 3] = _market.getEndTime();
+    _values[_offset + 4] = _market.getResolutionTime();
+    _values[_offset + 5] = _resolved && _market.isInvalid() ? 1 : 0;
+    _offset += MARKET_VALUES;
+    for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+      _offset = writeOutcomeValues(_market, _outcome, _resolved, _shareHolder, _values, _offset);
+    }
+    return _offset;
+  }
+
+  function writeOutcomeValues(IMarket _market, uint256 _outcome, bool _resolved, address _shareHolder, uint256[] memory _values, uint256 _offset) private view returns (uint256) {
+    IShareToken _shareToken = _market.getShareToken(_outcome);
+    uint256 _balance = _shareToken == address(0) ? 0 : _shareToken.balanceOf(_shareHolder);
+    _values[_offset] = _balance;
+    if (_resolved) {
+      uint256 _payoutNumerator = _market.getPayoutNumerator(_outcome);
+      uint256 _proceeds = _balance.mul(_payoutNumerator);
+      uint256 _creatorShare = _market.deriveMarketCreatorFeeAmount(_proceeds);
+      _values[_offset + 1] = _payoutNumerator;
+      _values[_offset + 2] = _proceeds;
+      _values[_offset + 3] = _proceeds.sub(_creatorShare);
+      _values[_offset + 4] = _creatorShare;
+    }
+    return _offset + OUTCOME_VALUES;
+  }
+}
@@ -0,0 +1,33 @@
+pragma solidity 0.4.26;
+
+import 'Controlled.sol';
+import 'IMarket.sol';
+import 'libraries/math/SafeMathUint256.sol';
+
+
+/**
+ * @title MarketResolver
+ * @dev Lets an oracle resolve many markets in a single transaction
+ */
+contract MarketResolver is Controlled {
+  using SafeMathUint256 for uint256;
+
+  // _payoutNumerators holds the payout numerators of every market back to back, as many for each market as it has outcomes.
+  // Each market runs the checks of Market.resolve against the sender of this call, so passing a market the sender isn't the oracle of fails the batch, and sends the usual MarketResolved event
+  function resolveMarkets(IMarket[] _markets, uint256[] _payoutNumerators, bool[] _invalid) public onlyInGoodTimes returns (bool) {
+    require(_invalid.length == _markets.length, "Wrong number of invalid flags");
+    uint256 _offset = 0;
+    for (uint256 i = 0; i < _markets.length; i++) {
+      uint256 _numOutcomes = _markets[i].getNumberOfOutcomes();
+      require(_offset.add(_numOutcomes) <= _payoutNumerators.length, "Not enough payoutNumerators");
+      uint256[] memory _marketPayoutNumerators = new uint256[](_numOutcomes);
+      for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+        _marketPayoutNumerators[_outcome] = _payoutNumerators[_offset + _outcome];
+      }
+      _offset += _numOutcomes;
+      require(_markets[i].resolveFor(msg.sender, _marketPayoutNumerators, _invalid[i]), "Market resolution failed");
+    }
+    require(_offset == _payoutNumerators.length, "Unused payoutNumerators");
+    return true;
+  }
+}
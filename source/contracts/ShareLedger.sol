@@ -0,0 +1,117 @@
+pragma solidity 0.4.26;
+
+import 'IMarket.sol';
+import 'IShareLedger.sol';
+import 'IShareToken.sol';
+import 'IUniverse.sol';
+import 'libraries/DelegationTarget.sol';
+import 'libraries/ITyped.sol';
+import 'libraries/Initializable.sol';
+import 'libraries/math/SafeMathUint256.sol';
+import 'factories/ShareLedgerTokenFactory.sol';
+
+
+/**
+ * @title ShareLedger
+ * @dev Holds the share balances of every outcome of a market. Complete sets are minted and burned in a single call, and each outcome is still exposed as an ERC20 through a ShareLedgerToken
+ */
+contract ShareLedger is DelegationTarget, ITyped, Initializable, IShareLedger {
+  using SafeMathUint256 for uint256;
+
+  IMarket private market;
+  IUniverse private universe;
+  IShareToken[] private shareTokens;
+  uint256[] private supplies;
+  mapping(uint256 => mapping(address => uint256)) private balances;
+
+  modifier onlyMarket {
+    require(IMarket(msg.sender) == market, "Sender is not the market");
+    _;
+  }
+
+  modifier onlyShareToken(uint256 _outcome) {
+    require(IShareToken(msg.sender) == shareTokens[_outcome], "Sender is not the outcome's share token");
+    _;
+  }
+
+  function initialize(IMarket _market, uint256 _numOutcomes) external beforeInitialized returns (bool) {
+    endInitialization();
+    market = _market;
+    universe = _market.getUniverse();
+    supplies.length = _numOutcomes;
+    ShareLedgerTokenFactory _shareLedgerTokenFactory = ShareLedgerTokenFactory(controller.lookup("ShareLedgerTokenFactory"));
+    for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+      IShareToken _shareToken = _shareLedgerTokenFactory.createShareLedgerToken(controller);
+      _shareToken.initialize(_market, _outcome);
+      shareTokens.push(_shareToken);
+    }
+    return true;
+  }
+
+  function mintCompleteSets(address _owner, uint256 _amount) external onlyMarket returns (bool) {
+    uint256 _numOutcomes = shareTokens.length;
+    for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+      balances[_outcome][_owner] = balances[_outcome][_owner].add(_amount);
+      supplies[_outcome] = supplies[_outcome].add(_amount);
+    }
+    controller.getAugurLite().logShareLedgerMinted(universe, shareTokens, _owner, _amount);
+    return true;
+  }
+
+  function burnCompleteSets(address _owner, uint256 _amount) external onlyMarket returns (bool) {
+    uint256 _numOutcomes = shareTokens.length;
+    for (uint256 _outcome = 0; _outcome < _numOutcomes; _outcome++) {
+      balances[_outcome][_owner] = balances[_outcome][_owner].sub(_amount);
+      supplies[_outcome] = supplies[_outcome].sub(_amount);
+    }
+    controller.getAugurLite().logShareLedgerBurned(universe, shareTokens, _owner, _amount);
+    return true;
+  }
+
+  // The share tokens check their own callers and send their own logs. The ledger only keeps the books for them
+  function createShares(uint256 _outcome, address _owner, uint256 _amount) external onlyShareToken(_outcome) returns (bool) {
+    balances[_outcome][_owner] = balances[_outcome][_owner].add(_amount);
+    supplies[_outcome] = supplies[_outcome].add(_amount);
+    return true;
+  }
+
+  function destroyShares(uint256 _outcome, address _owner, uint256 _amount) external onlyShareToken(_outcome) returns (bool) {
+    balances[_outcome][_owner] = balances[_outcome][_owner].sub(_amount);
+    supplies[_outcome] = supplies[_outcome].sub(_amount);
+    return true;
+  }
+
+  function transfer(uint256 _outcome, address _from, address _to, uint256 _value) external onlyShareToken(_outcome) returns (bool) {
+    balances[_outcome][_from] = balances[_outcome][_from].sub(_value);
+    balances[_outcome][_to] = balances[_outcome][_to].add(_value);
+    return true;
+  }
+
+  function balanceOf(uint256 _outcome, address _owner) public view returns (uint256) {
+    return balances[_outcome][_owner];
+  }
+
+  function balancesOf(address _owner) public view returns (uint256[] _balances) {
+    _balances = new uint256[](shareTokens.length);
+    for (uint256 _outcome = 0; _outcome < _balances.length; _outcome++) {
+      _balances[_outcome] = balances[_outcome][_owner];
+    }
+    return _balances;
+  }
+
+  function totalSupply(uint256 _outcome) public view returns (uint256) {
+    return supplies[_outcome];
+  }
+
+  function getMarket() external view returns (IMarket) {
+    return market;
+  }
+
+  function getShareToken(uint256 _outcome) public view returns (IShareToken) {
+    return shareTokens[_outcome];
+  }
+
+  function getTypeName() public view returns (bytes32) {
+    return "ShareLedger";
+  }
+}
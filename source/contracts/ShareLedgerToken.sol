@@ -0,0 +1,116 @@
+pragma solidity 0.4.26;
+
+import 'IMarket.sol';
+import 'IShareLedger.sol';
+import 'IShareToken.sol';
+import 'libraries/DelegationTarget.sol';
+import 'libraries/ITyped.sol';
+import 'libraries/Initializable.sol';
+import 'libraries/math/SafeMathUint256.sol';
+
+
+/**
+ * @title ShareLedgerToken
+ * @dev ERC20 view of a single outcome of a ShareLedger. Balances live in the ledger; allowances, events and permissions work like they do on ShareToken
+ */
+contract ShareLedgerToken is DelegationTarget, ITyped, Initializable, IShareToken {
+  using SafeMathUint256 for uint256;
+
+  string constant public name = "Shares";
+  uint8 constant public decimals = 0;
+  string constant public symbol = "SHARE";
+
+  // Approvals of this amount are simply considered an everlasting approval which is not decremented when transfers occur
+  uint256 public constant ETERNAL_APPROVAL_VALUE = 2 ** 256 - 1;
+
+  event Mint(address indexed target, uint256 value);
+  event Burn(address indexed target, uint256 value);
+
+  IMarket private market;
+  uint256 private outcome;
+  IShareLedger private ledger;
+  mapping (address => mapping (address => uint256)) private allowed;
+
+  modifier onlyMarket {
+    require(IMarket(msg.sender) == market, "Sender is not the market");
+    _;
+  }
+
+  // Created by the ShareLedgerTokenFactory and initialized by the ledger in the same call, which makes the ledger the only place this token's balances are kept
+  function initialize(IMarket _market, uint256 _outcome) external beforeInitialized returns (bool) {
+    endInitialization();
+    market = _market;
+    outcome = _outcome;
+    ledger = IShareLedger(msg.sender);
+    return true;
+  }
+
+  function createShares(address _owner, uint256 _fxpValue) external onlyMarket returns (bool) {
+    ledger.createShares(outcome, _owner, _fxpValue);
+    emit Mint(_owner, _fxpValue);
+    emit Transfer(address(0), _owner, _fxpValue);
+    controller.getAugurLite().logShareTokenMinted(market.getUniverse(), _owner, _fxpValue);
+    return true;
+  }
+
+  function destroyShares(address _owner, uint256 _fxpValue) external onlyMarket returns (bool) {
+    ledger.destroyShares(outcome, _owner, _fxpValue);
+    emit Burn(_owner, _fxpValue);
+    emit Transfer(_owner, address(0), _fxpValue);
+    controller.getAugurLite().logShareTokenBurned(market.getUniverse(), _owner, _fxpValue);
+    return true;
+  }
+
+  function transfer(address _to, uint256 _value) public returns (bool) {
+    return internalTransfer(msg.sender, _to, _value);
+  }
+
+  function transferFrom(address _from, address _to, uint256 _value) public returns (bool) {
+    uint256 _allowance = allowed[_from][msg.sender];
+    if (_allowance != ETERNAL_APPROVAL_VALUE) {
+      allowed[_from][msg.sender] = _allowance.sub(_value);
+    }
+    return internalTransfer(_from, _to, _value);
+  }
+
+  function approve(address _spender, uint256 _value) public returns (bool) {
+    allowed[msg.sender][_spender] = _value;
+    emit Approval(msg.sender, _spender, _value);
+    return true;
+  }
+
+  function allowance(address _owner, address _spender) public view returns (uint256) {
+    return allowed[_owner][_spender];
+  }
+
+  function balanceOf(address _owner) public view returns (uint256) {
+    return ledger.balanceOf(outcome, _owner);
+  }
+
+  function totalSupply() public view returns (uint256) {
+    return ledger.totalSupply(outcome);
+  }
+
+  function getTypeName() public view returns (bytes32) {
+    return "ShareToken";
+  }
+
+  function getMarket() external view returns (IMarket) {
+    return market;
+  }
+
+  function getOutcome() external view returns (uint256) {
+    return outcome;
+  }
+
+  function getShareLedger() public view returns (IShareLedger) {
+    return ledger;
+  }
+
+  function internalTransfer(address _from, address _to, uint256 _value) private returns (bool) {
+    ledger.transfer(outcome, _from, _to, _value);
+    emit Transfer(_from, _to, _value);
+    controller.getAugurLite().logShareTokensTransferred(market.getUniverse(), _from, _to, _value);
+    return true;
+  }
+}
@@ -17,6 +17,12 @@ contract ShareToken is DelegationTarget, ITyped, Initializable, VariableSupplyTo
   IMarket private market;
   uint256 private outcome;
 
+  // Every mint and burn goes through the market, which checks its own caller against the whitelist and keeps open interest in step with the supply
+  modifier onlyMarket {
+    require(IMarket(msg.sender) == market, "Sender is not the market");
+    _;
+  }
+
   function initialize(IMarket _market, uint256 _outcome) external beforeInitialized returns(bool) {
     endInitialization();
     market = _market;
@@ -24,12 +30,12 @@ contract ShareToken is DelegationTarget, ITyped, Initializable, VariableSupplyTo
     return true;
   }
 
-  function createShares(address _owner, uint256 _fxpValue) external onlyWhitelistedCallers returns(bool) {
+  function createShares(address _owner, uint256 _fxpValue) external onlyMarket returns(bool) {
     mint(_owner, _fxpValue);
     return true;
   }
 
-  function destroyShares(address _owner, uint256 _fxpValue) external onlyWhitelistedCallers returns(bool) {
+  function destroyShares(address _owner, uint256 _fxpValue) external onlyMarket returns(bool) {
     burn(_owner, _fxpValue);
     return true;
   }
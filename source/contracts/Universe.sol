@@ -1,5 +1,6 @@
 pragma solidity 0.4.26;
 
+import 'IAugurLite.sol';
 import 'IMarket.sol';
 import 'IUniverse.sol';
 import 'libraries/DelegationTarget.sol';
@@ -13,6 +14,38 @@ import 'factories/MarketFactory.sol';
 contract Universe is DelegationTarget, Initializable, ITyped, IUniverse {
   using SafeMathUint256 for uint256;
 
+  uint256 private constant DEFAULT_NUM_TICKS = 10000;
+  int256 private constant DEFAULT_MAX_PRICE = 1 ether;
+  // Entries of createMarkets' _values array per market, see there for the layout
+  uint256 private constant MARKET_SPEC_VALUES = 7;
+
+  struct MarketSpec {
+    IMarket.MarketType marketType;
+    uint256 endTime;
+    uint256 feeDivisor;
+    address oracle;
+    uint256 numOutcomes;
+    uint256 numTicks;
+    int256 minPrice;
+    int256 maxPrice;
+    bytes32[] outcomes;
+    bytes32 topic;
+    string description;
+    string extraInfo;
+  }
+
+  // The arrays createMarkets was called with, plus how far into the variable length ones the markets read so far reach
+  struct MarketSpecs {
+    address[] oracles;
+    uint256[] values;
+    int256[] prices;
+    bytes32[] topics;
+    bytes32[] outcomes;
+    bytes text;
+    uint256 outcomeOffset;
+    uint256 textOffset;
+  }
+
   mapping(address => bool) private markets;
   ERC20 private denominationToken;
 
@@ -47,32 +80,142 @@ contract Universe is DelegationTarget, Initializable, ITyped, IUniverse {
   }
 
   function createYesNoMarket(uint256 _endTime, uint256 _feeDivisor, ERC20 _denominationToken, address _oracle, bytes32 _topic, string _description, string _extraInfo) public onlyInGoodTimes returns (IMarket _newMarket) {
-    require(bytes(_description).length > 0, "Description is empty");
-    _newMarket = createMarketInternal(_endTime, _feeDivisor, _denominationToken, _oracle, msg.sender, 2, 10000);
-    controller.getAugurLite().logMarketCreated(_topic, _description, _extraInfo, this, _newMarket, msg.sender, 0, 1 ether, IMarket.MarketType.YES_NO);
-    return _newMarket;
+    MarketSpec memory _spec;
+    _spec.marketType = IMarket.MarketType.YES_NO;
+    _spec.endTime = _endTime;
+    _spec.feeDivisor = _feeDivisor;
+    _spec.oracle = _oracle;
+    _spec.numOutcomes = 2;
+    _spec.numTicks = DEFAULT_NUM_TICKS;
+    _spec.maxPrice = DEFAULT_MAX_PRICE;
+    _spec.topic = _topic;
+    _spec.description = _description;
+    _spec.extraInfo = _extraInfo;
+    return createMarketFromSpec(_denominationToken, _spec, MarketFactory(controller.lookup("MarketFactory")), controller.getAugurLite());
   }
 
   function createCategoricalMarket(uint256 _endTime, uint256 _feeDivisor, ERC20 _denominationToken, address _oracle, bytes32[] _outcomes, bytes32 _topic, string _description, string _extraInfo) public onlyInGoodTimes returns (IMarket _newMarket) {
-    require(bytes(_description).length > 0, "Description is empty");
-    _newMarket = createMarketInternal(_endTime, _feeDivisor, _denominationToken, _oracle, msg.sender, uint256(_outcomes.length), 10000);
-    controller.getAugurLite().logMarketCreated(_topic, _description, _extraInfo, this, _newMarket, msg.sender, _outcomes, 0, 1 ether, IMarket.MarketType.CATEGORICAL);
-    return _newMarket;
+    MarketSpec memory _spec;
+    _spec.marketType = IMarket.MarketType.CATEGORICAL;
+    _spec.endTime = _endTime;
+    _spec.feeDivisor = _feeDivisor;
+    _spec.oracle = _oracle;
+    _spec.numOutcomes = _outcomes.length;
+    _spec.numTicks = DEFAULT_NUM_TICKS;
+    _spec.maxPrice = DEFAULT_MAX_PRICE;
+    _spec.outcomes = _outcomes;
+    _spec.topic = _topic;
+    _spec.description = _description;
+    _spec.extraInfo = _extraInfo;
+    return createMarketFromSpec(_denominationToken, _spec, MarketFactory(controller.lookup("MarketFactory")), controller.getAugurLite());
   }
 
   function createScalarMarket(uint256 _endTime, uint256 _feeDivisor, ERC20 _denominationToken, address _oracle, int256 _minPrice, int256 _maxPrice, uint256 _numTicks, bytes32 _topic, string _description, string _extraInfo) public onlyInGoodTimes returns (IMarket _newMarket) {
-    require(bytes(_description).length > 0, "Description is empty");
-    require(_minPrice < _maxPrice, "Min price needs to be less than max price");
-    require(_numTicks.isMultipleOf(2), "numTicks needs to a multiple of 2");
-    _newMarket = createMarketInternal(_endTime, _feeDivisor, _denominationToken, _oracle, msg.sender, 2, _numTicks);
-    controller.getAugurLite().logMarketCreated(_topic, _description, _extraInfo, this, _newMarket, msg.sender, _minPrice, _maxPrice, IMarket.MarketType.SCALAR);
-    return _newMarket;
+    MarketSpec memory _spec;
+    _spec.marketType = IMarket.MarketType.SCALAR;
+    _spec.endTime = _endTime;
+    _spec.feeDivisor = _feeDivisor;
+    _spec.oracle = _oracle;
+    _spec.numOutcomes = 2;
+    _spec.numTicks = _numTicks;
+    _spec.minPrice = _minPrice;
+    _spec.maxPrice = _maxPrice;
+    _spec.topic = _topic;
+    _spec.description = _description;
+    _spec.extraInfo = _extraInfo;
+    return createMarketFromSpec(_denominationToken, _spec, MarketFactory(controller.lookup("MarketFactory")), controller.getAugurLite());
   }
 
-  function createMarketInternal(uint256 _endTime, uint256 _feeDivisor, ERC20 _denominationToken, address _oracle, address _sender, uint256 _numOutcomes, uint256 _numTicks) private onlyInGoodTimes returns (IMarket _newMarket) {
+  // Creates several markets in the universe's denomination token in one transaction. Structs and string arrays can't be passed to public functions, so the markets are described by parallel arrays. For market i:
+  //   _values[7 * i] to _values[7 * i + 6]: marketType, endTime, feeDivisor, numTicks (scalar markets only), numOutcomes (categorical markets only), description length, extraInfo length
+  //   _prices[2 * i] and _prices[2 * i + 1]: minPrice and maxPrice (scalar markets only)
+  //   _oracles[i] and _topics[i]
+  //   categorical markets take the next numOutcomes entries of _outcomes, and every market takes the next description length and then extraInfo length bytes of _text
+  // Every market goes through the same checks and emits the same MarketCreated event as if it had been created on its own
+  function createMarkets(address[] _oracles, uint256[] _values, int256[] _prices, bytes32[] _topics, bytes32[] _outcomes, string _text) public onlyInGoodTimes returns (IMarket[] _newMarkets) {
+    require(_values.length == _oracles.length.mul(MARKET_SPEC_VALUES), "Wrong number of market spec values");
+    require(_prices.length == _oracles.length.mul(2), "Wrong number of market spec prices");
+    require(_topics.length == _oracles.length, "Wrong number of market spec topics");
+    MarketSpecs memory _specs;
+    _specs.oracles = _oracles;
+    _specs.values = _values;
+    _specs.prices = _prices;
+    _specs.topics = _topics;
+    _specs.outcomes = _outcomes;
+    _specs.text = bytes(_text);
     MarketFactory _marketFactory = MarketFactory(controller.lookup("MarketFactory"));
-    _newMarket = _marketFactory.createMarket(controller, this, _endTime, _feeDivisor, _denominationToken, _oracle, _sender, _numOutcomes, _numTicks);
+    IAugurLite _augurLite = controller.getAugurLite();
+    _newMarkets = new IMarket[](_oracles.length);
+    for (uint256 i = 0; i < _newMarkets.length; i++) {
+      _newMarkets[i] = createMarketFromSpec(denominationToken, readMarketSpec(_specs, i), _marketFactory, _augurLite);
+    }
+    require(_specs.outcomeOffset == _outcomes.length, "Unused market spec outcomes");
+    require(_specs.textOffset == _specs.text.length, "Unused market spec text");
+    return _newMarkets;
+  }
+
+  function createMarketFromSpec(ERC20 _denominationToken, MarketSpec memory _spec, MarketFactory _marketFactory, IAugurLite _augurLite) private returns (IMarket _newMarket) {
+    require(bytes(_spec.description).length > 0, "Description is empty");
+    if (_spec.marketType == IMarket.MarketType.SCALAR) {
+      require(_spec.minPrice < _spec.maxPrice, "Min price needs to be less than max price");
+      require(_spec.numTicks.isMultipleOf(2), "numTicks needs to a multiple of 2");
+    }
+    _newMarket = _marketFactory.createMarket(controller, this, _spec.endTime, _spec.feeDivisor, _denominationToken, _spec.oracle, msg.sender, _spec.numOutcomes, _spec.numTicks);
     markets[address(_newMarket)] = true;
+    // The market only becomes legitimate here, after its initializer created the share tokens, so this is the earliest they can be registered. Deferred markets register theirs when they create them
+    _augurLite.registerShareTokens(_newMarket);
+    if (_spec.marketType == IMarket.MarketType.CATEGORICAL) {
+      _augurLite.logMarketCreated(_spec.topic, _spec.description, _spec.extraInfo, this, _newMarket, msg.sender, _spec.outcomes, _spec.minPrice, _spec.maxPrice, _spec.marketType);
+    } else {
+      _augurLite.logMarketCreated(_spec.topic, _spec.description, _spec.extraInfo, this, _newMarket, msg.sender, _spec.minPrice, _spec.maxPrice, _spec.marketType);
+    }
     return _newMarket;
   }
+
+  function readMarketSpec(MarketSpecs memory _specs, uint256 _index) private pure returns (MarketSpec memory _spec) {
+    uint256 _valueOffset = _index * MARKET_SPEC_VALUES;
+    require(_specs.values[_valueOffset] <= uint256(IMarket.MarketType.SCALAR), "Invalid market type");
+    _spec.marketType = IMarket.MarketType(_specs.values[_valueOffset]);
+    _spec.endTime = _specs.values[_valueOffset + 1];
+    _spec.feeDivisor = _specs.values[_valueOffset + 2];
+    _spec.oracle = _specs.oracles[_index];
+    _spec.numOutcomes = 2;
+    _spec.numTicks = DEFAULT_NUM_TICKS;
+    _spec.maxPrice = DEFAULT_MAX_PRICE;
+    _spec.topic = _specs.topics[_index];
+    if (_spec.marketType == IMarket.MarketType.SCALAR) {
+      _spec.numTicks = _specs.values[_valueOffset + 3];
+      _spec.minPrice = _specs.prices[_index * 2];
+      _spec.maxPrice = _specs.prices[_index * 2 + 1];
+    } else if (_spec.marketType == IMarket.MarketType.CATEGORICAL) {
+      _spec.numOutcomes = _specs.values[_valueOffset + 4];
+      require(_specs.outcomeOffset.add(_spec.numOutcomes) <= _specs.outcomes.length, "Not enough market spec outcomes");
+      _spec.outcomes = new bytes32[](_spec.numOutcomes);
+      for (uint256 _outcome = 0; _outcome < _spec.numOutcomes; _outcome++) {
+        _spec.outcomes[_outcome] = _specs.outcomes[_specs.outcomeOffset + _outcome];
+      }
+      _specs.outcomeOffset += _spec.numOutcomes;
+    }
+    _spec.description = string(readMarketSpecText(_specs, _specs.values[_valueOffset + 5]));
+    _spec.extraInfo = string(readMarketSpecText(_specs, _specs.values[_valueOffset + 6]));
+    return _spec;
+  }
+
+  function readMarketSpecText(MarketSpecs memory _specs, uint256 _length) private pure returns (bytes memory _slice) {
+    uint256 _offset = _specs.textOffset;
+    require(_offset.add(_length) <= _specs.text.length, "Not enough market spec text");
+    bytes memory _text = _specs.text;
+    _slice = new bytes(_length);
+    // Copies a word at a time. The last word may carry bytes past the slice into its padding, so the word after the data is cleared again
+    assembly {
+      let _source := add(add(_text, 32), _offset)
+      let _target := add(_slice, 32)
+      for { let i := 0 } lt(i, _length) { i := add(i, 32) } {
+        mstore(add(_target, i), mload(add(_source, i)))
+      }
+      mstore(add(_target, _length), 0)
+    }
+    _specs.textOffset = _offset + _length;
+    return _slice;
+  }
 }
@@ -0,0 +1,16 @@
+pragma solidity 0.4.26;
+
+import 'IMailbox.sol';
+import 'IMarket.sol';
+import 'IController.sol';
+import 'libraries/CloneFactory.sol';
+
+
+contract MailboxCloneFactory is CloneFactory {
+  function createMailbox(IController _controller, address _owner, IMarket _market) public returns (IMailbox) {
+    address _clone = createClone(_controller.lookup("Mailbox"), _controller, "Mailbox");
+    IMailbox _mailbox = IMailbox(_clone);
+    _mailbox.initialize(_owner, _market);
+    return _mailbox;
+  }
+}
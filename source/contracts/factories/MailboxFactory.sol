@@ -3,12 +3,12 @@ pragma solidity 0.4.26;
 import 'IMailbox.sol';
 import 'IMarket.sol';
 import 'IController.sol';
-import 'libraries/Delegator.sol';
+import 'libraries/CachedDelegator.sol';
 
 
 contract MailboxFactory {
   function createMailbox(IController _controller, address _owner, IMarket _market) public returns (IMailbox) {
-    Delegator _delegator = new Delegator(_controller, "Mailbox");
+    CachedDelegator _delegator = new CachedDelegator(_controller, "Mailbox");
     IMailbox _mailbox = IMailbox(_delegator);
     _mailbox.initialize(_owner, _market);
     return _mailbox;
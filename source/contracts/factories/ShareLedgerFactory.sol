@@ -0,0 +1,16 @@
+pragma solidity 0.4.26;
+
+import 'IMarket.sol';
+import 'IController.sol';
+import 'IShareLedger.sol';
+import 'libraries/CachedDelegator.sol';
+
+
+contract ShareLedgerFactory {
+  function createShareLedger(IController _controller, IMarket _market, uint256 _numOutcomes) public returns (IShareLedger) {
+    CachedDelegator _delegator = new CachedDelegator(_controller, "ShareLedger");
+    IShareLedger _shareLedger = IShareLedger(_delegator);
+    _shareLedger.initialize(_market, _numOutcomes);
+    return _shareLedger;
+  }
+}
@@ -0,0 +1,14 @@
+pragma solidity 0.4.26;
+
+import 'IController.sol';
+import 'IShareToken.sol';
+import 'libraries/CachedDelegator.sol';
+
+
+contract ShareLedgerTokenFactory {
+  // The calling ledger initializes the token in the same call, since the token keeps its balances in whichever ledger initialized it
+  function createShareLedgerToken(IController _controller) public returns (IShareToken) {
+    CachedDelegator _delegator = new CachedDelegator(_controller, "ShareLedgerToken");
+    return IShareToken(_delegator);
+  }
+}
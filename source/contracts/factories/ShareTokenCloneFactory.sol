@@ -0,0 +1,15 @@
+pragma solidity 0.4.26;
+
+import 'IMarket.sol';
+import 'IController.sol';
+import 'libraries/CloneFactory.sol';
+
+
+contract ShareTokenCloneFactory is CloneFactory {
+  function createShareToken(IController _controller, IMarket _market, uint256 _outcome) public returns (IShareToken) {
+    address _clone = createClone(_controller.lookup("ShareToken"), _controller, "ShareToken");
+    IShareToken _shareToken = IShareToken(_clone);
+    _shareToken.initialize(_market, _outcome);
+    return _shareToken;
+  }
+}
@@ -2,12 +2,12 @@ pragma solidity 0.4.26;
 
 import 'IMarket.sol';
 import 'IController.sol';
-import 'libraries/Delegator.sol';
+import 'libraries/CachedDelegator.sol';
 
 
 contract ShareTokenFactory {
   function createShareToken(IController _controller, IMarket _market, uint256 _outcome) public returns (IShareToken) {
-    Delegator _delegator = new Delegator(_controller, "ShareToken");
+    CachedDelegator _delegator = new CachedDelegator(_controller, "ShareToken");
     IShareToken _shareToken = IShareToken(_delegator);
     _shareToken.initialize(_market, _outcome);
     return _shareToken;
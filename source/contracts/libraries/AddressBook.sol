@@ -0,0 +1,35 @@
+pragma solidity 0.4.26;
+
+import 'Controlled.sol';
+import 'IAugurLite.sol';
+import 'ITime.sol';
+
+
+/**
+ * @title AddressBook
+ * @dev Keeps the registered contracts used on every user operation in local storage so they don't have to be looked up through the controller on each call. They are resolved when the controller is set and only change through refreshAddressBook.
+ */
+contract AddressBook is Controlled {
+  IAugurLite internal augurLite;
+  ITime internal time;
+
+  function setController(IController _controller) public onlyControllerCaller returns (bool) {
+    controller = _controller;
+    return loadAddressBook();
+  }
+
+  // Call this after AugurLite or Time are registered again
+  function refreshAddressBook() public onlyWhitelistedCallers returns (bool) {
+    return loadAddressBook();
+  }
+
+  function getAddressBook() public view returns (IAugurLite _augurLite, ITime _time) {
+    return (augurLite, time);
+  }
+
+  function loadAddressBook() private returns (bool) {
+    augurLite = controller.getAugurLite();
+    time = ITime(controller.lookup("Time"));
+    return true;
+  }
+}
@@ -0,0 +1,76 @@
+pragma solidity 0.4.26;
+
+import 'IController.sol';
+import 'libraries/DelegationTarget.sol';
+
+
+/**
+ * @title CachedDelegator
+ * @dev A Delegator that resolves its delegation target through the controller once and keeps it, instead of looking it up on every call. The cached target only changes through refreshDelegationTarget.
+ */
+contract CachedDelegator is DelegationTarget {
+  // keccak256("augurlite.cachedDelegator.delegationTarget"). The delegation target lays out its own storage from slot 0, so the cached address lives far away from it
+  bytes32 private constant DELEGATION_TARGET_SLOT = 0xf49d6cfc931f2402d54c315f03b7a93476812bcdb064765325e3c5d94603f00c;
+
+  constructor(IController _controller, bytes32 _controllerLookupName) public {
+    controller = _controller;
+    controllerLookupName = _controllerLookupName;
+    setDelegationTarget(_controller.lookup(_controllerLookupName));
+  }
+
+  function() external payable {
+    address _target = getDelegationTarget();
+
+    // Do nothing if we haven't properly set up the delegator to delegate calls
+    if (_target == address(0)) {
+      return;
+    }
+
+    assembly {
+      //0x40 is the address where the next free memory slot is stored in Solidity
+      let _calldataMemoryOffset := mload(0x40)
+      // new "memory end" including padding. The bitwise operations here ensure we get rounded up to the nearest 32 byte boundary
+      let _size := and(add(calldatasize, 0x1f), not(0x1f))
+      // Update the pointer at 0x40 to point at new free memory location so any theoretical allocation doesn't stomp our memory in this call
+      mstore(0x40, add(_calldataMemoryOffset, _size))
+      // Copy method signature and parameters of this call into memory
+      calldatacopy(_calldataMemoryOffset, 0x0, calldatasize)
+      // Call the actual method via delegation
+      let _retval := delegatecall(gas, _target, _calldataMemoryOffset, calldatasize, 0, 0)
+      switch _retval
+      case 0 {
+        // 0 == it threw, so we revert
+        revert(0,0)
+      } default {
+        // If the call succeeded return the return data from the delegate call
+        let _returndataMemoryOffset := mload(0x40)
+        // Update the pointer at 0x40 again to point at new free memory location so any theoretical allocation doesn't stomp our memory in this call
+        mstore(0x40, add(_returndataMemoryOffset, returndatasize))
+        returndatacopy(_returndataMemoryOffset, 0x0, returndatasize)
+        return(_returndataMemoryOffset, returndatasize)
+      }
+    }
+  }
+
+  // Call this after the contract registered under controllerLookupName changes, or after moving to a new controller
+  function refreshDelegationTarget() public onlyWhitelistedCallers returns (bool) {
+    setDelegationTarget(controller.lookup(controllerLookupName));
+    return true;
+  }
+
+  function getDelegationTarget() public view returns (address _target) {
+    bytes32 _slot = DELEGATION_TARGET_SLOT;
+    assembly {
+      _target := sload(_slot)
+    }
+    return _target;
+  }
+
+  function setDelegationTarget(address _target) private returns (bool) {
+    bytes32 _slot = DELEGATION_TARGET_SLOT;
+    assembly {
+      sstore(_slot, _target)
+    }
+    return true;
+  }
+}
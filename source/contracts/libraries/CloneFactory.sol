@@ -0,0 +1,33 @@
+pragma solidity 0.4.26;
+
+import 'IController.sol';
+
+
+/**
+ * @title CloneFactory
+ * @dev Deploys EIP-1167 minimal proxies: 45 bytes of fixed runtime code that DELEGATECALL every call to a hardcoded target
+ */
+contract CloneFactory {
+  // Like Delegator's constructor, the init code of every clone writes the controller and lookup name into the first two storage slots, which every DelegationTarget lays out as controller and controllerLookupName. Clones are therefore never left without a controller for anyone else to set
+  function createClone(address _target, IController _controller, bytes32 _controllerLookupName) internal returns (address _clone) {
+    bytes20 _targetBytes = bytes20(_target);
+    bytes20 _controllerBytes = bytes20(address(_controller));
+    assembly {
+      let _code := mload(0x40)
+      // PUSH20 _controller PUSH1 0 SSTORE
+      mstore(_code, 0x7300000000000000000000000000000000000000000000000000000000000000)
+      mstore(add(_code, 0x01), _controllerBytes)
+      // PUSH32 _controllerLookupName PUSH1 1 SSTORE
+      mstore(add(_code, 0x15), 0x6000557f00000000000000000000000000000000000000000000000000000000)
+      mstore(add(_code, 0x19), _controllerLookupName)
+      // Then the EIP-1167 init code, which copies the runtime code from offset 0x46 instead of 0x0a, followed by the first half of the runtime code, up to the PUSH20 of the target
+      mstore(add(_code, 0x39), 0x6001553d602d8060463d3981f3363d3d373d3d3d363d73000000000000000000)
+      mstore(add(_code, 0x50), _targetBytes)
+      // The rest of the runtime code, which bubbles up the return data or the revert
+      mstore(add(_code, 0x64), 0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000)
+      _clone := create(0, _code, 0x73)
+    }
+    require(_clone != address(0), "Clone creation failed");
+    return _clone;
+  }
+}
@@ -2,14 +2,29 @@ pragma solidity 0.4.26;
 
 import 'IMarket.sol';
 import 'IUniverse.sol';
-import 'Controlled.sol';
+import 'libraries/AddressBook.sol';
 
 
-contract MarketValidator is Controlled {
+contract MarketValidator is AddressBook {
   modifier marketIsLegit(IMarket _market) {
+    requireMarketIsLegit(_market);
+    _;
+  }
+
+  function requireMarketIsLegit(IMarket _market) internal view returns (IUniverse) {
     IUniverse _universe = _market.getUniverse();
-    require(controller.getAugurLite().isKnownUniverse(_universe), "The universe is not known");
+    require(augurLite.isKnownUniverse(_universe), "The universe is not known");
     require(_universe.isContainerForMarket(_market), "Market does not belong to the universe");
-    _;
+    return _universe;
+  }
+
+  // For checking a list of markets: a universe that was already found to be known doesn't need to be looked up again
+  function requireMarketIsLegit(IMarket _market, IUniverse _knownUniverse) internal view returns (IUniverse) {
+    IUniverse _universe = _market.getUniverse();
+    if (_universe != _knownUniverse) {
+      require(augurLite.isKnownUniverse(_universe), "The universe is not known");
+    }
+    require(_universe.isContainerForMarket(_market), "Market does not belong to the universe");
+    return _universe;
   }
 }
@@ -236,6 +236,17 @@ Deploying to: ${networkConfiguration.networkName}
     )
       return;
     if (contractName === "AugurLite") return;
+    if (contractName.endsWith("CloneFactory")) return;
+    // Clone factories are registered under the regular factory names so markets pick them up without any lookup changes
+    if (
+      this.configuration.useMinimalProxies &&
+      ["MarketFactory", "MailboxFactory", "ShareTokenFactory"].includes(
+        contractName
+      )
+    )
+      contract = this.contracts.get(
+        contractName.replace("Factory", "CloneFactory")
+      );
     if (contractName === "Time")
       contract = this.configuration.useNormalTime
         ? contract
@@ -245,11 +256,12 @@ Deploying to: ${networkConfiguration.networkName}
       contract.relativeFilePath.startsWith("libraries/")
     )
       return;
-    // Check to see if we have already uploded this version of the contract
+    // Check to see if we have already uploded this version of the contract. Swapped contracts such as the clone factories are registered under contractName, not their own name
     if (
       typeof this.configuration.controllerAddress !== "undefined" &&
       (await this.shouldSkipUploadingContract(
         contract,
+        contractName,
         contractsToDelegate[contractName]
       ))
     ) {
@@ -259,19 +271,36 @@ Deploying to: ${networkConfiguration.networkName}
       console.log(`Uploading new version of contract for ${contractName}`);
       contract.address = contractsToDelegate[contractName]
         ? await this.uploadAndAddDelegatedToController(contract)
-        : await this.uploadAndAddToController(contract, contractName);
+        : await this.uploadAndAddToController(
+            contract,
+            contractName,
+            this.getConstructorArgs(contractName)
+          );
     }
   }
 
+  // Market factories pass the market options from the configuration to every market they create
+  private getConstructorArgs(contractName: string): Array<any> {
+    if (contractName === "MarketFactory")
+      return [
+        this.configuration.deferMarketAssets,
+        this.configuration.useShareLedger
+      ];
+    return [];
+  }
+
   private async shouldSkipUploadingContract(
     contract: Contract,
+    registrationContractName: string,
     isDelegated: boolean
   ): Promise<boolean> {
     const bytecodeHash = await ContractDeployer.getBytecodeSha(
       contract.bytecode
     );
     const key = stringTo32ByteHex(
-      isDelegated ? `${contract.contractName}Target` : contract.contractName
+      isDelegated
+        ? `${registrationContractName}Target`
+        : registrationContractName
     );
     const contractDetails = await this.controller.getContractDetails_(key);
     const previouslyUploadedBytecodeHash = contractDetails[2];
@@ -372,7 +401,11 @@ Deploying to: ${networkConfiguration.networkName}
   private async whitelistTradingContracts(): Promise<void> {
     console.log("Whitelisting contracts...");
     const promises: Array<Promise<any>> = [];
-    const contractsToWhitelist = ["ClaimTradingProceeds", "CompleteSets"];
+    const contractsToWhitelist = [
+      "ClaimTradingProceeds",
+      "CompleteSets",
+      "MarketResolver"
+    ];
     for (let contract of this.contracts) {
       if (!contractsToWhitelist.includes(contract.contractName)) continue;
       if (contract.address === undefined)
@@ -404,7 +437,8 @@ Deploying to: ${networkConfiguration.networkName}
     const contractsToInitialize = [
       "CompleteSets",
       "Time",
-      "ClaimTradingProceeds"
+      "ClaimTradingProceeds",
+      "MarketResolver"
     ];
     const promises: Array<Promise<any>> = [];
     for (let contractName of contractsToInitialize) {
@@ -487,6 +521,7 @@ Deploying to: ${networkConfiguration.networkName}
     const tradingContracts = [
       "ClaimTradingProceeds",
       "CompleteSets",
+      "MarketResolver",
       "ShareToken"
     ];
 
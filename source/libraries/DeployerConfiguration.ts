@@ -15,6 +15,9 @@ export class DeployerConfiguration {
   public readonly useNormalTime: boolean;
   public readonly isProduction: boolean;
   public readonly genesisDenominationTokenAddress: string | undefined;
+  public readonly useMinimalProxies: boolean;
+  public readonly useShareLedger: boolean;
+  public readonly deferMarketAssets: boolean;
 
   public constructor(
     contractInputRoot: string,
@@ -23,13 +26,19 @@ export class DeployerConfiguration {
     createGenesisUniverse: boolean = true,
     isProduction: boolean = false,
     useNormalTime: boolean = true,
-    genesisDenominationTokenAddress: string | undefined
+    genesisDenominationTokenAddress: string | undefined,
+    useMinimalProxies: boolean = false,
+    useShareLedger: boolean = false,
+    deferMarketAssets: boolean = false
   ) {
     this.isProduction = isProduction;
     this.controllerAddress = controllerAddress;
     this.genesisDenominationTokenAddress = genesisDenominationTokenAddress;
     this.createGenesisUniverse = createGenesisUniverse;
     this.useNormalTime = isProduction || useNormalTime;
+    this.useMinimalProxies = useMinimalProxies;
+    this.useShareLedger = useShareLedger;
+    this.deferMarketAssets = deferMarketAssets;
 
     this.contractAddressesOutputPath = path.join(
       artifactOutputRoot,
@@ -65,6 +74,9 @@ export class DeployerConfiguration {
         : isProduction;
     const genesisDenominationTokenAddress =
       process.env.GENESIS_DENOMINATION_TOKEN_ADDRESS;
+    const useMinimalProxies = process.env.USE_MINIMAL_PROXIES === "true";
+    const useShareLedger = process.env.USE_SHARE_LEDGER === "true";
+    const deferMarketAssets = process.env.DEFER_MARKET_ASSETS === "true";
 
     if (
       isProduction &&
@@ -80,7 +92,10 @@ export class DeployerConfiguration {
       createGenesisUniverse,
       isProduction,
       useNormalTime,
-      genesisDenominationTokenAddress
+      genesisDenominationTokenAddress,
+      useMinimalProxies,
+      useShareLedger,
+      deferMarketAssets
     );
   }
 
@@ -104,6 +119,9 @@ export class DeployerConfiguration {
         : isProduction;
     const genesisDenominationTokenAddress =
       process.env.GENESIS_DENOMINATION_TOKEN_ADDRESS;
+    const useMinimalProxies = process.env.USE_MINIMAL_PROXIES === "true";
+    const useShareLedger = process.env.USE_SHARE_LEDGER === "true";
+    const deferMarketAssets = process.env.DEFER_MARKET_ASSETS === "true";
 
     if (
       isProduction &&
@@ -119,7 +137,10 @@ export class DeployerConfiguration {
       createGenesisUniverse,
       isProduction,
       useNormalTime,
-      genesisDenominationTokenAddress
+      genesisDenominationTokenAddress,
+      useMinimalProxies,
+      useShareLedger,
+      deferMarketAssets
     );
   }
 }
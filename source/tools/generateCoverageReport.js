@@ -1,14 +1,21 @@
 #!/usr/bin/env node
 
-// NOTE: Make sure to run with --max-old-space-size=12288. We're loading a massive file into memory during report generation
+// Fired events are streamed into the coverage map in batches, so this runs with the default heap
 
 const App = require("solidity-coverage/lib/app.js");
+const istanbul = require("istanbul");
 const death = require("death");
 const { execSync } = require("child_process");
 const copydir = require("copy-dir");
 const replace = require("replace");
 const rimraf = require("rimraf");
 const fs = require("fs");
+const path = require("path");
+const readline = require("readline");
+const zlib = require("zlib");
+
+const EVENT_BATCH_SIZE = 10000;
+const FIRED_EVENTS_FILE = /^allFiredEvents(-gw\d+)?$/;
 
 const config = {
   dir: "./source",
@@ -42,16 +49,91 @@ replace({
   silent: false
 });
 
+function isGzipped(filePath) {
+  const fd = fs.openSync(filePath, "r");
+  const header = Buffer.alloc(2);
+  const bytesRead = fs.readSync(fd, header, 0, 2, 0);
+  fs.closeSync(fd);
+  return bytesRead === 2 && header[0] === 0x1f && header[1] === 0x8b;
+}
+
+// Feeds events to the coverage map a batch at a time so only one batch is ever held in memory
+function streamFiredEvents(filePath, coverageMap) {
+  return new Promise((resolve, reject) => {
+    let input = fs.createReadStream(filePath).on("error", reject);
+    if (isGzipped(filePath)) {
+      input = input.pipe(zlib.createGunzip()).on("error", reject);
+    }
+    let batch = [];
+    readline
+      .createInterface({ input })
+      .on("line", line => {
+        if (!line) return;
+        batch.push(line);
+        if (batch.length >= EVENT_BATCH_SIZE) {
+          coverageMap.generate(batch, "./");
+          batch = [];
+        }
+      })
+      .on("close", () => {
+        coverageMap.generate(batch, "./");
+        resolve();
+      });
+  });
+}
+
+// The coverage map is keyed by the absolute paths of the instrumented copies in coverageEnv. Like App.makeKeysRelative, this keys it by the original files relative to the working directory instead, so the reports point at source/contracts and tests/solidity_test_helpers
+function makeKeysRelative(coverage) {
+  const coverageEnv = path.resolve("./coverageEnv");
+  const relativeCoverage = {};
+  Object.keys(coverage).forEach(pathKey => {
+    let sourcePath = path.resolve(pathKey);
+    if (sourcePath.startsWith(coverageEnv + path.sep)) {
+      const copiedPath = path.relative(coverageEnv, sourcePath);
+      sourcePath = copiedPath.startsWith("solidity_test_helpers" + path.sep)
+        ? path.resolve("./tests", copiedPath)
+        : path.resolve(config.dir, copiedPath);
+    }
+    const relativePath = path.relative(process.cwd(), sourcePath);
+    relativeCoverage[relativePath] = Object.assign({}, coverage[pathKey], {
+      path: relativePath
+    });
+  });
+  return relativeCoverage;
+}
+
+// Builds the istanbul reports straight from the coverage map. App.generateReport would read a single ./allFiredEvents file and count it again
+function writeReports(coverage) {
+  return new Promise(resolve => {
+    const collector = new istanbul.Collector();
+    const reporter = new istanbul.Reporter();
+    collector.add(makeKeysRelative(coverage));
+    reporter.addAll(["html", "lcov", "text"]);
+    reporter.write(collector, true, resolve);
+  });
+}
+
+async function generateReport() {
+  const firedEventsFiles = fs
+    .readdirSync(".")
+    .filter(filename => FIRED_EVENTS_FILE.test(filename));
+  for (const filename of firedEventsFiles) {
+    await streamFiredEvents("./" + filename, app.coverage);
+  }
+  await writeReports(app.coverage.coverage);
+
+  // Cleanup
+  rimraf.sync("./allFiredEvents*");
+  rimraf.sync("./scTopics");
+  rimraf.sync("./coverage.json");
+  rimraf.sync("./tests/compilation_cache");
+  app.cleanUp();
+}
+
 try {
   execSync("pytest --cover", { stdio: [0, 1, 2] });
 } catch (err) {
   console.log(err);
 }
 
-app.generateReport();
-
-// Cleanup
-rimraf.sync("./allFiredEvents");
-rimraf.sync("./scTopics");
-rimraf.sync("./coverage.json");
-rimraf.sync("./tests/compilation_cache");
+generateReport().catch(err => app.cleanUp(err));
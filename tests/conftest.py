@@ -11,12 +11,19 @@ from ethereum import vm
 import ethereum
 from io import open as io_open
 from json import dump as json_dump, load as json_load, dumps as json_dumps
-from os import path, walk, makedirs, listdir, remove as remove_file
+from os import environ, stat, path, walk, makedirs, listdir, rename, fdopen, remove as remove_file
+from multiprocessing import Pool, cpu_count
+from tempfile import mkstemp
 import pytest
 from re import findall
-from solc import compile_standard
+from solc import compile_standard, get_solc_version_string
 from utils import bytesToHexString, bytesToLong, longToHexString, stringToBytes, garbageBytes20, garbageBytes32, twentyZeros, thirtyTwoZeros
+from contextlib import contextmanager
 from copy import deepcopy
+from fcntl import flock, LOCK_EX, LOCK_UN
+from types import MethodType
+from zlib import compressobj, DEFLATED, MAX_WBITS
+from hashlib import sha256
 
 # Make TXs free.
 ethereum.opcodes.GCONTRACTBYTE = 0
@@ -43,6 +50,36 @@ BASE_PATH = path.dirname(path.abspath(__file__))
 def resolveRelativePath(relativeFilePath):
     return path.abspath(path.join(BASE_PATH, relativeFilePath))
 COMPILATION_CACHE = resolveRelativePath('./compilation_cache')
+REPOSITORY_PATH = resolveRelativePath('..')
+GAS_BASELINES = resolveRelativePath('./gas_baselines.json')
+SNAPSHOT_CACHE = path.join(COMPILATION_CACHE, 'snapshots')
+
+# json gives back unicode strings, pyethereum expects native ones
+def toNativeStrings(value):
+    if isinstance(value, dict):
+        return dict((toNativeStrings(key), toNativeStrings(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [toNativeStrings(item) for item in value]
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+# Module level so it can be pickled and shipped to compilation worker processes
+def compileStandardJson(compilerParameter):
+    return compile_standard(compilerParameter, allow_paths=resolveRelativePath("../"))['contracts']
+
+# Everything passed to solc besides the sources and remappings. Part of every compilation cache key.
+COMPILER_SETTINGS = {
+    'optimizer': {
+        'enabled': True,
+        'runs': 200
+    },
+    'outputSelection': {
+        "*": {
+            '*': [ 'metadata', 'evm.bytecode', 'evm.sourceMap', 'abi' ]
+        }
+    }
+}
 
 class bcolors:
     WARN = '\033[93m'
@@ -54,6 +91,10 @@ CONTRACT_SIZE_WARN_LEVEL = CONTRACT_SIZE_LIMIT * 0.75
 
 def pytest_addoption(parser):
     parser.addoption("--cover", action="store_true", help="Use the coverage enabled contracts. Meant to be used with the tools/generateCoverageReport.js script")
+    parser.addoption("--coverFormat", action="store", default="gzip", choices=["gzip", "json"], help="How --cover writes allFiredEvents: gzip-framed compact records (default) or plain JSON lines")
+    parser.addoption("--gasTolerance", action="store", type=float, default=0.0, help="Percentage over its baseline a gas benchmark may use before failing")
+    parser.addoption("--updateGasBaselines", action="store_true", help="Record the gas used by every benchmark that runs as its new baseline instead of checking it")
+    parser.addoption("--allowMissingGasBaselines", action="store_true", help="Only print the gas used by benchmarks that have no baseline yet instead of failing them")
     parser.addoption("--subFork", action="store_true", help="Use the coverage enabled contracts. Meant to be used with the tools/generateCoverageReport.js script")
 
 def pytest_configure(config):
@@ -61,133 +102,413 @@ def pytest_configure(config):
     config.addinivalue_line("markers",
         "cover: use coverage contracts")
 
+class CoverageEventSink(object):
+    # Collects the logs fired while running against the instrumented contracts. The file is opened once and written in batches, and each record keeps only the topics and data solidity-coverage reads. In gzip mode every batch is written as its own gzip member, so a run that dies midway still leaves a readable file.
+    BATCH_SIZE = 10000
+
+    def __init__(self, outputPath, compress):
+        self.outputPath = outputPath
+        self.compress = compress
+        self.pending = []
+        if path.isfile(outputPath):
+            remove_file(outputPath)
+        self.outputFile = open(outputPath, 'ab')
+
+    def write(self, message):
+        # Same encoding as Log.to_dict, without the bloom and address it would also compute
+        topics = [utils.encode_hex(utils.int32.serialize(topic)) for topic in message.topics]
+        self.pending.append(json_dumps({'topics': topics, 'data': '0x' + utils.encode_hex(message.data)}, separators=(',', ':')))
+        if len(self.pending) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self.pending: return
+        payload = '\n'.join(self.pending) + '\n'
+        self.pending = []
+        if self.compress:
+            compressor = compressobj(6, DEFLATED, 16 + MAX_WBITS)
+            payload = compressor.compress(payload) + compressor.flush()
+        self.outputFile.write(payload)
+        self.outputFile.flush()
+
+    def close(self):
+        self.flush()
+        self.outputFile.close()
+
+class GasBaselines(object):
+    # The gas every benchmarked action is allowed to use, stored in gas_baselines.json. A benchmark that goes over its baseline by more than the tolerance fails. In update mode the measured values are written back instead, merged into whatever other sessions or workers recorded.
+    def __init__(self, baselinesPath, tolerance, update, allowMissing=False, enabled=True):
+        self.baselinesPath = baselinesPath
+        self.tolerance = tolerance
+        self.update = update
+        self.allowMissing = allowMissing
+        self.enabled = enabled
+        self.baselines = self.readBaselines()
+        self.measured = {}
+
+    def readBaselines(self):
+        if not path.isfile(self.baselinesPath):
+            return {}
+        with open(self.baselinesPath, 'r') as file:
+            return toNativeStrings(json_load(file))
+
+    def check(self, action, gasUsed):
+        if not self.enabled: return
+        self.measured[action] = gasUsed
+        baseline = self.baselines.get(action)
+        if self.update:
+            print "GAS USED WITH %s : %i. RECORDED AS BASELINE" % (action, gasUsed)
+        elif baseline is None:
+            # A benchmark without a baseline can't catch a regression, so it only passes when that was asked for explicitly
+            assert self.allowMissing, "No gas baseline for %s (used %i). Record one with --updateGasBaselines, or pass --allowMissingGasBaselines to only print it" % (action, gasUsed)
+            print "GAS USED WITH %s : %i. NO BASELINE, RUN WITH --updateGasBaselines TO RECORD ONE" % (action, gasUsed)
+        else:
+            allowedGas = baseline * (1 + self.tolerance / 100)
+            assert gasUsed <= allowedGas, "Gas regression in %s: used %i, baseline is %i (tolerance %s%%)" % (action, gasUsed, baseline, self.tolerance)
+            print "GAS USED WITH %s : %i. BASELINE: %i DELTA: %i" % (action, gasUsed, baseline, baseline - gasUsed)
+
+    def save(self):
+        if not self.update or not self.measured: return
+        with ContractsFixture.sharedBuildLock('gasBaselines'):
+            baselines = self.readBaselines()
+            baselines.update(self.measured)
+            fileDescriptor, temporaryPath = mkstemp(dir=path.dirname(self.baselinesPath), suffix='.tmp')
+            with fdopen(fileDescriptor, 'w') as file:
+                json_dump(baselines, file, indent=2, sort_keys=True, separators=(',', ': '))
+                file.write('\n')
+            rename(temporaryPath, self.baselinesPath)
+        self.measured = {}
+
+class DependencyGraph(object):
+    # Import graph of the solidity sources, persisted in the compilation cache. A file is re-hashed only when its size or mtime changed and reparsed only when its content hash changed, so a warm start costs one stat per file
+    def __init__(self, graphPath, resolveImport):
+        self.graphPath = graphPath
+        self.resolveImport = resolveImport
+        self.nodes = {}
+        self.checked = set()
+        self.closures = {}
+        self.dirty = False
+        if path.isfile(graphPath):
+            try:
+                with open(graphPath, 'r') as file:
+                    self.nodes = toNativeStrings(json_load(file))
+            except ValueError:
+                # a corrupt graph only costs a rebuild
+                self.nodes = {}
+
+    def getNode(self, filePath):
+        relativePath = ContractsFixture.getRelativeSourcePath(filePath)
+        node = self.nodes.get(relativePath)
+        if relativePath in self.checked:
+            return node
+        self.checked.add(relativePath)
+        fileStat = stat(filePath)
+        if node and node['mtime'] == fileStat.st_mtime and node['size'] == fileStat.st_size:
+            return node
+        fileHash = ContractsFixture.hashFile(filePath)
+        if not node or node['hash'] != fileHash:
+            node = {'hash': fileHash, 'imports': [ContractsFixture.getRelativeSourcePath(dependencyPath) for dependencyPath in self.parseImports(filePath)]}
+        node['mtime'] = fileStat.st_mtime
+        node['size'] = fileStat.st_size
+        self.nodes[relativePath] = node
+        self.dirty = True
+        return node
+
+    def parseImports(self, filePath):
+        fileDirectory = path.dirname(filePath)
+        with open(filePath, 'r') as file:
+            fileContents = file.read()
+        dependencyPaths = []
+        for match in findall("inset\('(.*?)'\)", fileContents) + findall("create\('(.*?)'\)", fileContents):
+            dependencyPaths.append(path.abspath(path.join(fileDirectory, match)))
+        for match in findall("import ['\"](.*?)['\"]", fileContents):
+            dependencyPaths.append(self.resolveImport(match))
+        return dependencyPaths
+
+    def getFileHash(self, filePath):
+        return self.getNode(filePath)['hash']
+
+    def getDependencies(self, filePath):
+        # The file itself and everything it transitively imports. Sources are treated as fixed for the rest of the session once read.
+        filePath = path.abspath(filePath)
+        if filePath not in self.closures:
+            dependencies = set()
+            pending = [filePath]
+            while pending:
+                currentPath = pending.pop()
+                if currentPath in dependencies: continue
+                dependencies.add(currentPath)
+                for relativePath in self.getNode(currentPath)['imports']:
+                    pending.append(path.join(REPOSITORY_PATH, relativePath))
+            self.closures[filePath] = dependencies
+        return self.closures[filePath]
+
+    def save(self):
+        if not self.dirty: return
+        ContractsFixture.writeJsonAtomically(self.graphPath, self.nodes)
+        self.dirty = False
+
+class ContractProxy(object):
+    # Drop-in replacement for ABIContract. ABIContract builds a bound method for every ABI function on construction; this resolves methods on first use from a table shared by every proxy with the same translator, so wrapping an address is O(1)
+    __slots__ = ('chain', 'translator', 'address')
+    methodTables = {}
+
+    def __init__(self, chain, translator, address):
+        self.chain = chain
+        self.translator = translator
+        self.address = address
+
+    def __getattr__(self, functionName):
+        methods = ContractProxy.getMethodTable(self.translator)
+        if functionName not in methods:
+            raise AttributeError(functionName)
+        return MethodType(methods[functionName], self)
+
+    @staticmethod
+    def getMethodTable(translator):
+        if translator not in ContractProxy.methodTables:
+            methods = {}
+            for functionName, functionData in translator.function_data.items():
+                methods[functionName] = ContractProxy.methodFactory(functionName, functionData['is_constant'])
+            ContractProxy.methodTables[translator] = methods
+        return ContractProxy.methodTables[translator]
+
+    @staticmethod
+    def methodFactory(functionName, isConstant):
+        def kall(self, *args, **kwargs):
+            txOrCall = self.chain.call if isConstant else self.chain.tx
+            result = txOrCall(
+                sender=kwargs.get('sender', tester.k0),
+                to=self.address,
+                value=kwargs.get('value', 0),
+                data=self.translator.encode(functionName, args),
+                startgas=kwargs.get('startgas', tester.STARTGAS),
+                gasprice=kwargs.get('gasprice', tester.GASPRICE)
+            )
+            if result is False:
+                return result
+            if result == b'':
+                return None
+            decoded = self.translator.decode(functionName, result)
+            return decoded[0] if len(decoded) == 1 else decoded
+        return kall
+
 class ContractsFixture:
     signatures = {}
-    compiledCode = {}
+    translators = {}
+    compiledContracts = {}
+    solcVersion = None
+    bulkCompiled = False
+    sourceFingerprint = None
+    dependencyGraph = None
 
     ####
     #### Static Methods
     ####
 
     @staticmethod
-    def ensureCacheDirectoryExists():
-        if not path.exists(COMPILATION_CACHE):
-            makedirs(COMPILATION_CACHE)
+    def ensureCacheDirectoryExists(cacheDirectory=COMPILATION_CACHE):
+        if not path.exists(cacheDirectory):
+            try:
+                makedirs(cacheDirectory)
+            except OSError:
+                # another pytest-xdist worker may have created it in the meantime
+                if not path.isdir(cacheDirectory): raise
 
-    def generateSignature(self, relativeFilePath):
+    @staticmethod
+    @contextmanager
+    def sharedBuildLock(lockName):
+        # Serializes expensive builds across pytest-xdist workers and concurrent sessions. The first holder builds and persists, every later holder finds the result on disk and only loads it.
         ContractsFixture.ensureCacheDirectoryExists()
-        filename = path.basename(relativeFilePath)
-        name = path.splitext(filename)[0]
-        outputPath = path.join(COMPILATION_CACHE,  name + 'Signature')
-        lastCompilationTime = path.getmtime(outputPath) if path.isfile(outputPath) else 0
-        if path.getmtime(relativeFilePath) > lastCompilationTime:
-            print('generating signature for ' + name)
-            extension = path.splitext(filename)[1]
-            signature = None
-            if extension == '.sol':
-                signature = self.compileSolidity(relativeFilePath)['abi']
-            else:
-                raise
-            with open(outputPath, mode='w') as file:
-                json_dump(signature, file)
-        else:
-            pass#print('using cached signature for ' + name)
-        with open(outputPath, 'r') as file:
-            signature = json_load(file)
-        return(signature)
+        with open(path.join(COMPILATION_CACHE, lockName + '.lock'), 'w') as lockFile:
+            flock(lockFile, LOCK_EX)
+            try:
+                yield
+            finally:
+                flock(lockFile, LOCK_UN)
 
-    def getCompiledCode(self, relativeFilePath):
-        filename = path.basename(relativeFilePath)
-        name = path.splitext(filename)[0]
-        if name in ContractsFixture.compiledCode:
-            return ContractsFixture.compiledCode[name]
-        dependencySet = set()
-        self.getAllDependencies(relativeFilePath, dependencySet)
-        ContractsFixture.ensureCacheDirectoryExists()
-        compiledOutputPath = path.join(COMPILATION_CACHE, name)
-        lastCompilationTime = path.getmtime(compiledOutputPath) if path.isfile(compiledOutputPath) else 0
-        needsRecompile = False
+    @staticmethod
+    def getTranslator(signatureName):
+        if signatureName not in ContractsFixture.translators:
+            ContractsFixture.translators[signatureName] = ContractTranslator(ContractsFixture.signatures[signatureName])
+        return ContractsFixture.translators[signatureName]
+
+    @staticmethod
+    def getSolcVersion():
+        if ContractsFixture.solcVersion is None:
+            ContractsFixture.solcVersion = get_solc_version_string()
+        return ContractsFixture.solcVersion
+
+    @staticmethod
+    def getRelativeSourcePath(filePath):
+        return path.relpath(path.abspath(filePath), REPOSITORY_PATH)
+
+    @staticmethod
+    def hashFile(filePath):
+        with io_open(filePath, mode='rb') as file:
+            return sha256(file.read()).hexdigest()
+
+    @staticmethod
+    def getCacheEntryPath(cacheKey):
+        return path.join(COMPILATION_CACHE, cacheKey + '.json')
+
+    @staticmethod
+    def readCacheEntry(cacheKey):
+        entryPath = ContractsFixture.getCacheEntryPath(cacheKey)
+        if not path.isfile(entryPath):
+            return None
+        with open(entryPath, 'r') as file:
+            return json_load(file)
+
+    @staticmethod
+    def writeCacheEntry(cacheKey, entry):
+        ContractsFixture.writeJsonAtomically(ContractsFixture.getCacheEntryPath(cacheKey), entry)
+
+    @staticmethod
+    def writeJsonAtomically(outputPath, data):
+        ContractsFixture.ensureCacheDirectoryExists(path.dirname(outputPath))
+        # Write to a temporary file and rename it into place so concurrent sessions never observe a partially written file
+        fileDescriptor, temporaryPath = mkstemp(dir=path.dirname(outputPath), suffix='.tmp')
+        with fdopen(fileDescriptor, 'w') as file:
+            json_dump(data, file)
+        rename(temporaryPath, outputPath)
+
+    def getCacheKey(self, filePath, dependencySet):
+        # The key only depends on content and compiler configuration, never on mtimes or absolute paths, so entries stay valid across checkouts and machines
+        dependencyHashes = {}
         for dependencyPath in dependencySet:
-            if (path.getmtime(dependencyPath) > lastCompilationTime):
-                needsRecompile = True
-                break
-        if (needsRecompile):
+            dependencyHashes[ContractsFixture.getRelativeSourcePath(dependencyPath)] = self.getDependencyGraph().getFileHash(dependencyPath)
+        hasher = sha256()
+        hasher.update(ContractsFixture.getSolcVersion())
+        hasher.update(json_dumps(COMPILER_SETTINGS, sort_keys=True))
+        hasher.update(ContractsFixture.getRelativeSourcePath(filePath))
+        for relativePath in sorted(dependencyHashes):
+            hasher.update(relativePath)
+            hasher.update(dependencyHashes[relativePath])
+        return hasher.hexdigest(), dependencyHashes
+
+    def getCompiledContract(self, filePath):
+        filePath = path.abspath(filePath)
+        if filePath in ContractsFixture.compiledContracts:
+            return ContractsFixture.compiledContracts[filePath]
+        name = path.splitext(path.basename(filePath))[0]
+        if path.splitext(filePath)[1] != '.sol':
+            raise Exception("Contract: %s is not a solidity file" % filePath)
+        cacheKey, dependencyHashes = self.getCacheKey(filePath, self.getDependencyGraph().getDependencies(filePath))
+        entry = ContractsFixture.readCacheEntry(cacheKey)
+        if entry is None:
             print('compiling ' + name + '...')
-            extension = path.splitext(filename)[1]
-            compiledCode = None
-            if extension == '.sol':
-                compiledCode = bytearray.fromhex(self.compileSolidity(relativeFilePath)['evm']['bytecode']['object'])
-            else:
-                raise
-            with io_open(compiledOutputPath, mode='wb') as file:
-                file.write(compiledCode)
+            entry = self.createCacheEntry(filePath, self.compileSolidity(filePath), dependencyHashes)
+            ContractsFixture.writeCacheEntry(cacheKey, entry)
         else:
             pass#print('using cached compilation for ' + name)
-        with io_open(compiledOutputPath, mode='rb') as file:
-            compiledCode = file.read()
-            contractSize = len(compiledCode)
-            if (contractSize >= CONTRACT_SIZE_LIMIT):
-                print('%sContract %s is OVER the size limit by %d bytes%s' % (bcolors.FAIL, name, contractSize - CONTRACT_SIZE_LIMIT, bcolors.ENDC))
-            elif (contractSize >= CONTRACT_SIZE_WARN_LEVEL):
-                print('%sContract %s is under size limit by only %d bytes%s' % (bcolors.WARN, name, CONTRACT_SIZE_LIMIT - contractSize, bcolors.ENDC))
-            elif (contractSize > 0):
-                pass#print('Size: %i' % contractSize)
-            ContractsFixture.compiledCode[name] = compiledCode
-            return(compiledCode)
+        contractSize = len(entry['bytecode']) / 2
+        if (contractSize >= CONTRACT_SIZE_LIMIT):
+            print('%sContract %s is OVER the size limit by %d bytes%s' % (bcolors.FAIL, name, contractSize - CONTRACT_SIZE_LIMIT, bcolors.ENDC))
+        elif (contractSize >= CONTRACT_SIZE_WARN_LEVEL):
+            print('%sContract %s is under size limit by only %d bytes%s' % (bcolors.WARN, name, CONTRACT_SIZE_LIMIT - contractSize, bcolors.ENDC))
+        elif (contractSize > 0):
+            pass#print('Size: %i' % contractSize)
+        ContractsFixture.compiledContracts[filePath] = entry
+        return entry
+
+    def createCacheEntry(self, filePath, compilerOutput, dependencyHashes):
+        return {
+            'manifest': {
+                'name': path.splitext(path.basename(filePath))[0],
+                'source': ContractsFixture.getRelativeSourcePath(filePath),
+                'solcVersion': ContractsFixture.getSolcVersion(),
+                'settings': COMPILER_SETTINGS,
+                'dependencies': dependencyHashes,
+            },
+            'bytecode': compilerOutput['evm']['bytecode']['object'],
+            'sourceMap': compilerOutput['evm']['bytecode']['sourceMap'],
+            'abi': compilerOutput['abi'],
+        }
+
+    def generateSignature(self, relativeFilePath):
+        return self.getCompiledContract(relativeFilePath)['abi']
+
+    def getCompiledCode(self, relativeFilePath):
+        return bytes(bytearray.fromhex(str(self.getCompiledContract(relativeFilePath)['bytecode'])))
+
+    def getStaleContracts(self, filePaths):
+        staleContracts = {}
+        for filePath in filePaths:
+            filePath = path.abspath(filePath)
+            if filePath in ContractsFixture.compiledContracts: continue
+            cacheKey, dependencyHashes = self.getCacheKey(filePath, self.getDependencyGraph().getDependencies(filePath))
+            if path.isfile(ContractsFixture.getCacheEntryPath(cacheKey)): continue
+            staleContracts[filePath] = (cacheKey, dependencyHashes)
+        return staleContracts
+
+    def compileAllContracts(self):
+        # Compile every stale contract the bulk upload helpers will touch in a single solc invocation so shared libraries are only parsed once
+        if ContractsFixture.bulkCompiled: return
+        with ContractsFixture.sharedBuildLock('compile'):
+            if ContractsFixture.bulkCompiled: return
+            staleContracts = self.getStaleContracts(self.getAllSolidityFiles())
+            self.getDependencyGraph().save()
+            if staleContracts:
+                print('compiling %i contracts...' % len(staleContracts))
+                if self.coverageMode:
+                    compiledSources = self.compileSolidityInParallel(staleContracts.keys())
+                else:
+                    compiledSources = self.compileSolidityBatch(staleContracts.keys())
+                for filePath, (cacheKey, dependencyHashes) in staleContracts.items():
+                    contractName = path.splitext(path.basename(filePath))[0]
+                    ContractsFixture.writeCacheEntry(cacheKey, self.createCacheEntry(filePath, compiledSources[filePath][contractName], dependencyHashes))
+            # Only marked once everything compiled, so a failed solc run is retried (and fails loudly) on the next call instead of being skipped
+            ContractsFixture.bulkCompiled = True
 
     def compileSolidity(self, relativeFilePath):
         absoluteFilePath = resolveRelativePath(relativeFilePath)
-        filename = path.basename(relativeFilePath)
-        contractName = path.splitext(filename)[0]
+        contractName = path.splitext(path.basename(relativeFilePath))[0]
         print absoluteFilePath
-        compilerParameter = {
+        return self.compileSolidityBatch([absoluteFilePath])[absoluteFilePath][contractName]
+
+    def compileSolidityBatch(self, relativeFilePaths):
+        return compileStandardJson(self.getCompilerParameter(relativeFilePaths))
+
+    def compileSolidityInParallel(self, relativeFilePaths):
+        # The instrumented coverage build is compiled one file per solc process, spread across every available core
+        compilerParameters = [self.getCompilerParameter([relativeFilePath]) for relativeFilePath in relativeFilePaths]
+        pool = Pool(processes=cpu_count())
+        try:
+            results = pool.map(compileStandardJson, compilerParameters)
+        finally:
+            pool.close()
+            pool.join()
+        compiledSources = {}
+        for result in results:
+            compiledSources.update(result)
+        return compiledSources
+
+    def getCompilerParameter(self, relativeFilePaths):
+        absoluteFilePaths = [resolveRelativePath(relativeFilePath) for relativeFilePath in relativeFilePaths]
+        settings = deepcopy(COMPILER_SETTINGS)
+        # TODO: Remove 'remappings' line below and update 'sources' line above
+        settings['remappings'] = [ '=%s/' % resolveRelativePath(self.relativeContractsPath), 'TEST=%s/' % resolveRelativePath(self.relativeTestContractsPath) ]
+        return {
             'language': 'Solidity',
-            'sources': {
-                absoluteFilePath: {
-                    'urls': [ absoluteFilePath ]
-                }
-            },
-            'settings': {
-                # TODO: Remove 'remappings' line below and update 'sources' line above
-                'remappings': [ '=%s/' % resolveRelativePath(self.relativeContractsPath), 'TEST=%s/' % resolveRelativePath(self.relativeTestContractsPath) ],
-                'optimizer': {
-                    'enabled': True,
-                    'runs': 200
-                },
-                'outputSelection': {
-                    "*": {
-                        '*': [ 'metadata', 'evm.bytecode', 'evm.sourceMap', 'abi' ]
-                    }
-                }
-            }
+            'sources': dict((absoluteFilePath, { 'urls': [ absoluteFilePath ] }) for absoluteFilePath in absoluteFilePaths),
+            'settings': settings
         }
-        return compile_standard(compilerParameter, allow_paths=resolveRelativePath("../"))['contracts'][absoluteFilePath][contractName]
 
-    def getAllDependencies(self, filePath, knownDependencies):
-        knownDependencies.add(filePath)
-        fileDirectory = path.dirname(filePath)
-        with open(filePath, 'r') as file:
-            fileContents = file.read()
-        matches = findall("inset\('(.*?)'\)", fileContents)
-        for match in matches:
-            dependencyPath = path.abspath(path.join(fileDirectory, match))
-            if not dependencyPath in knownDependencies:
-                self.getAllDependencies(dependencyPath, knownDependencies)
-        matches = findall("create\('(.*?)'\)", fileContents)
-        for match in matches:
-            dependencyPath = path.abspath(path.join(fileDirectory, match))
-            if not dependencyPath in knownDependencies:
-                self.getAllDependencies(dependencyPath, knownDependencies)
-        matches = findall("import ['\"](.*?)['\"]", fileContents)
-        for match in matches:
-            dependencyPath = path.join(BASE_PATH, self.relativeContractsPath, match)
-            if "TEST" in dependencyPath:
-                dependencyPath = path.join(BASE_PATH, self.relativeTestContractsPath, match).replace("TEST/", "")
-            if not path.isfile(dependencyPath):
-                raise Exception("Could not resolve dependency file path: %s" % dependencyPath)
-            if not dependencyPath in knownDependencies:
-                self.getAllDependencies(dependencyPath, knownDependencies)
-        return(knownDependencies)
+    def getDependencyGraph(self):
+        if ContractsFixture.dependencyGraph is None:
+            # Coverage runs resolve imports into the instrumented tree, so they keep their own graph
+            graphName = 'dependencyGraph-coverage.json' if self.coverageMode else 'dependencyGraph.json'
+            ContractsFixture.dependencyGraph = DependencyGraph(path.join(COMPILATION_CACHE, graphName), self.resolveImportPath)
+        return ContractsFixture.dependencyGraph
+
+    def resolveImportPath(self, importPath):
+        dependencyPath = path.join(BASE_PATH, self.relativeContractsPath, importPath)
+        if "TEST" in dependencyPath:
+            dependencyPath = path.join(BASE_PATH, self.relativeTestContractsPath, importPath).replace("TEST/", "")
+        if not path.isfile(dependencyPath):
+            raise Exception("Could not resolve dependency file path: %s" % dependencyPath)
+        return path.abspath(dependencyPath)
 
     ####
     #### Class Methods
@@ -206,17 +527,22 @@ class ContractsFixture:
 
         self.chain = Chain(env=Env(config=config_metropolis))
         self.contracts = {}
+        self.signatureKeys = {}
         self.testerAddress = self.generateTesterMap('a')
         self.testerKey = self.generateTesterMap('k')
         self.testerAddressToKey = dict(zip(self.testerAddress.values(), self.testerKey.values()))
-        if path.isfile('./allFiredEvents'):
-            remove_file('./allFiredEvents')
         self.relativeContractsPath = '../source/contracts'
         self.relativeTestContractsPath = 'solidity_test_helpers'
         self.externalContractsPath = '../source/contracts/external'
         self.coverageMode = pytest.config.option.cover
         self.subFork = pytest.config.option.subFork
+        self.coverageEventSink = None
+        # The instrumented coverage contracts use far more gas than the real ones, so they are never checked against the baselines
+        self.gasBaselines = GasBaselines(GAS_BASELINES, pytest.config.option.gasTolerance, pytest.config.option.updateGasBaselines, allowMissing=pytest.config.option.allowMissingGasBaselines, enabled=not self.coverageMode)
         if self.coverageMode:
+            # pytest-xdist workers each get their own events file
+            workerId = environ.get('PYTEST_XDIST_WORKER')
+            self.coverageEventSink = CoverageEventSink('./allFiredEvents' + ('-' + workerId if workerId else ''), pytest.config.option.coverFormat == 'gzip')
             self.chain.head_state.log_listeners.append(self.writeLogToFile)
             self.relativeContractsPath = '../coverageEnv/contracts'
             self.relativeTestContractsPath = '../coverageEnv/solidity_test_helpers'
@@ -224,8 +550,14 @@ class ContractsFixture:
 
 
     def writeLogToFile(self, message):
-        with open('./allFiredEvents', 'a') as logsFile:
-            logsFile.write(json_dumps(message.to_dict()) + '\n')
+        self.coverageEventSink.write(message)
+
+    def close(self):
+        self.gasBaselines.save()
+        if ContractsFixture.dependencyGraph:
+            ContractsFixture.dependencyGraph.save()
+        if self.coverageEventSink:
+            self.coverageEventSink.close()
 
     def generateTesterMap(self, ch):
         testers = {}
@@ -258,21 +590,21 @@ class ContractsFixture:
             return None
         if signatureKey not in ContractsFixture.signatures:
             ContractsFixture.signatures[signatureKey] = self.generateSignature(resolvedPath)
-        signature = ContractsFixture.signatures[signatureKey]
-        contractTranslator = ContractTranslator(signature)
+        contractTranslator = ContractsFixture.getTranslator(signatureKey)
         if len(constructorArgs) > 0:
             compiledCode += contractTranslator.encode_constructor_arguments(constructorArgs)
         contractAddress = bytesToHexString(self.chain.contract(compiledCode, language='evm'))
-        contract = ABIContract(self.chain, contractTranslator, contractAddress)
+        contract = ContractProxy(self.chain, contractTranslator, contractAddress)
         self.contracts[lookupKey] = contract
+        self.signatureKeys[contractAddress] = signatureKey
         return(contract)
 
     def applySignature(self, signatureName, address):
         assert address
         if type(address) is long:
             address = longToHexString(address)
-        translator = ContractTranslator(ContractsFixture.signatures[signatureName])
-        contract = ABIContract(self.chain, translator, address)
+        contract = ContractProxy(self.chain, ContractsFixture.getTranslator(signatureName), address)
+        self.signatureKeys[address] = signatureName
         return contract
 
     def createSnapshot(self):
@@ -286,19 +618,102 @@ class ContractsFixture:
     def resetToSnapshot(self, snapshot):
         if not 'state' in snapshot: raise "snapshot is missing 'state'"
         if not 'contracts' in snapshot: raise "snapshot is missing 'contracts'"
+        # Once a chain has been built for this snapshot, later resets only roll its state root back, so they cost what the test touched rather than the whole deployed state
+        revertPoint = snapshot.get('revertPoint')
+        if revertPoint and revertPoint['chain'] is self.chain and revertPoint['chainSnapshot'][2] == self.chain.block.number:
+            self.chain.revert(revertPoint['chainSnapshot'])
+            self.chain.head_state.log_listeners = []
+            if self.coverageMode:
+                self.chain.head_state.log_listeners.append(self.writeLogToFile)
+            self.contracts = dict(revertPoint['contracts'])
+            return
         self.chain = Chain(genesis=snapshot['state'], env=Env(config=config_metropolis))
         if self.coverageMode:
             self.chain.head_state.log_listeners.append(self.writeLogToFile)
         self.contracts = {}
         for contractName in snapshot['contracts']:
             contract = snapshot['contracts'][contractName]
-            self.contracts[contractName] = ABIContract(self.chain, contract['translator'], contract['address'])
+            self.contracts[contractName] = ContractProxy(self.chain, contract['translator'], contract['address'])
+        snapshot['revertPoint'] = dict(chain = self.chain, chainSnapshot = self.chain.snapshot(), contracts = dict(self.contracts))
+
+    ####
+    #### Persisted Snapshots
+    ####
+
+    def getSourceFingerprint(self):
+        # Identifies everything a persisted snapshot was built from: the compiled code of every contract the fixtures can deploy, and the deployment code in this file
+        if ContractsFixture.sourceFingerprint is None:
+            hasher = sha256()
+            hasher.update(ContractsFixture.hashFile(resolveRelativePath('conftest.py')))
+            for filePath in sorted(self.getAllSolidityFiles()):
+                hasher.update(self.getCacheKey(filePath, self.getDependencyGraph().getDependencies(filePath))[0])
+            ContractsFixture.sourceFingerprint = hasher.hexdigest()
+        return ContractsFixture.sourceFingerprint
+
+    def getSnapshotPath(self, snapshotName):
+        return path.join(SNAPSHOT_CACHE, '%s-%s.json' % (snapshotName, self.getSourceFingerprint()))
+
+    def persistSnapshot(self, snapshotName, snapshot):
+        # Coverage runs need the events fired during deployment, so they always deploy from scratch
+        if self.coverageMode: return
+        contracts = {}
+        references = {}
+        signatures = {}
+        for contractName, contract in snapshot['contracts'].items():
+            if contract['address'] not in self.signatureKeys: return
+            contracts[contractName] = (self.signatureKeys[contract['address']], contract['address'])
+        for referenceName, contract in snapshot.items():
+            if not isinstance(contract, (ABIContract, ContractProxy)): continue
+            if contract.address not in self.signatureKeys: return
+            references[referenceName] = (self.signatureKeys[contract.address], contract.address)
+        for signatureKey, _ in contracts.values() + references.values():
+            signatures[signatureKey] = ContractsFixture.signatures[signatureKey]
+        persistedSnapshot = {
+            'state': snapshot['state'],
+            'contracts': contracts,
+            'references': references,
+            'signatures': signatures,
+        }
+        ContractsFixture.writeJsonAtomically(self.getSnapshotPath(snapshotName), persistedSnapshot)
+
+    def loadSnapshot(self, snapshotName):
+        if self.coverageMode: return None
+        snapshotPath = self.getSnapshotPath(snapshotName)
+        if not path.isfile(snapshotPath): return None
+        with open(snapshotPath, 'r') as file:
+            persistedSnapshot = toNativeStrings(json_load(file))
+        for signatureKey, signature in persistedSnapshot['signatures'].items():
+            ContractsFixture.signatures.setdefault(signatureKey, signature)
+        contracts = {}
+        for contractName, (signatureKey, address) in persistedSnapshot['contracts'].items():
+            contracts[contractName] = dict(translator = ContractsFixture.getTranslator(signatureKey), address = address)
+            self.signatureKeys[address] = signatureKey
+        snapshot = { 'state': persistedSnapshot['state'], 'contracts': contracts }
+        self.resetToSnapshot(snapshot)
+        for referenceName, (signatureKey, address) in persistedSnapshot['references'].items():
+            snapshot[referenceName] = self.applySignature(signatureKey, address)
+        return snapshot
 
     ####
     #### Bulk Operations
     ####
 
+    def getAllSolidityFiles(self):
+        filePaths = []
+        for relativeDirectory in [self.relativeContractsPath, self.relativeTestContractsPath, self.externalContractsPath]:
+            filePaths += self.getSolidityFiles(relativeDirectory)
+        return filePaths
+
+    def getSolidityFiles(self, relativeDirectory):
+        solidityFiles = []
+        for directory, _, filenames in walk(resolveRelativePath(relativeDirectory)):
+            for filename in filenames:
+                if path.splitext(filename)[1] == '.sol':
+                    solidityFiles.append(path.join(directory, filename))
+        return solidityFiles
+
     def uploadAllContracts(self, legacyRepForRedeployTest=None):
+        self.compileAllContracts()
         for directory, _, filenames in walk(resolveRelativePath(self.relativeContractsPath)):
             for filename in filenames:
                 name = path.splitext(filename)[0]
@@ -307,12 +722,16 @@ class ContractsFixture:
                 if name == 'controller': continue
                 if name == 'AugurLite': continue
                 if name == 'Time': continue # In testing and development we swap the Time library for a ControlledTime version which lets us manage block timestamp
+                if name in ['Delegator', 'CachedDelegator']: continue # Only factories deploy proxies, and CachedDelegator looks up its target while it is constructed
                 if name == "TimeControlled":
                     self.uploadAndAddToController(path.join(directory, filename), lookupKey = "Time", signatureKey = "TimeControlled")
+                elif name in ["MarketFactory", "MarketCloneFactory"]:
+                    self.uploadAndAddToController(path.join(directory, filename), constructorArgs=[False, False]) # deferMarketAssets, useShareLedger
                 else:
                     self.uploadAndAddToController(path.join(directory, filename))
 
     def uploadAllMockContracts(self):
+        self.compileAllContracts()
         for directory, _, filenames in walk(resolveRelativePath(self.relativeTestContractsPath)):
             for filename in filenames:
                 name = path.splitext(filename)[0]
@@ -325,6 +744,7 @@ class ContractsFixture:
                     self.uploadAndAddToController(path.join(directory, filename))
 
     def uploadExternalContracts(self):
+        self.compileAllContracts()
         for directory, _, filenames in walk(resolveRelativePath(self.externalContractsPath)):
             for filename in filenames:
                 name = path.splitext(filename)[0]
@@ -339,12 +759,12 @@ class ContractsFixture:
             name = path.splitext(filename)[0]
             extension = path.splitext(filename)[1]
             if extension != '.sol': continue
-            if name != "CompleteSets" and name != "ClaimTradingProceeds": continue
+            if name not in ["CompleteSets", "ClaimTradingProceeds", "MarketResolver"]: continue
             if not name in self.contracts: continue
             self.contracts['Controller'].addToWhitelist(self.contracts[name].address)
 
     def initializeAllContracts(self):
-        contractsToInitialize = ['CompleteSets', 'ClaimTradingProceeds', 'Time']
+        contractsToInitialize = ['CompleteSets', 'ClaimTradingProceeds', 'MarketResolver', 'Time']
         for contractName in contractsToInitialize:
             if getattr(self.contracts[contractName], "setController", None):
                 self.contracts[contractName].setController(self.contracts['Controller'].address)
@@ -353,6 +773,33 @@ class ContractsFixture:
             else:
                 raise "contract has neither 'initialize' nor 'setController' method on it."
 
+    def useMinimalProxies(self):
+        # Point the factory keys at the clone factories so new markets, mailboxes and share tokens are EIP-1167 clones instead of Delegators
+        for factoryName in ['MailboxFactory', 'ShareTokenFactory']:
+            cloneFactory = self.contracts[factoryName.replace('Factory', 'CloneFactory')]
+            self.contracts['Controller'].registerContract(factoryName.ljust(32, '\x00'), cloneFactory.address, garbageBytes20, garbageBytes32)
+        self.registerMarketFactory(minimalProxies=True)
+
+    def useShareLedger(self):
+        # New markets keep every outcome's balances in a single ShareLedger, with ShareLedgerTokens as their share tokens
+        self.registerMarketFactory(useShareLedger=True)
+
+    def deferMarketAssets(self):
+        # New markets only create their share tokens on the first complete set purchase and their mailbox on the first creator fee
+        self.registerMarketFactory(deferMarketAssets=True)
+
+    def registerMarketFactory(self, minimalProxies=None, deferMarketAssets=None, useShareLedger=None):
+        # Market factories are configured when they are deployed, so this deploys one with the given options and keeps the registered factory's other options
+        controller = self.contracts['Controller']
+        registeredFactory = self.applySignature('MarketFactory', controller.lookup('MarketFactory'))
+        if minimalProxies is None: minimalProxies = controller.lookup('MailboxFactory') == self.contracts['MailboxCloneFactory'].address
+        if deferMarketAssets is None: deferMarketAssets = registeredFactory.deferMarketAssets()
+        if useShareLedger is None: useShareLedger = registeredFactory.useShareLedger()
+        factoryName = 'MarketCloneFactory' if minimalProxies else 'MarketFactory'
+        self.contracts.pop('ConfiguredMarketFactory', None)
+        marketFactory = self.upload(path.join(self.relativeContractsPath, 'factories', factoryName + '.sol'), lookupKey='ConfiguredMarketFactory', signatureKey=factoryName, constructorArgs=[deferMarketAssets, useShareLedger])
+        controller.registerContract('MarketFactory'.ljust(32, '\x00'), marketFactory.address, garbageBytes20, garbageBytes32)
+
     ####
     #### Helpers
     ####
@@ -385,30 +832,50 @@ class ContractsFixture:
         assert universe.getTypeName() == stringToBytes('Universe')
         return universe
 
+    def assertOpenInterest(self, market):
+        # Cross-checks the market's running open interest against a full recomputation from every ShareToken's supply
+        openInterest = market.getOpenInterest()
+        assert openInterest == market.calculateOpenInterest()
+        assert self.applySignature('TestNetDenominationToken', market.getDenominationToken()).balanceOf(market.address) >= openInterest
+        return openInterest
+
     def getShareToken(self, market, outcome):
         shareTokenAddress = market.getShareToken(outcome)
         assert shareTokenAddress
-        shareToken = ABIContract(self.chain, ContractTranslator(ContractsFixture.signatures['ShareToken']), shareTokenAddress)
-        return shareToken
+        return self.applySignature('ShareToken', shareTokenAddress)
 
     def createYesNoMarket(self, universe, endTime, feeDivisor, denominationToken, oracle, sender=tester.k0, topic="", description="description", extraInfo=""):
         marketAddress = universe.createYesNoMarket(endTime, feeDivisor, denominationToken.address, oracle, topic, description, extraInfo, sender=sender)
         assert marketAddress
-        market = ABIContract(self.chain, ContractTranslator(ContractsFixture.signatures['Market']), marketAddress)
-        return market
+        return self.applySignature('Market', marketAddress)
 
     def createCategoricalMarket(self, universe, numOutcomes, endTime, feeDivisor, denominationToken, oracle, sender=tester.k0, topic="", description="description", extraInfo=""):
         outcomes = [" "] * numOutcomes
         marketAddress = universe.createCategoricalMarket(endTime, feeDivisor, denominationToken.address, oracle, outcomes, topic, description, extraInfo, sender=sender)
         assert marketAddress
-        market = ABIContract(self.chain, ContractTranslator(ContractsFixture.signatures['Market']), marketAddress)
-        return market
+        return self.applySignature('Market', marketAddress)
 
     def createScalarMarket(self, universe, endTime, feeDivisor, denominationToken, maxPrice, minPrice, numTicks, oracle, sender=tester.k0, description="description", extraInfo=""):
         marketAddress = universe.createScalarMarket(endTime, feeDivisor, denominationToken.address, oracle, minPrice, maxPrice, numTicks, "", description, extraInfo, sender=sender)
         assert marketAddress
-        market = ABIContract(self.chain, ContractTranslator(ContractsFixture.signatures['Market']), marketAddress)
-        return market
+        return self.applySignature('Market', marketAddress)
+
+    def createMarkets(self, universe, specs, **kwargs):
+        # Packs market specs, dicts with the fields the single market helpers take plus a marketType, into the parallel arrays Universe.createMarkets expects
+        oracles, values, prices, topics, outcomes, text = [], [], [], [], [], ''
+        for spec in specs:
+            specOutcomes = spec.get('outcomes', [])
+            description = spec.get('description', 'description')
+            extraInfo = spec.get('extraInfo', '')
+            values += [spec['marketType'], spec['endTime'], spec.get('feeDivisor', 100), spec.get('numTicks', 0), len(specOutcomes), len(description), len(extraInfo)]
+            prices += [spec.get('minPrice', 0), spec.get('maxPrice', 0)]
+            oracles.append(spec.get('oracle', tester.a0))
+            topics.append(spec.get('topic', ''))
+            outcomes += specOutcomes
+            text += description + extraInfo
+        marketAddresses = universe.createMarkets(oracles, values, prices, topics, outcomes, text, **kwargs)
+        assert marketAddresses
+        return [self.applySignature('Market', marketAddress) for marketAddress in marketAddresses]
 
     def createReasonableYesNoMarket(self, universe, denominationToken, sender=tester.k0, topic="", description="description", extraInfo=""):
         return self.createYesNoMarket(
@@ -446,7 +913,9 @@ class ContractsFixture:
 
 @pytest.fixture(scope="session")
 def fixture():
-    return ContractsFixture()
+    contractsFixture = ContractsFixture()
+    yield contractsFixture
+    contractsFixture.close()
 
 @pytest.fixture(scope="session")
 def baseSnapshot(fixture):
@@ -460,15 +929,20 @@ def controllerSnapshot(fixture, baseSnapshot):
     return fixture.createSnapshot()
 
 @pytest.fixture(scope="session")
-def augurInitializedSnapshot(fixture, controllerSnapshot):
-    fixture.resetToSnapshot(controllerSnapshot)
-    fixture.uploadAugurLite()
-    fixture.uploadAllContracts()
-    fixture.initializeAllContracts()
-    fixture.whitelistTradingContracts()
-    fixture.approveCentralAuthority()
-    fixture.uploadExternalContracts()
-    return fixture.createSnapshot()
+def augurInitializedSnapshot(fixture, request):
+    with fixture.sharedBuildLock('augurInitialized'):
+        snapshot = fixture.loadSnapshot('augurInitialized')
+        if snapshot: return snapshot
+        fixture.resetToSnapshot(request.getfixturevalue('controllerSnapshot'))
+        fixture.uploadAugurLite()
+        fixture.uploadAllContracts()
+        fixture.initializeAllContracts()
+        fixture.whitelistTradingContracts()
+        fixture.approveCentralAuthority()
+        fixture.uploadExternalContracts()
+        snapshot = fixture.createSnapshot()
+        fixture.persistSnapshot('augurInitialized', snapshot)
+        return snapshot
 
 @pytest.fixture(scope="session")
 def augurInitializedWithMocksSnapshot(fixture, augurInitializedSnapshot):
@@ -479,24 +953,28 @@ def augurInitializedWithMocksSnapshot(fixture, augurInitializedSnapshot):
     return fixture.createSnapshot()
 
 @pytest.fixture(scope="session")
-def kitchenSinkSnapshot(fixture, augurInitializedSnapshot):
-    fixture.resetToSnapshot(augurInitializedSnapshot)
-    universe = fixture.createUniverse()
-    testNetDenominationToken = fixture.contracts['TestNetDenominationToken']
-    augurLite = fixture.contracts['AugurLite']
-    yesNoMarket = fixture.createReasonableYesNoMarket(universe, testNetDenominationToken)
-    startingGas = fixture.chain.head_state.gas_used
-    categoricalMarket = fixture.createReasonableCategoricalMarket(universe, 3, testNetDenominationToken)
-    print 'Gas Used: %s' % (fixture.chain.head_state.gas_used - startingGas)
-    scalarMarket = fixture.createReasonableScalarMarket(universe, 30, -10, 400000, testNetDenominationToken)
-    snapshot = fixture.createSnapshot()
-    snapshot['universe'] = universe
-    snapshot['testNetDenominationToken'] = testNetDenominationToken
-    snapshot['augurLite'] = augurLite
-    snapshot['yesNoMarket'] = yesNoMarket
-    snapshot['categoricalMarket'] = categoricalMarket
-    snapshot['scalarMarket'] = scalarMarket
-    return snapshot
+def kitchenSinkSnapshot(fixture, request):
+    with fixture.sharedBuildLock('kitchenSink'):
+        snapshot = fixture.loadSnapshot('kitchenSink')
+        if snapshot: return snapshot
+        fixture.resetToSnapshot(request.getfixturevalue('augurInitializedSnapshot'))
+        universe = fixture.createUniverse()
+        testNetDenominationToken = fixture.contracts['TestNetDenominationToken']
+        augurLite = fixture.contracts['AugurLite']
+        yesNoMarket = fixture.createReasonableYesNoMarket(universe, testNetDenominationToken)
+        startingGas = fixture.chain.head_state.gas_used
+        categoricalMarket = fixture.createReasonableCategoricalMarket(universe, 3, testNetDenominationToken)
+        print 'Gas Used: %s' % (fixture.chain.head_state.gas_used - startingGas)
+        scalarMarket = fixture.createReasonableScalarMarket(universe, 30, -10, 400000, testNetDenominationToken)
+        snapshot = fixture.createSnapshot()
+        snapshot['universe'] = universe
+        snapshot['testNetDenominationToken'] = testNetDenominationToken
+        snapshot['augurLite'] = augurLite
+        snapshot['yesNoMarket'] = yesNoMarket
+        snapshot['categoricalMarket'] = categoricalMarket
+        snapshot['scalarMarket'] = scalarMarket
+        fixture.persistSnapshot('kitchenSink', snapshot)
+        return snapshot
 
 @pytest.fixture
 def kitchenSinkFixture(fixture, kitchenSinkSnapshot):
@@ -505,31 +983,31 @@ def kitchenSinkFixture(fixture, kitchenSinkSnapshot):
 
 @pytest.fixture
 def universe(kitchenSinkFixture, kitchenSinkSnapshot):
-    return ABIContract(kitchenSinkFixture.chain, kitchenSinkSnapshot['universe'].translator, kitchenSinkSnapshot['universe'].address)
+    return ContractProxy(kitchenSinkFixture.chain, kitchenSinkSnapshot['universe'].translator, kitchenSinkSnapshot['universe'].address)
 
 @pytest.fixture
 def testNetDenominationToken(kitchenSinkFixture, kitchenSinkSnapshot):
-    return ABIContract(kitchenSinkFixture.chain, kitchenSinkSnapshot['testNetDenominationToken'].translator, kitchenSinkSnapshot['testNetDenominationToken'].address)
+    return ContractProxy(kitchenSinkFixture.chain, kitchenSinkSnapshot['testNetDenominationToken'].translator, kitchenSinkSnapshot['testNetDenominationToken'].address)
 
 @pytest.fixture
 def augurLite(kitchenSinkFixture, kitchenSinkSnapshot):
-    return ABIContract(kitchenSinkFixture.chain, kitchenSinkSnapshot['augurLite'].translator, kitchenSinkSnapshot['augurLite'].address)
+    return ContractProxy(kitchenSinkFixture.chain, kitchenSinkSnapshot['augurLite'].translator, kitchenSinkSnapshot['augurLite'].address)
 
 @pytest.fixture
 def market(kitchenSinkFixture, kitchenSinkSnapshot):
-    return ABIContract(kitchenSinkFixture.chain, kitchenSinkSnapshot['yesNoMarket'].translator, kitchenSinkSnapshot['yesNoMarket'].address)
+    return ContractProxy(kitchenSinkFixture.chain, kitchenSinkSnapshot['yesNoMarket'].translator, kitchenSinkSnapshot['yesNoMarket'].address)
 
 @pytest.fixture
 def yesNoMarket(kitchenSinkFixture, kitchenSinkSnapshot):
-    return ABIContract(kitchenSinkFixture.chain, kitchenSinkSnapshot['yesNoMarket'].translator, kitchenSinkSnapshot['yesNoMarket'].address)
+    return ContractProxy(kitchenSinkFixture.chain, kitchenSinkSnapshot['yesNoMarket'].translator, kitchenSinkSnapshot['yesNoMarket'].address)
 
 @pytest.fixture
 def categoricalMarket(kitchenSinkFixture, kitchenSinkSnapshot):
-    return ABIContract(kitchenSinkFixture.chain, kitchenSinkSnapshot['categoricalMarket'].translator, kitchenSinkSnapshot['categoricalMarket'].address)
+    return ContractProxy(kitchenSinkFixture.chain, kitchenSinkSnapshot['categoricalMarket'].translator, kitchenSinkSnapshot['categoricalMarket'].address)
 
 @pytest.fixture
 def scalarMarket(kitchenSinkFixture, kitchenSinkSnapshot):
-    return ABIContract(kitchenSinkFixture.chain, kitchenSinkSnapshot['scalarMarket'].translator, kitchenSinkSnapshot['scalarMarket'].address)
+    return ContractProxy(kitchenSinkFixture.chain, kitchenSinkSnapshot['scalarMarket'].translator, kitchenSinkSnapshot['scalarMarket'].address)
 
 @pytest.fixture(scope="session")
 def sessionFixture(fixture, kitchenSinkSnapshot):
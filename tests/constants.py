@@ -4,3 +4,6 @@ LONG = 0
 SHORT = 1
 YES = 1
 NO = 0
+YES_NO = 0
+CATEGORICAL = 1
+SCALAR = 2
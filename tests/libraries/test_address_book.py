@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+from ethereum.tools import tester
+from ethereum.tools.tester import TransactionFailed
+from pytest import mark, raises
+from utils import stringToBytes, bytesToHexString, garbageBytes20, garbageBytes32
+
+@mark.parametrize('contractName', ['CompleteSets', 'ClaimTradingProceeds'])
+def test_address_book(kitchenSinkFixture, contractName):
+    controller = kitchenSinkFixture.contracts['Controller']
+    contract = kitchenSinkFixture.contracts[contractName]
+    augurLite = kitchenSinkFixture.contracts['AugurLite']
+    time = kitchenSinkFixture.contracts['Time']
+
+    # Resolved once when the controller was set
+    assert contract.getAddressBook() == [augurLite.address, time.address]
+
+    # Registering a new Time doesn't reach the trading contracts until their address book is refreshed
+    controller.registerContract(stringToBytes('Time'), tester.a5, garbageBytes20, garbageBytes32)
+    assert contract.getAddressBook() == [augurLite.address, time.address]
+
+    with raises(TransactionFailed):
+        contract.refreshAddressBook(sender=tester.k1)
+
+    assert contract.refreshAddressBook()
+    assert contract.getAddressBook() == [augurLite.address, bytesToHexString(tester.a5)]
+
+def test_trading_with_address_book(kitchenSinkFixture, testNetDenominationToken, market):
+    completeSets = kitchenSinkFixture.contracts['CompleteSets']
+    claimTradingProceeds = kitchenSinkFixture.contracts['ClaimTradingProceeds']
+    time = kitchenSinkFixture.contracts['Time']
+    testNetDenominationToken.depositEther(sender=tester.k1, value=10 * market.getNumTicks())
+
+    # Trading keeps working against the addresses captured at initialization while the registry points elsewhere
+    kitchenSinkFixture.contracts['Controller'].registerContract(stringToBytes('Time'), tester.a5, garbageBytes20, garbageBytes32)
+    assert completeSets.publicBuyCompleteSets(market.address, 10, sender=tester.k1)
+    assert completeSets.publicSellCompleteSets(market.address, 5, sender=tester.k1)
+    kitchenSinkFixture.contracts['Controller'].registerContract(stringToBytes('Time'), time.address, garbageBytes20, garbageBytes32)
+
+    time.setTimestamp(market.getEndTime() + 1)
+    assert market.resolve([0, market.getNumTicks()], False)
+    time.setTimestamp(market.getResolutionTime() + 1)
+    assert claimTradingProceeds.claimTradingProceeds(market.address, tester.a1)
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 
+from ethereum.tools import tester
 from ethereum.tools.tester import TransactionFailed
 from pytest import fixture, raises
-from utils import stringToBytes
+from utils import stringToBytes, garbageBytes20, garbageBytes32
 
 def test_delegationTargetInitialMemberValues(localFixture):
 
@@ -89,6 +90,31 @@ def test_delegationInputsAndOutputs(localFixture):
     assert delegatorHelper.returnDynamic() == [1L, 0L, 0L, 0L, 0L]
     assert delegatorHelper.returnFixed() == [1L, 0L, 0L, 0L, 0L]
 
+def test_cachedDelegator(localFixture):
+
+    delegatorHelperTarget = localFixture.contracts['DelegatorHelperTarget']
+    cachedDelegatorHelper = localFixture.contracts['CachedDelegatorHelper']
+    cachedDelegator = localFixture.applySignature('cachedDelegator', cachedDelegatorHelper.address)
+
+    # The target is resolved once at construction and calls are delegated to it like with a regular delegator
+    assert cachedDelegator.getDelegationTarget() == delegatorHelperTarget.address
+    assert cachedDelegatorHelper.setIntValue(7)
+    assert cachedDelegatorHelper.getIntValue() == 7
+    assert cachedDelegatorHelper.returnDynamic() == [1L, 0L, 0L, 0L, 0L]
+
+    # Changing the registered target does not affect the cached one until it is refreshed
+    newTarget = localFixture.contracts['NewDelegatorHelperTarget']
+    localFixture.contracts['Controller'].registerContract(stringToBytes("DelegatorHelperTarget"), newTarget.address, garbageBytes20, garbageBytes32)
+    assert cachedDelegator.getDelegationTarget() == delegatorHelperTarget.address
+
+    # Only whitelisted callers can refresh the target
+    with raises(TransactionFailed):
+        cachedDelegator.refreshDelegationTarget(sender=tester.k1)
+
+    assert cachedDelegator.refreshDelegationTarget()
+    assert cachedDelegator.getDelegationTarget() == newTarget.address
+    assert cachedDelegatorHelper.getIntValue() == 7
+
 @fixture(scope="session")
 def localSnapshot(fixture, controllerSnapshot):
     fixture.resetToSnapshot(controllerSnapshot)
@@ -98,6 +124,10 @@ def localSnapshot(fixture, controllerSnapshot):
     fixture.uploadAndAddToController("solidity_test_helpers/DelegatorHelper.sol", targetName, name)
     fixture.uploadAndAddToController("../source/contracts/libraries/Delegator.sol", name, "delegator", constructorArgs=[fixture.contracts['Controller'].address, stringToBytes(targetName)])
     fixture.contracts[name] = fixture.applySignature(name, fixture.contracts[name].address)
+    fixture.upload("solidity_test_helpers/DelegatorHelper.sol", "NewDelegatorHelperTarget", name)
+    cachedName = "CachedDelegatorHelper"
+    fixture.upload("../source/contracts/libraries/CachedDelegator.sol", cachedName, "cachedDelegator", constructorArgs=[fixture.contracts['Controller'].address, stringToBytes(targetName)])
+    fixture.contracts[cachedName] = fixture.applySignature(name, fixture.contracts[cachedName].address)
     return fixture.createSnapshot()
 
 @fixture
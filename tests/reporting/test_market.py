@@ -3,6 +3,7 @@ from ethereum.tools import tester
 from ethereum.tools.tester import TransactionFailed
 from pytest import raises
 from utils import stringToBytes, AssertLog, bytesToHexString
+from constants import YES_NO, CATEGORICAL, SCALAR
 
 tester.STARTGAS = long(6.7 * 10**6)
 
@@ -81,3 +82,57 @@ def test_transfering_ownership(contractsFixture, universe, market):
     }
     with AssertLog(contractsFixture, "MarketMailboxTransferred", transferLog):
         assert mailbox.transferOwnership(tester.a1)
+
+def test_batch_market_creation(contractsFixture, universe, testNetDenominationToken):
+    endTime = long(contractsFixture.contracts["Time"].getTimestamp() + timedelta(days=1).total_seconds())
+    specs = [
+        { 'marketType': YES_NO, 'endTime': endTime, 'description': 'yes or no', 'extraInfo': 'so extra' },
+        { 'marketType': CATEGORICAL, 'endTime': endTime + 1, 'feeDivisor': 50, 'oracle': tester.a1, 'outcomes': ['a', 'b', 'c'], 'description': 'pick one' },
+        { 'marketType': SCALAR, 'endTime': endTime + 2, 'numTicks': 400, 'minPrice': -10, 'maxPrice': 30, 'topic': 'weather', 'description': 'how much' * 10 },
+    ]
+
+    marketCreatedLog = {
+        "description": 'how much' * 10,
+        "extraInfo": '',
+        "universe": universe.address,
+        "marketCreator": bytesToHexString(tester.a2),
+        "minPrice": -10,
+        "maxPrice": 30,
+        "marketType": SCALAR,
+    }
+    with AssertLog(contractsFixture, "MarketCreated", marketCreatedLog, skip=2):
+        yesNoMarket, categoricalMarket, scalarMarket = contractsFixture.createMarkets(universe, specs, sender=tester.k2)
+
+    for market in [yesNoMarket, categoricalMarket, scalarMarket]:
+        assert universe.isContainerForMarket(market.address)
+        assert market.getOwner() == bytesToHexString(tester.a2)
+        assert market.getDenominationToken() == testNetDenominationToken.address
+        assert contractsFixture.contracts['AugurLite'].isKnownShareToken(market.getShareToken(0))
+    assert [yesNoMarket.getEndTime(), categoricalMarket.getEndTime(), scalarMarket.getEndTime()] == [endTime, endTime + 1, endTime + 2]
+    assert [yesNoMarket.getNumberOfOutcomes(), categoricalMarket.getNumberOfOutcomes(), scalarMarket.getNumberOfOutcomes()] == [2, 3, 2]
+    assert [yesNoMarket.getNumTicks(), categoricalMarket.getNumTicks(), scalarMarket.getNumTicks()] == [10000, 10000, 400]
+    assert categoricalMarket.getMarketCreatorSettlementFeeDivisor() == 50
+    assert categoricalMarket.getOracle() == bytesToHexString(tester.a1)
+
+def test_batch_market_creation_validation(contractsFixture, universe):
+    endTime = long(contractsFixture.contracts["Time"].getTimestamp() + timedelta(days=1).total_seconds())
+    yesNoSpec = { 'marketType': YES_NO, 'endTime': endTime }
+
+    # A single bad spec fails the whole batch
+    with raises(TransactionFailed):
+        contractsFixture.createMarkets(universe, [yesNoSpec, { 'marketType': YES_NO, 'endTime': endTime, 'description': '' }])
+    with raises(TransactionFailed):
+        contractsFixture.createMarkets(universe, [yesNoSpec, { 'marketType': SCALAR, 'endTime': endTime, 'numTicks': 401, 'minPrice': 0, 'maxPrice': 1 }])
+    with raises(TransactionFailed):
+        contractsFixture.createMarkets(universe, [yesNoSpec, { 'marketType': CATEGORICAL, 'endTime': endTime, 'outcomes': ['a'] }])
+    with raises(TransactionFailed):
+        contractsFixture.createMarkets(universe, [{ 'marketType': SCALAR + 1, 'endTime': endTime }])
+
+    # The variable length arrays have to be used up exactly
+    with raises(TransactionFailed):
+        universe.createMarkets([tester.a0], [YES_NO, endTime, 100, 0, 0, 11, 0], [0, 0], [''], [], 'descriptio')
+    with raises(TransactionFailed):
+        universe.createMarkets([tester.a0], [YES_NO, endTime, 100, 0, 0, 11, 0], [0, 0], [''], [], 'description!')
+    with raises(TransactionFailed):
+        universe.createMarkets([tester.a0], [YES_NO, endTime, 100, 0, 0, 11, 0], [0, 0], [''], ['a'], 'description')
+    assert universe.createMarkets([tester.a0], [YES_NO, endTime, 100, 0, 0, 11, 0], [0, 0], [''], [], 'description')
@@ -29,6 +29,51 @@ def test_resolve(localFixture, universe, market):
     with raises(TransactionFailed, message="Cannot initial report twice"):
         assert market.resolve([0, market.getNumTicks()], False)
 
+def test_resolveMarkets(localFixture, universe, market, categoricalMarket, scalarMarket):
+    marketResolver = localFixture.contracts['MarketResolver']
+    markets = [market, categoricalMarket, scalarMarket]
+    localFixture.contracts["Time"].setTimestamp(max([resolvingMarket.getEndTime() for resolvingMarket in markets]) + 1)
+    marketAddresses = [resolvingMarket.address for resolvingMarket in markets]
+    payoutNumerators = [0, market.getNumTicks()] + [categoricalMarket.getNumTicks(), 0, 0] + [scalarMarket.getNumTicks() / 2] * 2
+    invalid = [False, False, True]
+
+    # Markets only accept resolutions forwarded from the MarketResolver, not from the controller owner or any other whitelisted caller
+    localFixture.contracts['Controller'].addToWhitelist(tester.a2)
+    for sender in [tester.k0, tester.k1, tester.k2]:
+        with raises(TransactionFailed):
+            market.resolveFor(market.getOracle(), [0, market.getNumTicks()], False, sender=sender)
+
+    # Only the oracle of every market can resolve the batch
+    with raises(TransactionFailed):
+        marketResolver.resolveMarkets(marketAddresses, payoutNumerators, invalid, sender=tester.k1)
+
+    # Every market takes exactly as many payout numerators as it has outcomes
+    with raises(TransactionFailed):
+        marketResolver.resolveMarkets(marketAddresses, payoutNumerators[:-1], invalid)
+    with raises(TransactionFailed):
+        marketResolver.resolveMarkets(marketAddresses, payoutNumerators + [0], invalid)
+    with raises(TransactionFailed):
+        marketResolver.resolveMarkets(marketAddresses, payoutNumerators, invalid[:-1])
+
+    # A bad resolution for one market fails the whole batch
+    with raises(TransactionFailed):
+        marketResolver.resolveMarkets(marketAddresses, payoutNumerators, [False, False, False])
+
+    resolutionLog = {
+        "universe": universe.address,
+        "market": scalarMarket.address,
+    }
+    with AssertLog(localFixture, "MarketResolved", resolutionLog, skip=2):
+        assert marketResolver.resolveMarkets(marketAddresses, payoutNumerators, invalid)
+
+    assert [market.getPayoutNumerator(outcome) for outcome in range(0, 2)] == [0, market.getNumTicks()]
+    assert [categoricalMarket.getPayoutNumerator(outcome) for outcome in range(0, 3)] == [categoricalMarket.getNumTicks(), 0, 0]
+    assert [resolvedMarket.isInvalid() for resolvedMarket in markets] == invalid
+    assert len(set([resolvedMarket.getResolutionTime() for resolvedMarket in markets])) == 1
+
+    with raises(TransactionFailed):
+        marketResolver.resolveMarkets([market.address], [0, market.getNumTicks()], [False])
+
 @fixture(scope="session")
 def localSnapshot(fixture, kitchenSinkSnapshot):
     fixture.resetToSnapshot(kitchenSinkSnapshot)
@@ -12,6 +12,16 @@ contract MockAugurLite is Controlled {
   function reset() public {
     logMarketCreatedCalledValue = false;
     logMarketResolvedCalledValue = false;
+    registerShareTokensCalledValue = false;
+  }
+
+  bool private registerShareTokensCalledValue;
+
+  function registerShareTokensCalled() public returns(bool) {return registerShareTokensCalledValue;}
+
+  function registerShareTokens(IMarket _market) public returns (bool) {
+    registerShareTokensCalledValue = true;
+    return true;
   }
 
   function trustedTransfer(ERC20 _token, address _from, address _to, uint256 _amount) public onlyWhitelistedCallers returns (bool) {
@@ -64,6 +74,14 @@ contract MockAugurLite is Controlled {
     return true;
   }
 
+  function logShareLedgerMinted(IUniverse _universe, IShareToken[] _shareTokens, address _target, uint256 _amount) public returns (bool) {
+    return true;
+  }
+
+  function logShareLedgerBurned(IUniverse _universe, IShareToken[] _shareTokens, address _target, uint256 _amount) public returns (bool) {
+    return true;
+  }
+
   bool private logUniverseCreatedCalledValue;
 
   function logUniverseCreatedCalled() public returns(bool) { return logUniverseCreatedCalledValue;}
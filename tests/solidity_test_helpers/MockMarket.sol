@@ -132,7 +132,7 @@ contract MockMarket is IMarket {
     return "Market";
   }
 
-  function initialize(IUniverse _universe, uint256 _endTime, uint256 _feePerEthInAttoeth, ERC20 _token, address _oracle, address _creator, uint256 _numOutcomes, uint256 _numTicks) public returns (bool _success) {
+  function initialize(IUniverse _universe, uint256 _endTime, uint256 _feePerEthInAttoeth, ERC20 _token, address _oracle, address _creator, uint256 _numOutcomes, uint256 _numTicks, bool, bool) public returns (bool _success) {
     initializeUniverseValue = _universe;
     initializeEndTime = _endTime;
     initializeNumOutcomesValue = _numOutcomes;
@@ -168,6 +168,10 @@ contract MockMarket is IMarket {
     return shareToken;
   }
 
+  function getShareLedger() public view returns (IShareLedger) {
+    return IShareLedger(0);
+  }
+
   function getOracle() public view returns (address) {
     return oracle;
   }
@@ -196,6 +200,10 @@ contract MockMarket is IMarket {
     return setMarketCreatorMailbox;
   }
 
+  function getOrCreateMarketCreatorMailbox() public returns (IMailbox) {
+    return setMarketCreatorMailbox;
+  }
+
   function getPayoutDistributionHash() public view returns (bytes32) {
     return bytes32(0);
   }
@@ -204,10 +212,42 @@ contract MockMarket is IMarket {
     return 0;
   }
 
+  function resolve(uint256[], bool) public returns (bool) {
+    return true;
+  }
+
+  function resolveFor(address, uint256[], bool) public returns (bool) {
+    return true;
+  }
+
   function isResolved() public view returns (bool) {
     return true;
   }
 
+  function mintCompleteSets(address, uint256) public returns (bool) {
+    return true;
+  }
+
+  function burnCompleteSets(address, uint256) public returns (bool) {
+    return true;
+  }
+
+  function destroyShares(uint256, address, uint256) public returns (bool) {
+    return true;
+  }
+
+  function recordProceedsClaimed(uint256) public returns (bool) {
+    return true;
+  }
+
+  function getOpenInterest() public view returns (uint256) {
+    return 0;
+  }
+
+  function calculateOpenInterest() public view returns (uint256) {
+    return 0;
+  }
+
   function assertBalances() public view returns (bool) {
     return true;
   }
@@ -20,6 +20,23 @@ def test_log_requires(augur, universe):
     with raises(TransactionFailed):
         augur.logMarketCreated("", "", "", augur.address, augur.address, augur.address, 0, 100, 0)
 
+def test_share_token_registry(localFixture, augur, universe, categoricalMarket):
+    for outcome in range(0, categoricalMarket.getNumberOfOutcomes()):
+        assert augur.isKnownShareToken(categoricalMarket.getShareToken(outcome))
+    assert not augur.isKnownShareToken(categoricalMarket.address)
+
+    # Only a known universe can register share tokens, and only for its own markets
+    with raises(TransactionFailed):
+        augur.registerShareTokens(categoricalMarket.address)
+
+    # Log forwards are only accepted from registered share tokens
+    with raises(TransactionFailed):
+        augur.logShareTokensTransferred(universe.address, tester.a0, tester.a1, 1)
+    with raises(TransactionFailed):
+        augur.logShareTokenMinted(universe.address, tester.a0, 1)
+    with raises(TransactionFailed):
+        augur.logShareTokenBurned(universe.address, tester.a0, 1)
+
 @pytest_fixture(scope="session")
 def localSnapshot(fixture, kitchenSinkSnapshot):
     fixture.resetToSnapshot(kitchenSinkSnapshot)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+from ethereum.tools import tester
+from ethereum.tools.tester import TransactionFailed
+from pytest import raises
+from utils import stringToBytes, bytesToHexString
+from constants import YES, NO
+
+MINIMAL_PROXY_SIZE = 45
+
+def test_clone_markets(kitchenSinkFixture, universe, testNetDenominationToken):
+    kitchenSinkFixture.useMinimalProxies()
+    market = kitchenSinkFixture.createReasonableCategoricalMarket(universe, 3, testNetDenominationToken)
+    mailbox = kitchenSinkFixture.applySignature('Mailbox', market.getMarketCreatorMailbox())
+    shareTokens = [kitchenSinkFixture.getShareToken(market, outcome) for outcome in range(0, 3)]
+
+    for proxy in [market, mailbox] + shareTokens:
+        assert len(kitchenSinkFixture.chain.head_state.get_code(proxy.address)) == MINIMAL_PROXY_SIZE
+        assert proxy.getController() == kitchenSinkFixture.contracts['Controller'].address
+    assert market.controllerLookupName() == stringToBytes("Market")
+    assert market.getUniverse() == universe.address
+    assert market.getNumberOfOutcomes() == 3
+    assert mailbox.getOwner() == bytesToHexString(tester.a0)
+    assert shareTokens[2].getMarket() == market.address
+    assert shareTokens[2].getOutcome() == 2
+    assert universe.isContainerForMarket(market.address)
+    assert kitchenSinkFixture.contracts['AugurLite'].isKnownShareToken(shareTokens[0].address)
+
+    # Clones get their controller from their init code and are initialized once by their factory, so they can't be taken over afterwards
+    with raises(TransactionFailed):
+        market.initialize(universe.address, market.getEndTime(), 0, testNetDenominationToken.address, tester.a1, tester.a1, 3, market.getNumTicks(), False, False, sender=tester.k1)
+    with raises(TransactionFailed):
+        mailbox.initialize(tester.a1, market.address, sender=tester.k1)
+    with raises(TransactionFailed):
+        shareTokens[0].initialize(market.address, 0)
+
+def test_clone_market_lifecycle(kitchenSinkFixture, universe, testNetDenominationToken):
+    kitchenSinkFixture.useMinimalProxies()
+    completeSets = kitchenSinkFixture.contracts['CompleteSets']
+    claimTradingProceeds = kitchenSinkFixture.contracts['ClaimTradingProceeds']
+    market = kitchenSinkFixture.createReasonableYesNoMarket(universe, testNetDenominationToken)
+    yesShareToken = kitchenSinkFixture.getShareToken(market, YES)
+
+    testNetDenominationToken.depositEther(sender=tester.k1, value=10 * market.getNumTicks())
+    assert completeSets.publicBuyCompleteSets(market.address, 10, sender=tester.k1)
+    assert yesShareToken.transfer(tester.a2, 4, sender=tester.k1)
+    assert completeSets.publicSellCompleteSets(market.address, 2, sender=tester.k1)
+    assert yesShareToken.balanceOf(tester.a1) == 4
+    assert kitchenSinkFixture.getShareToken(market, NO).balanceOf(tester.a1) == 8
+
+    kitchenSinkFixture.contracts["Time"].setTimestamp(market.getEndTime() + 1)
+    assert market.resolve([0, market.getNumTicks()], False)
+    kitchenSinkFixture.contracts["Time"].setTimestamp(market.getResolutionTime() + 1)
+    assert claimTradingProceeds.claimTradingProceeds(market.address, tester.a2)
+    assert yesShareToken.balanceOf(tester.a2) == 0
+    assert testNetDenominationToken.balanceOf(market.getMarketCreatorMailbox()) > 0
+
+    mailbox = kitchenSinkFixture.applySignature('Mailbox', market.getMarketCreatorMailbox())
+    assert mailbox.withdrawTokens(testNetDenominationToken.address)
+    assert testNetDenominationToken.balanceOf(mailbox.address) == 0
+
+def test_delegator_markets_unaffected(kitchenSinkFixture, universe, testNetDenominationToken, market):
+    # Markets created before the switch keep their Delegator and work alongside clones
+    kitchenSinkFixture.useMinimalProxies()
+    cloneMarket = kitchenSinkFixture.createReasonableYesNoMarket(universe, testNetDenominationToken)
+    assert len(kitchenSinkFixture.chain.head_state.get_code(market.address)) > MINIMAL_PROXY_SIZE
+    assert len(kitchenSinkFixture.chain.head_state.get_code(cloneMarket.address)) == MINIMAL_PROXY_SIZE
+
+    testNetDenominationToken.depositEther(sender=tester.k1, value=market.getNumTicks() + cloneMarket.getNumTicks())
+    for tradedMarket in [market, cloneMarket]:
+        assert kitchenSinkFixture.contracts['CompleteSets'].publicBuyCompleteSets(tradedMarket.address, 1, sender=tester.k1)
+        assert kitchenSinkFixture.getShareToken(tradedMarket, YES).balanceOf(tester.a1) == 1
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+from ethereum.tools import tester
+from ethereum.tools.tester import TransactionFailed
+from pytest import raises
+from utils import bytesToHexString, longToHexString
+from constants import YES, NO
+
+def test_deferred_market_creation(kitchenSinkFixture, universe, testNetDenominationToken):
+    kitchenSinkFixture.deferMarketAssets()
+    market = kitchenSinkFixture.createReasonableCategoricalMarket(universe, 3, testNetDenominationToken)
+
+    assert market.getMarketCreatorMailbox() == longToHexString(0)
+    for outcome in range(0, 3):
+        assert market.getShareToken(outcome) == longToHexString(0)
+    with raises(TransactionFailed):
+        market.getShareToken(3)
+    assert not kitchenSinkFixture.contracts['AugurLite'].isKnownShareToken(longToHexString(0))
+    assert market.calculateOpenInterest() == 0
+    assert universe.isContainerForMarket(market.address)
+
+    addresses, values = kitchenSinkFixture.contracts['MarketReader'].getPosition(market.address, tester.a1)
+    assert addresses[4:] == [longToHexString(0)] * 4
+    assert values[6:] == [0] * 15
+
+    # Nothing can be sold or claimed before the first purchase, and claiming an idle market still works
+    with raises(TransactionFailed):
+        kitchenSinkFixture.contracts['CompleteSets'].publicSellCompleteSets(market.address, 1, sender=tester.k1)
+    kitchenSinkFixture.contracts["Time"].setTimestamp(market.getEndTime() + 1)
+    assert market.resolve([0, 0, market.getNumTicks()], False)
+    kitchenSinkFixture.contracts["Time"].setTimestamp(market.getResolutionTime() + 1)
+    assert kitchenSinkFixture.contracts['ClaimTradingProceeds'].claimTradingProceeds(market.address, tester.a1)
+    assert market.getMarketCreatorMailbox() == longToHexString(0)
+
+def test_deferred_market_lifecycle(kitchenSinkFixture, universe, testNetDenominationToken):
+    kitchenSinkFixture.deferMarketAssets()
+    completeSets = kitchenSinkFixture.contracts['CompleteSets']
+    claimTradingProceeds = kitchenSinkFixture.contracts['ClaimTradingProceeds']
+    market = kitchenSinkFixture.createReasonableYesNoMarket(universe, testNetDenominationToken)
+    testNetDenominationToken.depositEther(sender=tester.k1, value=10 * market.getNumTicks())
+
+    # The first purchase creates and registers the share tokens
+    assert completeSets.publicBuyCompleteSets(market.address, 10, sender=tester.k1)
+    yesShareToken = kitchenSinkFixture.getShareToken(market, YES)
+    noShareToken = kitchenSinkFixture.getShareToken(market, NO)
+    for shareToken in [yesShareToken, noShareToken]:
+        assert shareToken.getMarket() == market.address
+        assert shareToken.balanceOf(tester.a1) == 10
+        assert market.isContainerForShareToken(shareToken.address)
+        assert kitchenSinkFixture.contracts['AugurLite'].isKnownShareToken(shareToken.address)
+    assert kitchenSinkFixture.assertOpenInterest(market) == 10 * market.getNumTicks()
+
+    # Later purchases reuse them
+    testNetDenominationToken.depositEther(sender=tester.k1, value=market.getNumTicks())
+    assert completeSets.publicBuyCompleteSets(market.address, 1, sender=tester.k1)
+    assert market.getShareToken(YES) == yesShareToken.address
+    assert yesShareToken.balanceOf(tester.a1) == 11
+
+    # Buying pays no fee, so the mailbox only appears with the first sale
+    assert market.getMarketCreatorMailbox() == longToHexString(0)
+    assert completeSets.publicSellCompleteSets(market.address, 5, sender=tester.k1)
+    mailbox = kitchenSinkFixture.applySignature('Mailbox', market.getMarketCreatorMailbox())
+    assert mailbox.getOwner() == bytesToHexString(tester.a0)
+    assert testNetDenominationToken.balanceOf(mailbox.address) == market.deriveMarketCreatorFeeAmount(5 * market.getNumTicks())
+
+    assert yesShareToken.transfer(tester.a2, 6, sender=tester.k1)
+    kitchenSinkFixture.contracts["Time"].setTimestamp(market.getEndTime() + 1)
+    assert market.resolve([0, market.getNumTicks()], False)
+    kitchenSinkFixture.contracts["Time"].setTimestamp(market.getResolutionTime() + 1)
+    assert claimTradingProceeds.claimTradingProceeds(market.address, tester.a2)
+    assert market.getMarketCreatorMailbox() == mailbox.address
+    assert kitchenSinkFixture.assertOpenInterest(market) == 0
+    assert mailbox.withdrawTokens(testNetDenominationToken.address)
+    assert testNetDenominationToken.balanceOf(mailbox.address) == 0
+
+def test_deferred_mailbox_owner(kitchenSinkFixture, universe, testNetDenominationToken):
+    kitchenSinkFixture.deferMarketAssets()
+    completeSets = kitchenSinkFixture.contracts['CompleteSets']
+    market = kitchenSinkFixture.createReasonableYesNoMarket(universe, testNetDenominationToken)
+    testNetDenominationToken.depositEther(sender=tester.k1, value=market.getNumTicks())
+    assert completeSets.publicBuyCompleteSets(market.address, 1, sender=tester.k1)
+
+    # The mailbox goes to whoever owns the market when it is created
+    assert market.transferOwnership(tester.a3)
+    assert market.getOrCreateMarketCreatorMailbox(sender=tester.k2)
+    mailbox = kitchenSinkFixture.applySignature('Mailbox', market.getMarketCreatorMailbox())
+    assert mailbox.getOwner() == bytesToHexString(tester.a3)
+
+    assert completeSets.publicSellCompleteSets(market.address, 1, sender=tester.k1)
+    assert market.getMarketCreatorMailbox() == mailbox.address
+    assert testNetDenominationToken.balanceOf(mailbox.address) > 0
+
+def test_markets_are_eager_by_default(kitchenSinkFixture, market):
+    marketFactory = kitchenSinkFixture.applySignature('MarketFactory', kitchenSinkFixture.contracts['Controller'].lookup('MarketFactory'))
+    assert not marketFactory.deferMarketAssets()
+    assert market.getMarketCreatorMailbox() != longToHexString(0)
+    assert market.getShareToken(YES) != longToHexString(0)
+    assert market.getOrCreateMarketCreatorMailbox() == market.getMarketCreatorMailbox()
@@ -1,16 +1,45 @@
+import ethereum.opcodes
 from ethereum.tools import tester
 from ethereum.tools.tester import ABIContract, TransactionFailed
 from pytest import fixture, mark, raises
-from utils import longTo32Bytes, PrintGasUsed, fix
+from utils import longTo32Bytes, GasBenchmark, fix
+from contextlib import contextmanager
 from datetime import timedelta
 from reporting_utils import proceedToResolution
+from constants import YES_NO
 
-# Market Methods
-MARKET_CREATION =               1758793
-RESOLVE =                       1061824
+# Baselines live in gas_baselines.json. Run with --updateGasBaselines to record new ones and --gasTolerance to allow some slack. A benchmark without a baseline fails unless --allowMissingGasBaselines is passed.
 
 tester.STARTGAS = long(6.7 * 10**6)
 
+OUTCOME_COUNTS = range(2, 9)
+MAINNET_GCONTRACTBYTE = 200
+
+@contextmanager
+def codeDepositCharged():
+    # conftest makes code deposit free. Creation benchmarks charge the mainnet price again so they report total deployment gas, which is where smaller proxies save the most
+    ethereum.opcodes.GCONTRACTBYTE = MAINNET_GCONTRACTBYTE
+    try:
+        yield
+    finally:
+        ethereum.opcodes.GCONTRACTBYTE = 0
+
+def createMarket(fixture, universe, denominationToken, numOutcomes):
+    if numOutcomes == 2:
+        return fixture.createReasonableYesNoMarket(universe, denominationToken)
+    return fixture.createReasonableCategoricalMarket(universe, numOutcomes, denominationToken)
+
+def buyCompleteSets(fixture, denominationToken, market, amount, sender):
+    denominationToken.depositEther(sender=sender, value=amount * market.getNumTicks())
+    assert fixture.contracts['CompleteSets'].publicBuyCompleteSets(market.address, amount, sender=sender)
+
+def resolveToFirstOutcome(fixture, market):
+    proceedToResolution(fixture, market)
+    payoutNumerators = [0] * market.getNumberOfOutcomes()
+    payoutNumerators[0] = market.getNumTicks()
+    market.resolve(payoutNumerators, False)
+    fixture.contracts["Time"].setTimestamp(market.getResolutionTime() + 1)
+
 def test_marketCreation(localFixture, universe, testNetDenominationToken):
     endTime = long(localFixture.chain.head_state.timestamp + timedelta(days=1).total_seconds())
     feePerEthInWei = 10**16
@@ -19,15 +48,175 @@ def test_marketCreation(localFixture, universe, testNetDenominationToken):
     numTicks = 10 ** 18
     numOutcomes = 2
 
-    with PrintGasUsed(localFixture, "Universe:createYesNoMarket", MARKET_CREATION):
+    with GasBenchmark(localFixture, "Universe:createYesNoMarket"):
         marketAddress = universe.createYesNoMarket(endTime, feePerEthInWei, denominationToken.address, designatedReporterAddress, "", "description", "")
 
+@mark.parametrize('numOutcomes', OUTCOME_COUNTS)
+@mark.parametrize('minimalProxies', [False, True])
+def test_marketCreationByProxyType(localFixture, universe, testNetDenominationToken, numOutcomes, minimalProxies):
+    if minimalProxies:
+        localFixture.useMinimalProxies()
+    proxyType = "Clone" if minimalProxies else "Delegator"
+
+    with codeDepositCharged():
+        with GasBenchmark(localFixture, "Universe:createMarket:%s:%i" % (proxyType, numOutcomes)):
+            createMarket(localFixture, universe, testNetDenominationToken, numOutcomes)
+
+@mark.parametrize('numOutcomes', OUTCOME_COUNTS)
+def test_deferredMarketAssets(localFixture, universe, testNetDenominationToken, numOutcomes):
+    localFixture.deferMarketAssets()
+    completeSets = localFixture.contracts['CompleteSets']
+
+    # Deferral moves contract deployments from creation to the first purchase and sale, so all three pay for the code they deposit
+    with codeDepositCharged():
+        with GasBenchmark(localFixture, "Universe:createMarket:Deferred:%i" % numOutcomes):
+            market = createMarket(localFixture, universe, testNetDenominationToken, numOutcomes)
+        testNetDenominationToken.depositEther(sender=tester.k1, value=10 * market.getNumTicks())
+
+        with GasBenchmark(localFixture, "CompleteSets:publicBuyCompleteSets:Deferred:%i" % numOutcomes):
+            completeSets.publicBuyCompleteSets(market.address, 5, sender=tester.k1)
+
+        with GasBenchmark(localFixture, "CompleteSets:publicSellCompleteSets:Deferred:%i" % numOutcomes):
+            completeSets.publicSellCompleteSets(market.address, 5, sender=tester.k1)
+
+@mark.parametrize('numOutcomes', [3, 8])
+def test_categoricalMarketCreation(localFixture, universe, testNetDenominationToken, numOutcomes):
+    endTime = long(localFixture.chain.head_state.timestamp + timedelta(days=1).total_seconds())
+
+    with GasBenchmark(localFixture, "Universe:createCategoricalMarket:%i" % numOutcomes):
+        universe.createCategoricalMarket(endTime, 100, testNetDenominationToken.address, tester.a0, [" "] * numOutcomes, "", "description", "")
+
+def test_scalarMarketCreation(localFixture, universe, testNetDenominationToken):
+    endTime = long(localFixture.chain.head_state.timestamp + timedelta(days=1).total_seconds())
+
+    with GasBenchmark(localFixture, "Universe:createScalarMarket"):
+        universe.createScalarMarket(endTime, 100, testNetDenominationToken.address, tester.a0, -10, 30, 400000, "", "description", "")
+
+@mark.parametrize('batchSize', [1, 10, 50])
+def test_batchMarketCreation(localFixture, universe, batchSize):
+    endTime = long(localFixture.contracts["Time"].getTimestamp() + timedelta(days=1).total_seconds())
+    specs = [{ 'marketType': YES_NO, 'endTime': endTime }] * batchSize
+    startingGas = localFixture.chain.head_state.gas_used
+
+    localFixture.createMarkets(universe, specs, startgas=long(batchSize * 2 * 10**6))
+
+    # Reported per market so the batch sizes compare with each other and with Universe:createYesNoMarket
+    localFixture.gasBaselines.check("Universe:createMarkets:perMarket:%i" % batchSize, (localFixture.chain.head_state.gas_used - startingGas) / batchSize)
+
 def test_resolve(localFixture, market):
     proceedToResolution(localFixture, market)
 
-    with PrintGasUsed(localFixture, "Market:resolve", RESOLVE):
+    with GasBenchmark(localFixture, "Market:resolve"):
         market.resolve([0, market.getNumTicks()], False)
 
+@mark.parametrize('batchSize', [1, 10, 50])
+def test_batchResolve(localFixture, universe, batchSize):
+    endTime = long(localFixture.contracts["Time"].getTimestamp() + timedelta(days=1).total_seconds())
+    markets = localFixture.createMarkets(universe, [{ 'marketType': YES_NO, 'endTime': endTime }] * batchSize, startgas=long(batchSize * 2 * 10**6))
+    localFixture.contracts["Time"].setTimestamp(endTime + 1)
+    startingGas = localFixture.chain.head_state.gas_used
+
+    localFixture.contracts['MarketResolver'].resolveMarkets([market.address for market in markets], [0, markets[0].getNumTicks()] * batchSize, [False] * batchSize, startgas=long(batchSize * 10**6))
+
+    localFixture.gasBaselines.check("MarketResolver:resolveMarkets:perMarket:%i" % batchSize, (localFixture.chain.head_state.gas_used - startingGas) / batchSize)
+
+@mark.parametrize('numOutcomes', OUTCOME_COUNTS)
+def test_publicBuyCompleteSets(localFixture, universe, testNetDenominationToken, numOutcomes):
+    market = createMarket(localFixture, universe, testNetDenominationToken, numOutcomes)
+    completeSets = localFixture.contracts['CompleteSets']
+    testNetDenominationToken.depositEther(sender=tester.k1, value=10 * market.getNumTicks())
+
+    with GasBenchmark(localFixture, "CompleteSets:publicBuyCompleteSets:%i" % numOutcomes):
+        completeSets.publicBuyCompleteSets(market.address, 10, sender=tester.k1)
+
+@mark.parametrize('numOutcomes', OUTCOME_COUNTS)
+def test_publicSellCompleteSets(localFixture, universe, testNetDenominationToken, numOutcomes):
+    market = createMarket(localFixture, universe, testNetDenominationToken, numOutcomes)
+    completeSets = localFixture.contracts['CompleteSets']
+    buyCompleteSets(localFixture, testNetDenominationToken, market, 10, tester.k1)
+
+    with GasBenchmark(localFixture, "CompleteSets:publicSellCompleteSets:%i" % numOutcomes):
+        completeSets.publicSellCompleteSets(market.address, 10, sender=tester.k1)
+
+@mark.parametrize('batchSize', [1, 10, 50])
+def test_batchCompleteSets(localFixture, universe, testNetDenominationToken, batchSize):
+    markets = [createMarket(localFixture, universe, testNetDenominationToken, 2) for _ in range(0, batchSize)]
+    completeSets = localFixture.contracts['CompleteSets']
+    testNetDenominationToken.depositEther(sender=tester.k1, value=10 * markets[0].getNumTicks() * batchSize)
+    marketAddresses = [market.address for market in markets]
+
+    # Reported per market so the batch sizes compare with each other and with the single market benchmarks
+    startingGas = localFixture.chain.head_state.gas_used
+    completeSets.publicBatchBuyCompleteSets(marketAddresses, [10] * batchSize, sender=tester.k1, startgas=long(batchSize * 10**6))
+    localFixture.gasBaselines.check("CompleteSets:publicBatchBuyCompleteSets:perMarket:%i" % batchSize, (localFixture.chain.head_state.gas_used - startingGas) / batchSize)
+
+    startingGas = localFixture.chain.head_state.gas_used
+    completeSets.publicBatchSellCompleteSets(marketAddresses, [10] * batchSize, sender=tester.k1, startgas=long(batchSize * 10**6))
+    localFixture.gasBaselines.check("CompleteSets:publicBatchSellCompleteSets:perMarket:%i" % batchSize, (localFixture.chain.head_state.gas_used - startingGas) / batchSize)
+
+@mark.parametrize('numOutcomes', OUTCOME_COUNTS)
+def test_shareLedgerCompleteSets(localFixture, universe, testNetDenominationToken, numOutcomes):
+    localFixture.useShareLedger()
+    with GasBenchmark(localFixture, "Universe:createMarket:ShareLedger:%i" % numOutcomes):
+        market = createMarket(localFixture, universe, testNetDenominationToken, numOutcomes)
+    completeSets = localFixture.contracts['CompleteSets']
+    testNetDenominationToken.depositEther(sender=tester.k1, value=10 * market.getNumTicks())
+
+    with GasBenchmark(localFixture, "CompleteSets:publicBuyCompleteSets:ShareLedger:%i" % numOutcomes):
+        completeSets.publicBuyCompleteSets(market.address, 10, sender=tester.k1)
+
+    with GasBenchmark(localFixture, "CompleteSets:publicSellCompleteSets:ShareLedger:%i" % numOutcomes):
+        completeSets.publicSellCompleteSets(market.address, 10, sender=tester.k1)
+
+@mark.parametrize('numOutcomes', OUTCOME_COUNTS)
+def test_claimTradingProceeds(localFixture, universe, testNetDenominationToken, numOutcomes):
+    market = createMarket(localFixture, universe, testNetDenominationToken, numOutcomes)
+    claimTradingProceeds = localFixture.contracts['ClaimTradingProceeds']
+    buyCompleteSets(localFixture, testNetDenominationToken, market, 10, tester.k1)
+    resolveToFirstOutcome(localFixture, market)
+
+    with GasBenchmark(localFixture, "ClaimTradingProceeds:claimTradingProceeds:%i" % numOutcomes):
+        claimTradingProceeds.claimTradingProceeds(market.address, tester.a1)
+
+@mark.parametrize('numMarkets', [1, 10])
+def test_batchClaimTradingProceeds(localFixture, universe, testNetDenominationToken, numMarkets):
+    claimTradingProceeds = localFixture.contracts['ClaimTradingProceeds']
+    shareHolders = [getattr(tester, 'a%i' % index) for index in range(0, 10)]
+    markets = [createMarket(localFixture, universe, testNetDenominationToken, 2) for _ in range(0, numMarkets)]
+    for market in markets:
+        for index in range(0, len(shareHolders)):
+            buyCompleteSets(localFixture, testNetDenominationToken, market, 10, getattr(tester, 'k%i' % index))
+    for market in markets:
+        resolveToFirstOutcome(localFixture, market)
+
+    with GasBenchmark(localFixture, "ClaimTradingProceeds:batchClaimTradingProceeds:%i" % (numMarkets * len(shareHolders))):
+        claimTradingProceeds.batchClaimTradingProceeds([market.address for market in markets for _ in shareHolders], shareHolders * numMarkets)
+
+def test_shareTokenTransfer(localFixture, testNetDenominationToken, market):
+    buyCompleteSets(localFixture, testNetDenominationToken, market, 10, tester.k1)
+    shareToken = localFixture.getShareToken(market, 0)
+
+    with GasBenchmark(localFixture, "ShareToken:transfer"):
+        shareToken.transfer(tester.a2, 5, sender=tester.k1)
+
+def test_shareTokenTransferFrom(localFixture, testNetDenominationToken, market):
+    buyCompleteSets(localFixture, testNetDenominationToken, market, 10, tester.k1)
+    shareToken = localFixture.getShareToken(market, 0)
+    shareToken.approve(tester.a2, 5, sender=tester.k1)
+
+    with GasBenchmark(localFixture, "ShareToken:transferFrom"):
+        shareToken.transferFrom(tester.a1, tester.a3, 5, sender=tester.k2)
+
+def test_mailboxWithdrawTokens(localFixture, universe, testNetDenominationToken, market):
+    buyCompleteSets(localFixture, testNetDenominationToken, market, 10, tester.k1)
+    resolveToFirstOutcome(localFixture, market)
+    localFixture.contracts['ClaimTradingProceeds'].claimTradingProceeds(market.address, tester.a1)
+    mailbox = localFixture.applySignature('Mailbox', market.getMarketCreatorMailbox())
+    assert testNetDenominationToken.balanceOf(mailbox.address) > 0
+
+    with GasBenchmark(localFixture, "Mailbox:withdrawTokens"):
+        mailbox.withdrawTokens(testNetDenominationToken.address)
+
 
 @fixture(scope="session")
 def localSnapshot(fixture, kitchenSinkSnapshot):
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+from ethereum.tools import tester
+from pytest import fixture as pytest_fixture
+from constants import YES, NO
+
+MARKET_ADDRESSES = 5
+MARKET_VALUES = 6
+OUTCOME_VALUES = 5
+
+def test_position_of_open_market(kitchenSinkFixture, marketReader, universe, testNetDenominationToken, market):
+    buyCompleteSets(kitchenSinkFixture, testNetDenominationToken, market, 7, tester.k1)
+
+    addresses, values = marketReader.getPosition(market.address, tester.a1)
+
+    assert addresses[:MARKET_ADDRESSES] == [universe.address, testNetDenominationToken.address, market.getOracle(), market.getOwner(), market.getMarketCreatorMailbox()]
+    assert addresses[MARKET_ADDRESSES:] == [market.getShareToken(NO), market.getShareToken(YES)]
+    assert values[:MARKET_VALUES] == [2, market.getNumTicks(), market.getMarketCreatorSettlementFeeDivisor(), market.getEndTime(), 0, 0]
+    assert values[MARKET_VALUES:] == [7, 0, 0, 0, 0] * 2
+
+def test_positions_of_resolved_markets(kitchenSinkFixture, marketReader, testNetDenominationToken, market, categoricalMarket):
+    claimTradingProceeds = kitchenSinkFixture.contracts['ClaimTradingProceeds']
+    buyCompleteSets(kitchenSinkFixture, testNetDenominationToken, market, 3, tester.k1)
+    buyCompleteSets(kitchenSinkFixture, testNetDenominationToken, categoricalMarket, 5, tester.k1)
+    resolveMarket(kitchenSinkFixture, market, [0, market.getNumTicks()])
+    resolveMarket(kitchenSinkFixture, categoricalMarket, [0, 0, categoricalMarket.getNumTicks()])
+
+    addresses, values = marketReader.getPositions([market.address, categoricalMarket.address], tester.a1)
+
+    assert len(addresses) == 2 * MARKET_ADDRESSES + 5
+    assert len(values) == 2 * MARKET_VALUES + 5 * OUTCOME_VALUES
+    categoricalAddresses = addresses[MARKET_ADDRESSES + 2:]
+    categoricalValues = values[MARKET_VALUES + 2 * OUTCOME_VALUES:]
+    assert categoricalAddresses[4] == categoricalMarket.getMarketCreatorMailbox()
+    assert categoricalAddresses[MARKET_ADDRESSES:] == [categoricalMarket.getShareToken(outcome) for outcome in range(0, 3)]
+    assert categoricalValues[0] == 3
+    assert categoricalValues[4] == categoricalMarket.getResolutionTime()
+
+    # Projected proceeds match what claiming pays
+    for positionMarket, outcomeValues in [(market, values[MARKET_VALUES:MARKET_VALUES + 2 * OUTCOME_VALUES]), (categoricalMarket, categoricalValues[MARKET_VALUES:])]:
+        for outcome in range(0, positionMarket.getNumberOfOutcomes()):
+            balance, payoutNumerator, proceeds, shareHolderShare, creatorShare = outcomeValues[outcome * OUTCOME_VALUES:(outcome + 1) * OUTCOME_VALUES]
+            assert balance == kitchenSinkFixture.getShareToken(positionMarket, outcome).balanceOf(tester.a1)
+            assert payoutNumerator == positionMarket.getPayoutNumerator(outcome)
+            assert [proceeds, shareHolderShare, creatorShare] == claimTradingProceeds.divideUpWinnings(positionMarket.address, outcome, balance)
+
+    initialBalance = testNetDenominationToken.balanceOf(tester.a1)
+    claimTradingProceeds.claimTradingProceeds(market.address, tester.a1)
+    assert testNetDenominationToken.balanceOf(tester.a1) == initialBalance + values[MARKET_VALUES + OUTCOME_VALUES + 3]
+
+def buyCompleteSets(fixture, denominationToken, market, amount, sender):
+    denominationToken.depositEther(sender=sender, value=amount * market.getNumTicks())
+    assert fixture.contracts['CompleteSets'].publicBuyCompleteSets(market.address, amount, sender=sender)
+
+def resolveMarket(fixture, market, payoutNumerators):
+    fixture.contracts["Time"].setTimestamp(market.getEndTime() + 1)
+    market.resolve(payoutNumerators, False)
+    fixture.contracts["Time"].setTimestamp(market.getResolutionTime() + 1)
+
+@pytest_fixture
+def marketReader(kitchenSinkFixture):
+    return kitchenSinkFixture.contracts['MarketReader']
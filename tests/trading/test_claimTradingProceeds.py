@@ -135,13 +135,16 @@ def test_redeem_shares_in_categorical_market(isInvalid, kitchenSinkFixture, univ
         resolveMarket(kitchenSinkFixture, market, [invalidPayout, invalidPayout, invalidPayout], True)
     else:
         resolveMarket(kitchenSinkFixture, market, [0, 0, numTicks])
+    kitchenSinkFixture.assertOpenInterest(market)
 
     # redeem shares with a1
     initialLongHolderToken = testNetDenominationToken.balanceOf(tester.a1)
     claimTradingProceeds.claimTradingProceeds(market.address, tester.a1)
+    kitchenSinkFixture.assertOpenInterest(market)
     # redeem shares with a2
     initialShortHolderToken = testNetDenominationToken.balanceOf(tester.a2)
     claimTradingProceeds.claimTradingProceeds(market.address, tester.a2)
+    assert kitchenSinkFixture.assertOpenInterest(market) == 0
 
     # assert both accounts are paid (or not paid) accordingly
     assert testNetDenominationToken.balanceOf(tester.a1) == (initialLongHolderToken + expectedPayout)
@@ -204,3 +207,83 @@ def test_reedem_failure(kitchenSinkFixture, testNetDenominationToken, market):
     kitchenSinkFixture.contracts["Time"].setTimestamp(market.getResolutionTime() + 1)
     # validate that everything else is OK
     assert claimTradingProceeds.claimTradingProceeds(market.address, tester.a1)
+
+def test_batch_redeem_shares(kitchenSinkFixture, universe, testNetDenominationToken, market, categoricalMarket):
+    claimTradingProceeds = kitchenSinkFixture.contracts['ClaimTradingProceeds']
+    numTicks = market.getNumTicks()
+    expectedMarketCreatorFees = numTicks / market.getMarketCreatorSettlementFeeDivisor()
+    expectedPayout = long(numTicks - expectedMarketCreatorFees)
+
+    # a1 is long and a2 is short in both markets
+    acquireLongShares(kitchenSinkFixture, testNetDenominationToken, market, YES, 1, claimTradingProceeds.address, sender = tester.k1)
+    acquireShortShareSet(kitchenSinkFixture, testNetDenominationToken, market, YES, 1, claimTradingProceeds.address, sender = tester.k2)
+    acquireLongShares(kitchenSinkFixture, testNetDenominationToken, categoricalMarket, 2, 1, claimTradingProceeds.address, sender = tester.k1)
+    acquireShortShareSet(kitchenSinkFixture, testNetDenominationToken, categoricalMarket, 2, 1, claimTradingProceeds.address, sender = tester.k2)
+    resolveMarket(kitchenSinkFixture, market, [0, numTicks])
+    resolveMarket(kitchenSinkFixture, categoricalMarket, [0, 0, numTicks])
+
+    initialLongHolderToken = testNetDenominationToken.balanceOf(tester.a1)
+    initialShortHolderToken = testNetDenominationToken.balanceOf(tester.a2)
+
+    tradingProceedsClaimedLog = {
+        'market': market.address,
+        'shareToken': market.getShareToken(YES),
+        'numPayoutTokens': expectedPayout,
+        'numShares': 1,
+        'sender': bytesToHexString(tester.a1),
+        'finalTokenBalance': initialLongHolderToken + expectedPayout
+    }
+
+    # each market's creator fees arrive in one transfer
+    with TokenDelta(testNetDenominationToken, expectedMarketCreatorFees, market.getMarketCreatorMailbox(), "Market creator fees not paid"):
+        with TokenDelta(testNetDenominationToken, expectedMarketCreatorFees, categoricalMarket.getMarketCreatorMailbox(), "Market creator fees not paid"):
+            with AssertLog(kitchenSinkFixture, "TradingProceedsClaimed", tradingProceedsClaimedLog):
+                assert claimTradingProceeds.batchClaimTradingProceeds([market.address, market.address, categoricalMarket.address, categoricalMarket.address], [tester.a1, tester.a2, tester.a1, tester.a2])
+
+    assert testNetDenominationToken.balanceOf(tester.a1) == initialLongHolderToken + 2 * expectedPayout
+    assert testNetDenominationToken.balanceOf(tester.a2) == initialShortHolderToken
+    for batchMarket in [market, categoricalMarket]:
+        assert kitchenSinkFixture.assertOpenInterest(batchMarket) == 0
+        for outcome in range(0, batchMarket.getNumberOfOutcomes()):
+            shareToken = kitchenSinkFixture.applySignature('ShareToken', batchMarket.getShareToken(outcome))
+            assert shareToken.balanceOf(tester.a1) == 0
+            assert shareToken.balanceOf(tester.a2) == 0
+
+    # claiming again is a no-op
+    assert claimTradingProceeds.batchClaimTradingProceeds([market.address, market.address, categoricalMarket.address, categoricalMarket.address], [tester.a1, tester.a2, tester.a1, tester.a2])
+    assert testNetDenominationToken.balanceOf(tester.a1) == initialLongHolderToken + 2 * expectedPayout
+
+def test_batch_redeem_pairs(kitchenSinkFixture, testNetDenominationToken, market, categoricalMarket):
+    claimTradingProceeds = kitchenSinkFixture.contracts['ClaimTradingProceeds']
+    acquireLongShares(kitchenSinkFixture, testNetDenominationToken, market, YES, 1, claimTradingProceeds.address, sender = tester.k1)
+    acquireLongShares(kitchenSinkFixture, testNetDenominationToken, categoricalMarket, 2, 1, claimTradingProceeds.address, sender = tester.k2)
+    acquireLongShares(kitchenSinkFixture, testNetDenominationToken, categoricalMarket, 2, 1, claimTradingProceeds.address, sender = tester.k3)
+    resolveMarket(kitchenSinkFixture, market, [0, market.getNumTicks()])
+    resolveMarket(kitchenSinkFixture, categoricalMarket, [0, 0, categoricalMarket.getNumTicks()])
+    categoricalShareToken = kitchenSinkFixture.getShareToken(categoricalMarket, 2)
+
+    # Only the listed pairs are claimed, not every holder in every market
+    assert claimTradingProceeds.batchClaimTradingProceeds([market.address, categoricalMarket.address], [tester.a1, tester.a2])
+    assert kitchenSinkFixture.getShareToken(market, YES).balanceOf(tester.a1) == 0
+    assert categoricalShareToken.balanceOf(tester.a2) == 0
+    assert categoricalShareToken.balanceOf(tester.a3) == 1
+    assert kitchenSinkFixture.assertOpenInterest(categoricalMarket) == categoricalMarket.getNumTicks()
+
+def test_batch_redeem_failure(kitchenSinkFixture, universe, testNetDenominationToken, market, categoricalMarket):
+    claimTradingProceeds = kitchenSinkFixture.contracts['ClaimTradingProceeds']
+    acquireLongShares(kitchenSinkFixture, testNetDenominationToken, market, YES, 1, claimTradingProceeds.address, sender = tester.k1)
+    resolveMarket(kitchenSinkFixture, market, [0, market.getNumTicks()])
+
+    # every market needs a share holder
+    with raises(TransactionFailed):
+        claimTradingProceeds.batchClaimTradingProceeds([market.address, market.address], [tester.a1])
+
+    # one unresolved market fails the whole batch
+    with raises(TransactionFailed):
+        claimTradingProceeds.batchClaimTradingProceeds([market.address, categoricalMarket.address], [tester.a1, tester.a1])
+
+    # so does a market that is not legitimate
+    with raises(TransactionFailed):
+        claimTradingProceeds.batchClaimTradingProceeds([market.address, universe.address], [tester.a1, tester.a1])
+
+    assert claimTradingProceeds.batchClaimTradingProceeds([market.address], [tester.a1])
@@ -36,6 +36,7 @@ def test_publicBuyCompleteSets(contractsFixture, universe, testNetDenominationTo
     assert testNetDenominationToken.balanceOf(market.address) == cost, "Increase in market's testNetDenominationToken should equal the cost to purchase the complete set"
     assert yesShareToken.totalSupply() == 10, "Increase in yes shares purchased for this market should be 10"
     assert noShareToken.totalSupply() == 10, "Increase in yes shares purchased for this market should be 10"
+    assert contractsFixture.assertOpenInterest(market) == cost
 
 def test_publicBuyCompleteSets_failure(contractsFixture, universe, testNetDenominationToken, market):
     completeSets = contractsFixture.contracts['CompleteSets']
@@ -52,6 +53,26 @@ def test_publicBuyCompleteSets_failure(contractsFixture, universe, testNetDenomi
     with raises(TransactionFailed):
         completeSets.publicBuyCompleteSets(tester.a1, amount, sender=tester.k1)
 
+def test_trustedCallerCompleteSets(contractsFixture, testNetDenominationToken, market):
+    completeSets = contractsFixture.contracts['CompleteSets']
+    yesShareToken = contractsFixture.applySignature('ShareToken', market.getShareToken(YES))
+    noShareToken = contractsFixture.applySignature('ShareToken', market.getShareToken(NO))
+    cost = 10 * market.getNumTicks()
+    testNetDenominationToken.depositEther(sender=tester.k1, value=cost)
+
+    # Whitelisted contracts share the public entry points' implementation
+    assert completeSets.buyCompleteSets(tester.a1, market.address, 10, sender=tester.k0)
+    assert yesShareToken.balanceOf(tester.a1) == 10
+    assert noShareToken.balanceOf(tester.a1) == 10
+    assert testNetDenominationToken.balanceOf(market.address) == cost
+    assert contractsFixture.assertOpenInterest(market) == cost
+
+    assert completeSets.sellCompleteSets(tester.a1, market.address, 10, sender=tester.k0)
+    assert yesShareToken.totalSupply() == 0
+    assert noShareToken.totalSupply() == 0
+    assert testNetDenominationToken.balanceOf(tester.a1) + testNetDenominationToken.balanceOf(market.getMarketCreatorMailbox()) == cost
+    assert contractsFixture.assertOpenInterest(market) == 0
+
 def test_publicSellCompleteSets(contractsFixture, universe, testNetDenominationToken, market):
     completeSets = contractsFixture.contracts['CompleteSets']
     yesShareToken = contractsFixture.applySignature('ShareToken', market.getShareToken(YES))
@@ -90,6 +111,7 @@ def test_publicSellCompleteSets(contractsFixture, universe, testNetDenominationT
     assert testNetDenominationToken.balanceOf(market.getMarketCreatorMailbox()) == 900
     assert testNetDenominationToken.balanceOf(tester.a1) == (initialTester1DenominationTokenBalance + 88200 + testNetDenominationToken.balanceOf(market.getMarketCreatorMailbox()))
     assert testNetDenominationToken.balanceOf(market.address) == 10000
+    assert contractsFixture.assertOpenInterest(market) == 10000
 
 def test_publicSellCompleteSets_failure(contractsFixture, universe, testNetDenominationToken, market):
     completeSets = contractsFixture.contracts['CompleteSets']
@@ -107,9 +129,105 @@ def test_publicSellCompleteSets_failure(contractsFixture, universe, testNetDenom
     with raises(TransactionFailed):
         completeSets.publicSellCompleteSets(market.address, 10 + 1, sender=tester.k1)
 
+def test_publicBatchCompleteSets(contractsFixture, universe, testNetDenominationToken, market, categoricalMarket, scalarMarket):
+    completeSets = contractsFixture.contracts['CompleteSets']
+    otherUniverse = contractsFixture.createUniverse()
+    otherMarket = contractsFixture.createReasonableYesNoMarket(otherUniverse, testNetDenominationToken)
+    markets = [market, categoricalMarket, otherMarket, scalarMarket]
+    amounts = [10, 5, 7, 3]
+    costs = [amount * batchMarket.getNumTicks() for (batchMarket, amount) in zip(markets, amounts)]
+    testNetDenominationToken.depositEther(sender=tester.k1, value=sum(costs))
+
+    # Events match the single market path, one per market in list order
+    completeSetsPurchasedLog = {
+        "universe": otherUniverse.address,
+        "market": otherMarket.address,
+        "account": bytesToHexString(tester.a1),
+        "numCompleteSets": 7
+    }
+    with AssertLog(contractsFixture, "CompleteSetsPurchased", completeSetsPurchasedLog, skip=2):
+        assert completeSets.publicBatchBuyCompleteSets([batchMarket.address for batchMarket in markets], amounts, sender=tester.k1)
+
+    assert testNetDenominationToken.balanceOf(tester.a1) == 0
+    assert testNetDenominationToken.balanceOf(completeSets.address) == 0
+    for (batchMarket, amount, cost) in zip(markets, amounts, costs):
+        assert testNetDenominationToken.balanceOf(batchMarket.address) == cost
+        assert contractsFixture.assertOpenInterest(batchMarket) == cost
+        for outcome in range(0, batchMarket.getNumberOfOutcomes()):
+            assert contractsFixture.getShareToken(batchMarket, outcome).balanceOf(tester.a1) == amount
+
+    completeSetsSoldLog = {
+        "universe": universe.address,
+        "market": scalarMarket.address,
+        "account": bytesToHexString(tester.a1),
+        "numCompleteSets": 2
+    }
+    with AssertLog(contractsFixture, "CompleteSetsSold", completeSetsSoldLog, skip=1):
+        assert completeSets.publicBatchSellCompleteSets([market.address, scalarMarket.address], [4, 2], sender=tester.k1)
+
+    assert contractsFixture.getShareToken(market, YES).balanceOf(tester.a1) == 6
+    assert contractsFixture.getShareToken(scalarMarket, YES).balanceOf(tester.a1) == 1
+    assert contractsFixture.assertOpenInterest(market) == 6 * market.getNumTicks()
+    assert contractsFixture.assertOpenInterest(scalarMarket) == scalarMarket.getNumTicks()
+    assert testNetDenominationToken.balanceOf(tester.a1) + testNetDenominationToken.balanceOf(market.getMarketCreatorMailbox()) + testNetDenominationToken.balanceOf(scalarMarket.getMarketCreatorMailbox()) == 4 * market.getNumTicks() + 2 * scalarMarket.getNumTicks()
+
+def test_publicBatchCompleteSets_failure(contractsFixture, testNetDenominationToken, market, categoricalMarket):
+    completeSets = contractsFixture.contracts['CompleteSets']
+    maliciousMarket = contractsFixture.upload('solidity_test_helpers/MaliciousMarket.sol', 'maliciousMarket', constructorArgs=[market.address])
+    testNetDenominationToken.depositEther(sender=tester.k1, value=10 * market.getNumTicks())
+
+    with raises(TransactionFailed):
+        completeSets.publicBatchBuyCompleteSets([market.address, categoricalMarket.address], [5], sender=tester.k1)
+    with raises(TransactionFailed):
+        completeSets.publicBatchBuyCompleteSets([market.address, categoricalMarket.address], [5, 0], sender=tester.k1)
+    with raises(TransactionFailed):
+        completeSets.publicBatchBuyCompleteSets([market.address, maliciousMarket.address], [5, 5], sender=tester.k1)
+    # The whole batch is paid for up front, so a batch the sender cannot afford leaves every market untouched
+    with raises(TransactionFailed):
+        completeSets.publicBatchBuyCompleteSets([market.address, categoricalMarket.address], [5, 6], sender=tester.k1)
+
+    assert completeSets.publicBatchBuyCompleteSets([market.address], [10], sender=tester.k1)
+    with raises(TransactionFailed):
+        completeSets.publicBatchSellCompleteSets([market.address], [4, 4], sender=tester.k1)
+    with raises(TransactionFailed):
+        completeSets.publicBatchSellCompleteSets([market.address, maliciousMarket.address], [4, 4], sender=tester.k1)
+    with raises(TransactionFailed):
+        completeSets.publicBatchSellCompleteSets([market.address, market.address], [6, 6], sender=tester.k1)
+    assert contractsFixture.assertOpenInterest(market) == 10 * market.getNumTicks()
+
 def test_maliciousMarket(contractsFixture, universe, testNetDenominationToken, market):
     completeSets = contractsFixture.contracts['CompleteSets']
     maliciousMarket = contractsFixture.upload('solidity_test_helpers/MaliciousMarket.sol', 'maliciousMarket', constructorArgs=[market.address])
 
     with raises(TransactionFailed):
         completeSets.publicBuyCompleteSets(maliciousMarket.address, 10**18, sender = tester.k1)
+
+def test_marketMintsAndBurnsCompleteSets(contractsFixture, testNetDenominationToken, market):
+    yesShareToken = contractsFixture.applySignature('ShareToken', market.getShareToken(YES))
+    noShareToken = contractsFixture.applySignature('ShareToken', market.getShareToken(NO))
+    testNetDenominationToken.depositEther(sender=tester.k0, value=3 * market.getNumTicks())
+    assert testNetDenominationToken.transfer(market.address, 3 * market.getNumTicks(), sender=tester.k0)
+
+    # Only whitelisted callers may go through the market, and the share tokens only accept mints from their own market
+    with raises(TransactionFailed):
+        market.mintCompleteSets(tester.a1, 3, sender=tester.k1)
+    with raises(TransactionFailed):
+        yesShareToken.createShares(tester.a1, 3, sender=tester.k1)
+    with raises(TransactionFailed):
+        yesShareToken.createShares(tester.a1, 3, sender=tester.k0)
+
+    assert market.mintCompleteSets(tester.a1, 3, sender=tester.k0)
+    assert yesShareToken.balanceOf(tester.a1) == 3
+    assert noShareToken.balanceOf(tester.a1) == 3
+    assert contractsFixture.assertOpenInterest(market) == 3 * market.getNumTicks()
+
+    # Minting more sets than the market holds collateral for fails the balance assertion
+    with raises(TransactionFailed):
+        market.mintCompleteSets(tester.a1, 1, sender=tester.k0)
+
+    with raises(TransactionFailed):
+        market.burnCompleteSets(tester.a1, 3, sender=tester.k1)
+    assert market.burnCompleteSets(tester.a1, 3, sender=tester.k0)
+    assert yesShareToken.totalSupply() == 0
+    assert noShareToken.totalSupply() == 0
+    assert market.getOpenInterest() == 0
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+from ethereum.tools import tester
+from ethereum.tools.tester import TransactionFailed
+from pytest import fixture as pytest_fixture, raises
+from utils import AssertLog, bytesToHexString, longToHexString, stringToBytes
+
+def test_shareLedger_market(contractsFixture, ledgerMarket):
+    shareLedger = contractsFixture.applySignature('ShareLedger', ledgerMarket.getShareLedger())
+
+    assert shareLedger.getTypeName() == stringToBytes("ShareLedger")
+    assert shareLedger.getMarket() == ledgerMarket.address
+    for outcome in range(0, 3):
+        shareToken = contractsFixture.applySignature('ShareLedgerToken', ledgerMarket.getShareToken(outcome))
+        assert shareLedger.getShareToken(outcome) == shareToken.address
+        assert shareToken.getShareLedger() == shareLedger.address
+        assert shareToken.getMarket() == ledgerMarket.address
+        assert shareToken.getOutcome() == outcome
+        assert shareToken.getTypeName() == stringToBytes("ShareToken")
+        assert ledgerMarket.isContainerForShareToken(shareToken.address)
+        assert contractsFixture.contracts['AugurLite'].isKnownShareToken(shareToken.address)
+
+def test_shareLedger_markets_are_optional(market):
+    assert market.getShareLedger() == longToHexString(0)
+
+def test_shareLedger_completeSets(contractsFixture, universe, testNetDenominationToken, ledgerMarket):
+    completeSets = contractsFixture.contracts['CompleteSets']
+    shareLedger = contractsFixture.applySignature('ShareLedger', ledgerMarket.getShareLedger())
+    shareTokens = [contractsFixture.applySignature('ShareLedgerToken', ledgerMarket.getShareToken(outcome)) for outcome in range(0, 3)]
+    cost = 10 * ledgerMarket.getNumTicks()
+    testNetDenominationToken.depositEther(sender=tester.k1, value=cost)
+
+    tokensMintedLog = {
+        "universe": universe.address,
+        "token": shareTokens[2].address,
+        "target": bytesToHexString(tester.a1),
+        "amount": 10,
+        "tokenType": 0,
+        "market": ledgerMarket.address
+    }
+    with AssertLog(contractsFixture, "TokensMinted", tokensMintedLog, skip=2):
+        assert completeSets.publicBuyCompleteSets(ledgerMarket.address, 10, sender=tester.k1)
+
+    assert shareLedger.balancesOf(tester.a1) == [10, 10, 10]
+    for shareToken in shareTokens:
+        assert shareToken.balanceOf(tester.a1) == 10
+        assert shareToken.totalSupply() == 10
+    assert contractsFixture.assertOpenInterest(ledgerMarket) == cost
+
+    tokensBurnedLog = {
+        "universe": universe.address,
+        "token": shareTokens[0].address,
+        "target": bytesToHexString(tester.a1),
+        "amount": 4,
+        "tokenType": 0,
+        "market": ledgerMarket.address
+    }
+    with AssertLog(contractsFixture, "TokensBurned", tokensBurnedLog):
+        assert completeSets.publicSellCompleteSets(ledgerMarket.address, 4, sender=tester.k1)
+
+    assert shareLedger.balancesOf(tester.a1) == [6, 6, 6]
+    assert contractsFixture.assertOpenInterest(ledgerMarket) == 6 * ledgerMarket.getNumTicks()
+
+def test_shareLedger_tokenTransfers(contractsFixture, testNetDenominationToken, ledgerMarket):
+    buyCompleteSets(contractsFixture, testNetDenominationToken, ledgerMarket, 10, tester.k1)
+    shareToken = contractsFixture.applySignature('ShareLedgerToken', ledgerMarket.getShareToken(1))
+
+    transferLog = {
+        "from": bytesToHexString(tester.a1),
+        "to": bytesToHexString(tester.a2),
+        "value": 3
+    }
+    tokensTransferredLog = {
+        "token": shareToken.address,
+        "from": bytesToHexString(tester.a1),
+        "to": bytesToHexString(tester.a2),
+        "value": 3,
+        "market": ledgerMarket.address
+    }
+    with AssertLog(contractsFixture, "Transfer", transferLog, contract=shareToken):
+        with AssertLog(contractsFixture, "TokensTransferred", tokensTransferredLog):
+            assert shareToken.transfer(tester.a2, 3, sender=tester.k1)
+    assert shareToken.balanceOf(tester.a1) == 7
+    assert shareToken.balanceOf(tester.a2) == 3
+
+    with raises(TransactionFailed):
+        shareToken.transferFrom(tester.a1, tester.a3, 2, sender=tester.k3)
+    assert shareToken.approve(tester.a3, 2, sender=tester.k1)
+    assert shareToken.allowance(tester.a1, tester.a3) == 2
+    assert shareToken.transferFrom(tester.a1, tester.a3, 2, sender=tester.k3)
+    assert shareToken.allowance(tester.a1, tester.a3) == 0
+    assert shareToken.balanceOf(tester.a3) == 2
+
+    with raises(TransactionFailed):
+        shareToken.transfer(tester.a2, 6, sender=tester.k1)
+
+    # Other outcomes are untouched
+    assert contractsFixture.applySignature('ShareLedgerToken', ledgerMarket.getShareToken(0)).balanceOf(tester.a1) == 10
+
+def test_shareLedger_permissions(contractsFixture, testNetDenominationToken, ledgerMarket):
+    shareLedger = contractsFixture.applySignature('ShareLedger', ledgerMarket.getShareLedger())
+    shareToken = contractsFixture.applySignature('ShareLedgerToken', ledgerMarket.getShareToken(0))
+
+    # Balances only change through the market or the outcome's own share token
+    with raises(TransactionFailed):
+        shareLedger.mintCompleteSets(tester.a1, 1, sender=tester.k0)
+    with raises(TransactionFailed):
+        shareLedger.createShares(0, tester.a1, 1, sender=tester.k0)
+    with raises(TransactionFailed):
+        shareLedger.transfer(0, tester.a1, tester.a2, 0, sender=tester.k0)
+    with raises(TransactionFailed):
+        shareToken.createShares(tester.a1, 1, sender=tester.k1)
+    with raises(TransactionFailed):
+        shareToken.createShares(tester.a1, 1, sender=tester.k0)
+    with raises(TransactionFailed):
+        shareToken.initialize(ledgerMarket.address, 1)
+    with raises(TransactionFailed):
+        contractsFixture.contracts['AugurLite'].logShareLedgerMinted(ledgerMarket.getUniverse(), [shareToken.address], tester.a1, 1)
+
+    # Whitelisted callers burn a single outcome through the market, which hands it to the outcome's share token
+    buyCompleteSets(contractsFixture, testNetDenominationToken, ledgerMarket, 7, tester.k1)
+    with raises(TransactionFailed):
+        shareToken.destroyShares(tester.a1, 7, sender=tester.k0)
+    assert ledgerMarket.destroyShares(0, tester.a1, 7, sender=tester.k0)
+    assert shareLedger.balancesOf(tester.a1) == [0, 7, 7]
+    assert shareToken.totalSupply() == 0
+
+def test_shareLedger_claimTradingProceeds(contractsFixture, testNetDenominationToken, ledgerMarket):
+    claimTradingProceeds = contractsFixture.contracts['ClaimTradingProceeds']
+    buyCompleteSets(contractsFixture, testNetDenominationToken, ledgerMarket, 10, tester.k1)
+    contractsFixture.contracts["Time"].setTimestamp(ledgerMarket.getEndTime() + 1)
+    ledgerMarket.resolve([0, 0, ledgerMarket.getNumTicks()], False)
+    contractsFixture.contracts["Time"].setTimestamp(ledgerMarket.getResolutionTime() + 1)
+    initialBalance = testNetDenominationToken.balanceOf(tester.a1)
+
+    assert claimTradingProceeds.claimTradingProceeds(ledgerMarket.address, tester.a1)
+
+    shareLedger = contractsFixture.applySignature('ShareLedger', ledgerMarket.getShareLedger())
+    assert shareLedger.balancesOf(tester.a1) == [0, 0, 0]
+    assert testNetDenominationToken.balanceOf(tester.a1) > initialBalance
+    assert contractsFixture.assertOpenInterest(ledgerMarket) == 0
+
+def buyCompleteSets(fixture, denominationToken, market, amount, sender):
+    denominationToken.depositEther(sender=sender, value=amount * market.getNumTicks())
+    assert fixture.contracts['CompleteSets'].publicBuyCompleteSets(market.address, amount, sender=sender)
+
+@pytest_fixture
+def ledgerMarket(contractsFixture, universe, testNetDenominationToken):
+    contractsFixture.useShareLedger()
+    return contractsFixture.createReasonableCategoricalMarket(universe, 3, testNetDenominationToken)
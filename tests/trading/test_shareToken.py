@@ -14,36 +14,42 @@ def test_init(contractsFixture, market):
 
     assert shareToken.getTypeName() == stringToBytes("ShareToken")
 
-def test_createShares(contractsFixture, market):
+def test_createShares(contractsFixture, testNetDenominationToken, market):
     shareToken = contractsFixture.applySignature('ShareToken', market.getShareToken())
     initialTotalSupply = shareToken.totalSupply()
     initialBalance = shareToken.balanceOf(tester.a1)
 
+    # Shares are only minted by their market, so not even whitelisted callers can skip its open interest accounting
     with raises(TransactionFailed):
         shareToken.createShares(tester.a1, 7, sender=tester.k1)
+    with raises(TransactionFailed):
+        shareToken.createShares(tester.a1, 7, sender=tester.k0)
 
-    # NOTE: only works because controller is in dev mode and k0 is whitelisted
-    assert shareToken.createShares(tester.a1, 7, sender=tester.k0) == 1, "Create share tokens for address 1"
+    mintShares(testNetDenominationToken, market, tester.a1, 7)
     assert shareToken.totalSupply() - initialTotalSupply == 7, "Total supply increase should equal the number of tokens created"
     assert shareToken.balanceOf(tester.a1) - initialBalance == 7, "Address 1 token balance increase should equal the number of tokens created"
 
-def test_destroyShares(contractsFixture, market):
+def test_destroyShares(contractsFixture, testNetDenominationToken, market):
     shareToken = contractsFixture.applySignature('ShareToken', market.getShareToken())
-    shareToken.createShares(tester.a1, 7, sender=tester.k0)
+    mintShares(testNetDenominationToken, market, tester.a1, 7)
     initialTotalSupply = shareToken.totalSupply()
     initialBalance = shareToken.balanceOf(tester.a1)
 
     with raises(TransactionFailed):
-        shareToken.destroyShares(tester.a0, 7, sender=tester.k1)
+        shareToken.destroyShares(tester.a1, 7, sender=tester.k1)
+    with raises(TransactionFailed):
+        shareToken.destroyShares(tester.a1, 7, sender=tester.k0)
+    with raises(TransactionFailed):
+        market.destroyShares(0, tester.a1, 7, sender=tester.k1)
 
     # NOTE: only works because controller is in dev mode and k0 is whitelisted
-    assert shareToken.destroyShares(tester.a1, 7, sender=tester.k0) == 1, "Destroy share tokens owned by address 1"
+    assert market.destroyShares(0, tester.a1, 7, sender=tester.k0) == 1, "Destroy share tokens owned by address 1"
     assert initialTotalSupply - shareToken.totalSupply() == 7, "Total supply decrease should equal the number of tokens destroyed"
     assert initialBalance - shareToken.balanceOf(tester.a1) == 7, "Address 1 token balance decrease should equal the number of tokens destroyed"
 
-def test_transfer(contractsFixture, market):
+def test_transfer(contractsFixture, testNetDenominationToken, market):
     shareToken = contractsFixture.applySignature('ShareToken', market.getShareToken())
-    shareToken.createShares(tester.a0, 7, sender=tester.k0)
+    mintShares(testNetDenominationToken, market, tester.a0, 7)
     initialTotalSupply = shareToken.totalSupply()
     initialBalance0 = shareToken.balanceOf(tester.a0)
     initialBalance1 = shareToken.balanceOf(tester.a1)
@@ -82,9 +88,9 @@ def test_transfer(contractsFixture, market):
     assert(initialBalance1 + 5 == afterTransferBalance1), "Increase in address 2's balance should equal amount transferred"
     assert(shareToken.totalSupply() == initialTotalSupply), "Total supply should be unchanged"
 
-def test_approve(contractsFixture, market):
+def test_approve(contractsFixture, testNetDenominationToken, market):
     shareToken = contractsFixture.applySignature('ShareToken', market.getShareToken())
-    shareToken.createShares(tester.a0, 7, sender=tester.k0)
+    mintShares(testNetDenominationToken, market, tester.a0, 7)
 
     assert(shareToken.allowance(tester.a0, tester.a1) == 0), "initial allowance is 0"
 
@@ -118,9 +124,15 @@ def test_approve(contractsFixture, market):
         with AssertLog(contractsFixture, "TokensTransferred", tokensTransferredLog):
             assert shareToken.transferFrom(tester.a0, tester.a1, 7, sender=tester.k1)
 
-def test_transferFrom(contractsFixture, market):
+def test_transferFrom(contractsFixture, testNetDenominationToken, market):
     shareToken = contractsFixture.applySignature('ShareToken', market.getShareToken())
-    shareToken.createShares(tester.a1, 7, sender=tester.k0)
+    mintShares(testNetDenominationToken, market, tester.a1, 7)
 
     with raises(TransactionFailed):
         shareToken.transferFrom(tester.a0, tester.a1, 7, sender=tester.k1)
+
+def mintShares(testNetDenominationToken, market, owner, amount):
+    # NOTE: only works because controller is in dev mode and k0 is whitelisted
+    testNetDenominationToken.depositEther(sender=tester.k0, value=amount * market.getNumTicks())
+    assert testNetDenominationToken.transfer(market.address, amount * market.getNumTicks(), sender=tester.k0)
+    assert market.mintCompleteSets(owner, amount, sender=tester.k0)
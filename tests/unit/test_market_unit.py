@@ -1,6 +1,6 @@
 from ethereum.tools import tester
 from utils import longToHexString, stringToBytes, bytesToHexString, twentyZeros, thirtyTwoZeros, longTo32Bytes
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 from ethereum.tools.tester import TransactionFailed
 
 numTicks = 10 ** 10
@@ -12,25 +12,25 @@ def test_market_creation(localFixture, mockUniverse, mockTestNetDenominationToke
     market.setController(localFixture.contracts["Controller"].address)
 
     with raises(TransactionFailed, message="outcomes has to be greater than 1"):
-        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, tester.a1, 1, numTicks)
+        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, tester.a1, 1, numTicks, False, False)
 
     with raises(TransactionFailed, message="outcomes has to be less than 9"):
-        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, tester.a1, 9, numTicks)
+        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, tester.a1, 9, numTicks, False, False)
 
     with raises(TransactionFailed, message="feeDivisor cannot be between 0 and 2"):
-        market.initialize(mockUniverse.address, endTime, minFeeDivisor - 1, mockTestNetDenominationToken.address, tester.a1, tester.a1, 5, numTicks)
+        market.initialize(mockUniverse.address, endTime, minFeeDivisor - 1, mockTestNetDenominationToken.address, tester.a1, tester.a1, 5, numTicks, False, False)
 
     with raises(TransactionFailed, message="creator address can not be 0"):
-        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, longToHexString(0), tester.a1, 5, numTicks)
+        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, longToHexString(0), tester.a1, 5, numTicks, False, False)
 
     with raises(TransactionFailed, message="oracle address can not be 0"):
-        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, longToHexString(0), 5, numTicks)
+        market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, longToHexString(0), 5, numTicks, False, False)
 
     with raises(TransactionFailed, message="denomination token cannot be different from universe denomination token"):
-        market.initialize(mockUniverse.address, endTime, feeDivisor, "0x0000000000000000000000000000000000000000", tester.a1, longToHexString(0), 5, numTicks)
+        market.initialize(mockUniverse.address, endTime, feeDivisor, "0x0000000000000000000000000000000000000000", tester.a1, longToHexString(0), 5, numTicks, False, False)
 
     mockShareTokenFactory.resetCreateShareToken()
-    assert market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, tester.a1, 5, numTicks)
+    assert market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, tester.a1, 5, numTicks, False, False)
     assert mockShareTokenFactory.getCreateShareTokenMarketValue() == market.address
     assert mockShareTokenFactory.getCreateShareTokenOutcomeValue() == 5 - 1 # mock logs the last outcome
     assert market.getTypeName() == stringToBytes("Market")
@@ -62,6 +62,99 @@ def test_resolve(localFixture, initializedMarket, mockUniverse):
     assert initializedMarket.resolve([initializedMarket.getNumTicks(), 0, 0, 0, 0], False, sender=tester.k1)
     assert initializedMarket.isResolved()
 
+@mark.parametrize('endTime, feeDivisor, numOutcomes, marketNumTicks, deferAssets, useShareLedger', [
+    (None, 0, 2, 2, False, False),
+    (None, 2, 5, 10 ** 10, False, False),
+    (2 ** 64 - 2, 2 ** 128 - 1, 8, 2 ** 128 - 1, False, False),
+    (2 ** 64 - 2, 2 ** 128 - 1, 8, 2 ** 128 - 1, True, False),
+    (2 ** 64 - 2, 2 ** 128 - 1, 8, 2 ** 128 - 1, False, True),
+    (None, 2, 5, 10 ** 10, True, True),
+])
+def test_packed_storage_round_trip(localFixture, mockUniverse, mockTestNetDenominationToken, mockShareTokenFactory, endTime, feeDivisor, numOutcomes, marketNumTicks, deferAssets, useShareLedger):
+    endTime = endTime if endTime else localFixture.contracts["Time"].getTimestamp() + 259200
+    market = localFixture.upload('../source/contracts/Market.sol', 'packedMarket%i' % numOutcomes)
+    market.setController(localFixture.contracts["Controller"].address)
+    mockShareTokenFactory.resetCreateShareToken()
+    assert market.initialize(mockUniverse.address, endTime, feeDivisor, mockTestNetDenominationToken.address, tester.a1, tester.a2, numOutcomes, marketNumTicks, deferAssets, useShareLedger)
+
+    # Every getter gives back exactly what the unpacked layout stored
+    assert market.getUniverse() == mockUniverse.address
+    assert market.getEndTime() == endTime
+    assert market.getNumberOfOutcomes() == numOutcomes
+    assert market.getDenominationToken() == mockTestNetDenominationToken.address
+    assert market.getNumTicks() == marketNumTicks
+    assert market.getMarketCreatorSettlementFeeDivisor() == feeDivisor
+    assert market.getOracle() == bytesToHexString(tester.a1)
+    assert market.getOwner() == bytesToHexString(tester.a2)
+    assert market.getResolutionTime() == 0
+    assert not market.isResolved()
+    shareTokens = [market.getShareToken(outcome) for outcome in range(0, numOutcomes)]
+    if deferAssets:
+        assert market.getMarketCreatorMailbox() == longToHexString(0)
+        assert shareTokens == [longToHexString(0)] * numOutcomes
+        assert market.getShareLedger() == longToHexString(0)
+    elif useShareLedger:
+        assert market.getMarketCreatorMailbox()
+        shareLedger = localFixture.applySignature('ShareLedger', market.getShareLedger())
+        assert shareTokens == [shareLedger.getShareToken(outcome) for outcome in range(0, numOutcomes)]
+        assert mockShareTokenFactory.getCreateShareTokenCounter() == 0
+    else:
+        assert market.getMarketCreatorMailbox()
+        assert market.getShareLedger() == longToHexString(0)
+        assert shareTokens == [mockShareTokenFactory.getCreateShareToken(outcome) for outcome in range(0, numOutcomes)]
+
+    # Payout numerators share slots two by two, so use a distinct value for every outcome and put the remainder in the last one
+    payoutNumerators = [outcome for outcome in range(0, numOutcomes - 1)]
+    payoutNumerators.append(marketNumTicks - sum(payoutNumerators))
+    localFixture.contracts["Time"].setTimestamp(endTime + 1)
+    assert market.resolve(payoutNumerators, False, sender=tester.k1)
+    assert market.getResolutionTime() == endTime + 1
+    assert market.isResolved()
+    assert not market.isInvalid()
+    assert [market.getPayoutNumerator(outcome) for outcome in range(0, numOutcomes)] == payoutNumerators
+    with raises(TransactionFailed):
+        market.getPayoutNumerator(numOutcomes)
+
+    # The packed fields didn't disturb each other
+    assert market.getEndTime() == endTime
+    assert market.getOracle() == bytesToHexString(tester.a1)
+    assert market.getNumTicks() == marketNumTicks
+    assert market.getMarketCreatorSettlementFeeDivisor() == feeDivisor
+
+def test_packed_storage_invalid_resolution(localFixture, initializedMarket):
+    localFixture.contracts["Time"].setTimestamp(initializedMarket.getEndTime() + 1)
+    invalidPayout = numTicks / 5
+    assert initializedMarket.resolve([invalidPayout] * 5, True, sender=tester.k1)
+    assert initializedMarket.isInvalid()
+    assert initializedMarket.getOracle() == bytesToHexString(tester.a1)
+    assert [initializedMarket.getPayoutNumerator(outcome) for outcome in range(0, 5)] == [invalidPayout] * 5
+
+@mark.parametrize('deferAssets, useShareLedger', [
+    (False, False),
+    (True, False),
+    (False, True),
+])
+def test_packed_storage_bounds(localFixture, mockUniverse, mockTestNetDenominationToken, mockShareTokenFactory, deferAssets, useShareLedger):
+    endTime = localFixture.contracts["Time"].getTimestamp() + 259200
+    market = localFixture.upload('../source/contracts/Market.sol', 'boundedMarket')
+    market.setController(localFixture.contracts["Controller"].address)
+
+    # Values that would not fit the packed layout are rejected rather than truncated, however the market creates its assets
+    with raises(TransactionFailed):
+        market.initialize(mockUniverse.address, 2 ** 64, 100, mockTestNetDenominationToken.address, tester.a1, tester.a1, 2, numTicks, deferAssets, useShareLedger)
+    with raises(TransactionFailed):
+        market.initialize(mockUniverse.address, endTime, 100, mockTestNetDenominationToken.address, tester.a1, tester.a1, 2, 2 ** 128, deferAssets, useShareLedger)
+    with raises(TransactionFailed):
+        market.initialize(mockUniverse.address, endTime, 2 ** 128, mockTestNetDenominationToken.address, tester.a1, tester.a1, 2, numTicks, deferAssets, useShareLedger)
+
+    # The largest values that fit are kept as they are
+    assert market.initialize(mockUniverse.address, 2 ** 64 - 1, 2 ** 128 - 1, mockTestNetDenominationToken.address, tester.a1, tester.a1, 2, 2 ** 128 - 1, deferAssets, useShareLedger)
+    assert market.getEndTime() == 2 ** 64 - 1
+    assert market.getNumTicks() == 2 ** 128 - 1
+    assert market.getMarketCreatorSettlementFeeDivisor() == 2 ** 128 - 1
+    assert (market.getShareToken(0) == longToHexString(0)) == deferAssets
+    assert (market.getShareLedger() != longToHexString(0)) == useShareLedger
+
 def test_approve_spenders(localFixture, initializedMarket, mockTestNetDenominationToken, mockShareTokenFactory):
     approvalAmount = 2**256-1
     # approveSpender was called as part of market initialization
@@ -97,7 +190,7 @@ def localSnapshot(fixture, augurInitializedWithMocksSnapshot):
     endTime = fixture.contracts["Time"].getTimestamp() + 259200
     market.setController(fixture.contracts["Controller"].address)
 
-    assert market.initialize(mockUniverse.address, endTime, 16, mockTestNetDenominationToken.address, tester.a1, tester.a2, 5, numTicks)
+    assert market.initialize(mockUniverse.address, endTime, 16, mockTestNetDenominationToken.address, tester.a1, tester.a2, 5, numTicks, False, False)
 
     return fixture.createSnapshot()
 
@@ -44,6 +44,7 @@ def test_universe_create_market(localFixture, chain, populatedUniverse, mockMark
     assert mockMarketFactory.getCreateMarketUniverseValue() == populatedUniverse.address
     assert populatedUniverse.isContainerForMarket(mockMarket.address)
     assert mockAugurLite.logMarketCreatedCalled() == True
+    assert mockAugurLite.registerShareTokensCalled() == True
     assert newMarket == mockMarket.address
 
 @fixture(scope="module")
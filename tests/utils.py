@@ -98,6 +98,20 @@ class PrintGasUsed():
         else:
             print "GAS USED WITH %s : %i" % (self.action, gasUsed)
 
+class GasBenchmark():
+
+    def __init__(self, fixture, action):
+        self.fixture = fixture
+        self.action = action
+
+    def __enter__(self):
+        self.startingGas = self.fixture.chain.head_state.gas_used
+
+    def __exit__(self, *args):
+        if args[1]:
+            raise args[1]
+        self.fixture.gasBaselines.check(self.action, self.fixture.chain.head_state.gas_used - self.startingGas)
+
 class AssertLog():
 
     def __init__(self, fixture, eventName, data, skip=0, contract=None):